@@ -0,0 +1,63 @@
+"""
+Benchmark the multi-symbol comparison chart and performance heatmap.
+
+Builds a universe of synthetic backtests (three years of daily values with
+staggered start dates) and times the static comparison chart, which switches
+to fan charts, a risk/return density and a clustered heatmap above
+DETAIL_SYMBOL_LIMIT symbols, and the interactive performance heatmap.
+
+Usage:
+    python -m benchmarks.bench_comparison_views --symbols 100 500 2000
+"""
+import argparse
+import os
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+
+from src.rendering import set_render_mode
+from src.visualizer import AdvancedVisualizer
+from src.interactive_viz import InteractiveVisualizer
+
+
+def synthetic_universe(symbols: int, bars: int = 756) -> dict:
+    rng = np.random.default_rng(0)
+    dates = pd.bdate_range('2020-01-01', periods=bars)
+    results = {}
+    for i in range(symbols):
+        symbol_dates = dates[rng.integers(0, 100):]
+        values = 100_000 * np.exp(rng.normal(0.0003, 0.015, len(symbol_dates)).cumsum())
+        results[f'S{i:04d}'] = {
+            'data': pd.DataFrame({'Date': symbol_dates, 'Portfolio_Value': values}),
+            'metrics': {'Total Return (%)': (values[-1] / values[0] - 1) * 100,
+                        'Annual Return (%)': rng.normal(5, 10), 'Sharpe Ratio': rng.normal(0.5, 0.5),
+                        'Max Drawdown (%)': -abs(rng.normal(20, 8))},
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--symbols', type=int, nargs='+', default=[100, 500, 2000])
+    parser.add_argument('--dpi', type=int, default=100)
+    args = parser.parse_args()
+
+    set_render_mode('headless')
+    with tempfile.TemporaryDirectory() as directory:
+        print(f"{'symbols':>8} {'comparison (s)':>15} {'heatmap (s)':>12}")
+        for symbols in args.symbols:
+            results = synthetic_universe(symbols)
+
+            start = time.perf_counter()
+            AdvancedVisualizer(dpi=args.dpi).create_comparison_chart(results, os.path.join(directory, 'comparison.png'))
+            comparison = time.perf_counter() - start
+
+            start = time.perf_counter()
+            InteractiveVisualizer().create_performance_heatmap(results, os.path.join(directory, 'heatmap.html'))
+            heatmap = time.perf_counter() - start
+            print(f"{symbols:>8} {comparison:>15.2f} {heatmap:>12.2f}")
+
+
+if __name__ == '__main__':
+    main()
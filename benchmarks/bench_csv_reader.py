@@ -0,0 +1,78 @@
+"""
+Benchmark the streaming CSV reader on a large synthetic minute-bar file.
+
+The file is written in blocks (never held in memory), then streamed back
+with DataLoader.read_csv_chunks. Throughput and peak RSS are reported.
+
+Usage:
+    python -m benchmarks.bench_csv_reader --size-mb 2048 --chunksize 1000000
+"""
+import argparse
+import os
+import resource
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+
+from src.data_loader import DataLoader
+
+ROWS_PER_BLOCK = 500_000
+
+
+def write_synthetic_csv(path: str, size_mb: float) -> int:
+    """Append blocks of random minute bars until the file reaches ``size_mb``"""
+    rng = np.random.default_rng(0)
+    start = pd.Timestamp('2000-01-03 09:30')
+    rows = 0
+
+    with open(path, 'w') as f:
+        f.write('Date,Open,High,Low,Close,Volume\n')
+        while f.tell() < size_mb * 1024 ** 2:
+            dates = pd.date_range(start, periods=ROWS_PER_BLOCK, freq='min')
+            close = 100 + np.cumsum(rng.normal(0, 0.05, ROWS_PER_BLOCK))
+            block = pd.DataFrame({
+                'Date': np.char.add(dates.strftime('%Y-%m-%d %H:%M:%S').to_numpy(dtype=str), '-05:00'),
+                'Open': close + rng.normal(0, 0.01, ROWS_PER_BLOCK),
+                'High': close + 0.05,
+                'Low': close - 0.05,
+                'Close': close,
+                'Volume': rng.integers(100, 10_000, ROWS_PER_BLOCK),
+            })
+            block.to_csv(f, header=False, index=False, float_format='%.4f')
+            start = dates[-1] + pd.Timedelta(minutes=1)
+            rows += ROWS_PER_BLOCK
+
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--size-mb', type=float, default=2048)
+    parser.add_argument('--chunksize', type=int, default=1_000_000)
+    parser.add_argument('--keep', help='Write the synthetic file here instead of a temporary directory')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        path = args.keep or os.path.join(root, 'bars.csv')
+
+        start = time.perf_counter()
+        rows = write_synthetic_csv(path, args.size_mb)
+        size_mb = os.path.getsize(path) / 1024 ** 2
+        print(f"Wrote {rows:,} rows / {size_mb:,.0f} MB in {time.perf_counter() - start:.1f}s")
+
+        start = time.perf_counter()
+        streamed = 0
+        for chunk in DataLoader.read_csv_chunks(path, chunksize=args.chunksize,
+                                                date_format='%Y-%m-%d %H:%M:%S%z'):
+            streamed += len(chunk)
+        elapsed = time.perf_counter() - start
+
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"Streamed {streamed:,} rows in {elapsed:.1f}s "
+          f"({streamed / elapsed:,.0f} rows/s, {size_mb / elapsed:,.0f} MB/s)")
+    print(f"Peak RSS: {peak_mb:,.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Benchmark dashboard renders per second: rebuilt figures vs figure templates.
+
+Renders the comprehensive dashboard and the risk analysis for a batch of
+synthetic symbols with the headless backend, once building every figure
+from scratch and once refilling the per-process templates of
+``src.figure_templates``. Both write PNGs to a temporary directory, so the
+time includes rasterization and encoding as in a real batch run.
+
+Usage:
+    python -m benchmarks.bench_figure_templates --symbols 20 --bars 1000 --dpi 100
+"""
+import argparse
+import os
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+
+from src.rendering import set_render_mode
+from src.figure_templates import clear_templates
+from src.risk_analyzer import RiskAnalyzer
+from src.risk_metrics import compute_risk_analysis
+from src.visualizer import AdvancedVisualizer
+
+
+def synthetic_results(bars: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(rng.normal(0, 0.01, bars).cumsum())
+    signal = np.zeros(bars, dtype=int)
+    signal[rng.choice(bars, 20, replace=False)] = rng.choice([1, -1], 20)
+    return pd.DataFrame({
+        'Date': pd.bdate_range('2015-01-01', periods=bars),
+        'Close': close,
+        'SMA_Short': pd.Series(close).rolling(20).mean(),
+        'SMA_Long': pd.Series(close).rolling(50).mean(),
+        'Signal': signal,
+        'Portfolio_Value': 100_000 * close / close[0],
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--symbols', type=int, default=20)
+    parser.add_argument('--bars', type=int, default=1000)
+    parser.add_argument('--dpi', type=int, default=100)
+    args = parser.parse_args()
+
+    set_render_mode('headless')
+    batch = [(f'SYM{i}', synthetic_results(args.bars, i)) for i in range(args.symbols)]
+    analyses = [compute_risk_analysis(results) for _, results in batch]
+    metrics = {'Total Return (%)': 0.0, 'Annual Return (%)': 0.0, 'Sharpe Ratio': 0.0,
+               'Max Drawdown (%)': 0.0, 'Final Portfolio Value': 0.0}
+
+    with tempfile.TemporaryDirectory() as directory:
+        print(f"{'mode':>10} {'dashboards/s':>13} {'risk/s':>8}")
+        for template in (False, True):
+            visualizer = AdvancedVisualizer(dpi=args.dpi, template=template)
+            analyzer = RiskAnalyzer(template=template)
+
+            start = time.perf_counter()
+            for symbol, results in batch:
+                visualizer.create_comprehensive_dashboard(results, symbol, metrics,
+                                                          os.path.join(directory, f'{symbol}_dashboard.png'))
+            dashboards = args.symbols / (time.perf_counter() - start)
+
+            start = time.perf_counter()
+            for (symbol, _), analysis in zip(batch, analyses):
+                analyzer.plot_risk_analysis(analysis, symbol, os.path.join(directory, f'{symbol}_risk.png'))
+            risk = args.symbols / (time.perf_counter() - start)
+
+            print(f"{'template' if template else 'rebuild':>10} {dashboards:>13.2f} {risk:>8.2f}")
+            clear_templates()
+
+
+if __name__ == '__main__':
+    main()
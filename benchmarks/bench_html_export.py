@@ -0,0 +1,94 @@
+"""
+Benchmark standalone vs compact interactive HTML on a 1M-point dashboard.
+
+Builds the interactive dashboard on a long minute-level backtest with
+downsampling disabled, then writes it in both export modes. Reports the
+file size, the size of a directory of dashboards (where compact files share
+one plotly.js bundle), the write time, and the time to decode the figure
+payload: a JSON parse of the numbers for standalone files, a JSON parse plus
+base64 decode of the typed-array blocks for compact ones. Decoding is what
+a browser must do before the first draw, so it stands in for load time.
+
+Usage:
+    python -m benchmarks.bench_html_export --bars 1000000 --dashboards 20
+"""
+import argparse
+import base64
+import json
+import os
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+import plotly.io as pio
+
+from src.config import config
+from src.html_export import PLOTLYJS_BUNDLE, compact_figure, write_html
+from src.interactive_viz import InteractiveVisualizer
+
+
+def synthetic_results(bars: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    close = 100 * np.exp(rng.normal(0, 0.0005, bars).cumsum())
+    signal = np.zeros(bars, dtype=int)
+    signal[rng.choice(bars, 200, replace=False)] = rng.choice([1, -1], 200)
+    return pd.DataFrame({
+        'Date': pd.date_range('2015-01-01', periods=bars, freq='min'),
+        'Close': close,
+        'Volume': rng.integers(100, 10_000, bars),
+        'SMA_Short': pd.Series(close).rolling(20).mean(),
+        'SMA_Long': pd.Series(close).rolling(50).mean(),
+        'Signal': signal,
+        'Portfolio_Value': 100_000 * close / close[0],
+    })
+
+
+def decode_time(payload: str) -> float:
+    """Time to parse a figure JSON payload and decode its binary blocks"""
+    start = time.perf_counter()
+    figure = json.loads(payload)
+    for trace in figure['data']:
+        for value in trace.values():
+            if isinstance(value, dict) and 'bdata' in value:
+                np.frombuffer(base64.b64decode(value['bdata']), dtype=value['dtype'])
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--bars', type=int, default=1_000_000)
+    parser.add_argument('--dashboards', type=int, default=20)
+    args = parser.parse_args()
+
+    config.update('plotting', 'max_plot_points', args.bars)
+    results = synthetic_results(args.bars)
+    metrics = {'Total Return (%)': 0.0, 'Annual Return (%)': 0.0, 'Sharpe Ratio': 0.0,
+               'Max Drawdown (%)': 0.0, 'Final Portfolio Value': 0.0}
+    fig = InteractiveVisualizer().build_interactive_dashboard(results, 'BENCH', metrics)
+
+    # Plotly already base64-encodes plain float arrays; standalone JSON is
+    # measured from the list form to show the cost of JSON-encoded floats
+    payloads = {
+        'standalone': json.dumps(fig.to_plotly_json(), default=lambda v: v.tolist() if hasattr(v, 'tolist') else str(v)),
+        'compact': pio.to_json(compact_figure(fig), validate=False),
+    }
+
+    with tempfile.TemporaryDirectory() as directory:
+        print(f"{'mode':>12} {'file (MB)':>10} {f'{args.dashboards} files (MB)':>16} "
+              f"{'write (s)':>10} {'decode (s)':>11}")
+        for mode in ('standalone', 'compact'):
+            path = os.path.join(directory, mode, 'dashboard.html')
+            start = time.perf_counter()
+            write_html(fig, path, mode=mode)
+            write_time = time.perf_counter() - start
+
+            size = os.path.getsize(path)
+            bundle = os.path.join(directory, mode, PLOTLYJS_BUNDLE)
+            shared = os.path.getsize(bundle) if os.path.exists(bundle) else 0
+            total = (size * args.dashboards + shared) / 1e6
+            print(f"{mode:>12} {(size + shared) / 1e6:>10.1f} {total:>16.1f} "
+                  f"{write_time:>10.2f} {decode_time(payloads[mode]):>11.3f}")
+
+
+if __name__ == '__main__':
+    main()
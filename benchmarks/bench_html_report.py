@@ -0,0 +1,81 @@
+"""
+Benchmark per-symbol interactive HTML files vs one multi-symbol report.
+
+For a batch of synthetic daily backtests, writes what ``run_multiple_symbols``
+produces today (one standalone interactive dashboard per symbol plus the
+performance heatmap) and the single ``write_report`` file, and reports the
+disk usage and generation time of both.
+
+Usage:
+    python -m benchmarks.bench_html_report --symbols 10 50 200 --bars 1000
+"""
+import argparse
+import os
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+
+from src.rendering import set_render_mode
+from src.interactive_viz import InteractiveVisualizer
+from src.html_report import write_report
+
+
+def synthetic_results(symbols: int, bars: int) -> dict:
+    rng = np.random.default_rng(0)
+    results = {}
+    for i in range(symbols):
+        close = 100 * np.exp(rng.normal(0, 0.01, bars).cumsum())
+        signal = np.zeros(bars, dtype=int)
+        signal[rng.choice(bars, 20, replace=False)] = rng.choice([1, -1], 20)
+        results[f'S{i:04d}'] = {
+            'data': pd.DataFrame({
+                'Date': pd.bdate_range('2020-01-01', periods=bars),
+                'Close': close,
+                'Volume': rng.integers(100_000, 1_000_000, bars),
+                'SMA_Short': pd.Series(close).rolling(20).mean(),
+                'SMA_Long': pd.Series(close).rolling(50).mean(),
+                'Signal': signal,
+                'Portfolio_Value': 100_000 * close / close[0],
+            }),
+            'metrics': {'Total Return (%)': (close[-1] / close[0] - 1) * 100, 'Annual Return (%)': 0.0,
+                        'Sharpe Ratio': 0.0, 'Max Drawdown (%)': 0.0, 'Final Portfolio Value': 0.0},
+        }
+    return results
+
+
+def directory_size(directory: str) -> int:
+    return sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--symbols', type=int, nargs='+', default=[10, 50, 200])
+    parser.add_argument('--bars', type=int, default=1000)
+    args = parser.parse_args()
+
+    set_render_mode('headless')
+    visualizer = InteractiveVisualizer()
+    print(f"{'symbols':>8} {'per-symbol (MB)':>16} {'time (s)':>9} {'report (MB)':>12} {'time (s)':>9}")
+    for symbols in args.symbols:
+        results = synthetic_results(symbols, args.bars)
+        with tempfile.TemporaryDirectory() as directory:
+            per_symbol = os.path.join(directory, 'per_symbol')
+            start = time.perf_counter()
+            for symbol, entry in results.items():
+                visualizer.create_interactive_dashboard(entry['data'], symbol, entry['metrics'],
+                                                        os.path.join(per_symbol, f'{symbol}_interactive.html'))
+            visualizer.create_performance_heatmap(results, os.path.join(per_symbol, 'performance_heatmap.html'))
+            per_symbol_time = time.perf_counter() - start
+
+            report = os.path.join(directory, 'report', 'report.html')
+            start = time.perf_counter()
+            write_report(results, report)
+            report_time = time.perf_counter() - start
+
+            print(f"{symbols:>8} {directory_size(per_symbol) / 1e6:>16.1f} {per_symbol_time:>9.2f} "
+                  f"{os.path.getsize(report) / 1e6:>12.1f} {report_time:>9.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmark cold import time of the backtesting core and the plotting modules.
+
+Each module is imported in a fresh interpreter (several runs, median
+reported) started in an empty directory, and the script lists which heavy
+libraries the import pulled in and whether it wrote a config.ini. The core
+modules should load none of them.
+
+Usage:
+    python -m benchmarks.bench_import_time --runs 5
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+# Modules every backtest needs, and the plotting modules loaded on first use
+CORE_MODULES = ('strategies.sma_crossover', 'src.data_loader', 'src.risk_metrics', 'src.main')
+PLOTTING_MODULES = ('src.visualizer', 'src.risk_analyzer', 'src.interactive_viz')
+
+# Libraries that must stay out of the core import
+HEAVY_LIBRARIES = ('matplotlib', 'seaborn', 'scipy', 'plotly', 'yfinance')
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+seconds = time.perf_counter() - start
+print(json.dumps({{'seconds': seconds, 'loaded': sorted({{name.split('.')[0] for name in sys.modules}} & set({heavy!r}))}}))
+"""
+
+
+def import_probe(module: str, cwd: str) -> dict:
+    """Import ``module`` in a new interpreter and report its time and heavy dependencies"""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = {**os.environ, 'PYTHONPATH': root}
+    output = subprocess.run([sys.executable, '-c', PROBE.format(module=module, heavy=HEAVY_LIBRARIES)],
+                            cwd=cwd, env=env, capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'module':>26} {'import (s)':>11}  heavy libraries / side effects")
+    for module in CORE_MODULES + PLOTTING_MODULES:
+        with tempfile.TemporaryDirectory() as cwd:
+            probes = [import_probe(module, cwd) for _ in range(args.runs)]
+            wrote_config = os.path.exists(os.path.join(cwd, 'config.ini'))
+        notes = ', '.join(probes[0]['loaded']) or '-'
+        if wrote_config:
+            notes += ' (wrote config.ini)'
+        print(f"{module:>26} {statistics.median(p['seconds'] for p in probes):>11.3f}  {notes}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark building the interactive dashboard figure against the trade count.
+
+Builds the dashboard for one synthetic backtest (a fixed number of daily bars)
+with an increasing number of alternating buy/sell signals. The volume and
+trade-analysis panels use one trace per category, so the build time should
+stay flat as trades are added.
+
+Usage:
+    python -m benchmarks.bench_interactive_dashboard --bars 20000 --trades 10 1000 4000
+"""
+import argparse
+import time
+import numpy as np
+import pandas as pd
+
+from src.interactive_viz import InteractiveVisualizer
+
+
+def synthetic_results(bars: int, trades: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    close = 100 * np.exp(rng.normal(0.0003, 0.01, bars).cumsum())
+    signal = np.zeros(bars, dtype=int)
+    trade_bars = np.sort(rng.choice(bars, trades, replace=False))
+    signal[trade_bars] = np.where(np.arange(trades) % 2 == 0, 1, -1)
+    return pd.DataFrame({
+        'Date': pd.bdate_range('1990-01-01', periods=bars),
+        'Close': close, 'Volume': rng.integers(100_000, 1_000_000, bars),
+        'SMA_Short': pd.Series(close).rolling(20).mean(), 'SMA_Long': pd.Series(close).rolling(50).mean(),
+        'Signal': signal, 'Portfolio_Value': 100_000 * close / close[0],
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--bars', type=int, default=20_000)
+    parser.add_argument('--trades', type=int, nargs='+', default=[10, 100, 1000, 4000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    metrics = {'Total Return (%)': 0.0, 'Annual Return (%)': 0.0, 'Sharpe Ratio': 0.0,
+               'Max Drawdown (%)': 0.0, 'Final Portfolio Value': 0.0}
+    visualizer = InteractiveVisualizer()
+    visualizer.build_interactive_dashboard(synthetic_results(args.bars, 2), 'WARMUP', metrics)
+
+    print(f"{'trades':>8} {'build (s)':>10} {'traces':>7}")
+    for trades in args.trades:
+        results = synthetic_results(args.bars, trades)
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            fig = visualizer.build_interactive_dashboard(results, 'BENCH', metrics)
+            timings.append(time.perf_counter() - start)
+        print(f"{trades:>8} {min(timings):>10.3f} {len(fig.data):>7}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""
+Benchmark rolling VaR quantiles on a long minute-level return series.
+
+Compares one pandas ``rolling().quantile`` call per quantile with the
+single-sweep ``rolling_quantiles`` engine, and times the approximate
+streaming mode per update.
+
+Usage:
+    python -m benchmarks.bench_rolling_quantile --bars 1000000 --windows 20 60 120 390
+"""
+import argparse
+import time
+import numpy as np
+import pandas as pd
+
+from src.rolling_quantile import StreamingRollingQuantile, rolling_quantiles
+
+QUANTILES = [0.05, 0.01]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--bars', type=int, default=1_000_000)
+    parser.add_argument('--windows', type=int, nargs='+', default=[20, 60, 120, 390])
+    parser.add_argument('--stream-updates', type=int, default=100_000)
+    args = parser.parse_args()
+
+    returns = pd.Series(np.random.default_rng(0).normal(0, 0.001, args.bars))
+
+    print(f"{'window':>8} {'pandas (s)':>12} {'engine (s)':>12} {'max diff':>10}")
+    for window in args.windows:
+        start = time.perf_counter()
+        expected = np.column_stack([returns.rolling(window).quantile(q) for q in QUANTILES])
+        pandas_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = rolling_quantiles(returns, window, QUANTILES)
+        engine_time = time.perf_counter() - start
+
+        print(f"{window:>8} {pandas_time:>12.3f} {engine_time:>12.3f} {np.nanmax(np.abs(result - expected)):>10.1e}")
+
+    stream = StreamingRollingQuantile(max(args.windows), QUANTILES, lower=-0.01, upper=0.01, resolution=1e-5)
+    values = returns.iloc[:args.stream_updates].tolist()
+    start = time.perf_counter()
+    for value in values:
+        stream.update(value)
+    per_update = (time.perf_counter() - start) / len(values) * 1e6
+    print(f"Streaming approximate mode: {per_update:.1f} us/update (error <= {stream.max_error:.1e})")
+
+
+if __name__ == '__main__':
+    main()
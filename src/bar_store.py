@@ -0,0 +1,248 @@
+import bisect
+import json
+import os
+import shutil
+import numpy as np
+import pandas as pd
+from typing import Dict, Iterable, List, Optional, Union
+
+# numpy datetime unit used for each partitioning scheme
+PARTITION_UNITS = {'year': 'Y', 'month': 'M'}
+
+INDEX_FILE = '_index.json'
+
+
+class PartitionedBarStore:
+    """
+    Binary bar storage partitioned by symbol and year or month.
+
+    Each partition is a directory of one ``.npy`` file per column plus a
+    sorted int64 ``Date`` array (UTC nanoseconds). A per-symbol index lists
+    the partitions with their first and last timestamps, so a range query
+    opens only overlapping partitions, memory-maps them and cuts them with
+    ``searchsorted``. Slice cost therefore depends on the rows returned,
+    not on the total history.
+
+    Layout::
+
+        root/AAPL/_index.json
+        root/AAPL/2023/Date.npy, Open.npy, ...
+    """
+
+    def __init__(self, root: str = "data/store", partition: str = "year"):
+        if partition not in PARTITION_UNITS:
+            raise ValueError(f"partition must be one of {sorted(PARTITION_UNITS)}")
+        self.root = root
+        self.partition = partition
+        self._indexes: Dict[str, Dict] = {}
+
+    def symbols(self) -> List[str]:
+        """List the symbols held in the store"""
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(name for name in os.listdir(self.root)
+                      if os.path.exists(os.path.join(self.root, name, INDEX_FILE)))
+
+    def partitions(self, symbol: str) -> List[Dict]:
+        """Return the index entries (key, start, end, rows) of a symbol's partitions"""
+        return self._load_index(symbol)['partitions']
+
+    def write(self, symbol: str, df: pd.DataFrame) -> None:
+        """
+        Write bars into the store, merging with existing partitions.
+
+        Rows with timestamps already present are replaced by the new ones.
+        Only numeric and boolean columns are stored.
+
+        Args:
+            symbol (str): Symbol the bars belong to
+            df (pd.DataFrame): Bars with a datetime ``Date`` column
+        """
+        if df.empty:
+            return
+
+        index = self._load_index(symbol, create=True)
+        dates = df['Date']
+        if index['tz'] is None and not index['partitions'] and dates.dt.tz is not None:
+            index['tz'] = str(dates.dt.tz)
+        if dates.dt.tz is not None:
+            dates = dates.dt.tz_convert('UTC').dt.tz_localize(None)
+        elif index['tz'] is not None:
+            raise ValueError(f"{symbol} is stored with timezone {index['tz']}; got naive dates")
+
+        timestamps = dates.to_numpy().astype('datetime64[ns]').view('int64')
+        columns = {name: df[name].to_numpy() for name in df.columns
+                   if name != 'Date' and df[name].dtype.kind in 'biuf'}
+
+        order = np.argsort(timestamps, kind='stable')
+        timestamps = timestamps[order]
+        columns = {name: values[order] for name, values in columns.items()}
+
+        keys = timestamps.view('datetime64[ns]').astype(f"datetime64[{PARTITION_UNITS[self.partition]}]")
+        boundaries = np.flatnonzero(keys[1:] != keys[:-1]) + 1
+        starts = np.concatenate(([0], boundaries))
+        stops = np.concatenate((boundaries, [len(timestamps)]))
+
+        entries = {entry['key']: entry for entry in index['partitions']}
+        for start, stop in zip(starts, stops):
+            key = str(keys[start])
+            part_dates = timestamps[start:stop]
+            part_columns = {name: values[start:stop] for name, values in columns.items()}
+
+            if key in entries:
+                part_dates, part_columns = self._merge(symbol, key, part_dates, part_columns)
+
+            self._write_partition(symbol, key, part_dates, part_columns)
+            entries[key] = {
+                'key': key,
+                'start': int(part_dates[0]),
+                'end': int(part_dates[-1]),
+                'rows': int(len(part_dates)),
+            }
+
+        index['partitions'] = sorted(entries.values(), key=lambda entry: entry['start'])
+        index['columns'] = sorted(set(index['columns']) | set(columns))
+        self._save_index(symbol, index)
+
+    def write_chunks(self, symbol: str, chunks: Iterable[pd.DataFrame]) -> int:
+        """
+        Write a stream of bar chunks, e.g. from ``DataLoader.read_csv_chunks``.
+
+        Returns:
+            int: Number of rows written
+        """
+        rows = 0
+        for chunk in chunks:
+            self.write(symbol, chunk)
+            rows += len(chunk)
+        return rows
+
+    def read(self, symbol: str, start: Union[str, pd.Timestamp, None] = None,
+             end: Union[str, pd.Timestamp, None] = None,
+             columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Read the bars of ``symbol`` in ``[start, end)``.
+
+        Args:
+            symbol (str): Stored symbol
+            start (str | Timestamp, optional): Inclusive lower bound
+            end (str | Timestamp, optional): Exclusive upper bound
+            columns (List[str], optional): Columns to load (default: all)
+
+        Returns:
+            pd.DataFrame: Bars with a ``Date`` column, empty if nothing matches
+        """
+        index = self._load_index(symbol)
+        columns = index['columns'] if columns is None else [c for c in columns if c != 'Date']
+        lo = self._bound(start, index['tz'], np.iinfo(np.int64).min)
+        hi = self._bound(end, index['tz'], np.iinfo(np.int64).max)
+
+        entries = index['partitions']
+        ends = [entry['end'] for entry in entries]
+        first = bisect.bisect_left(ends, lo)
+
+        date_parts, column_parts = [], {name: [] for name in columns}
+        for entry in entries[first:]:
+            if entry['start'] >= hi:
+                break
+            path = self._partition_path(symbol, entry['key'])
+            dates = np.load(os.path.join(path, 'Date.npy'), mmap_mode='r')
+            i = np.searchsorted(dates, lo, side='left')
+            j = np.searchsorted(dates, hi, side='left')
+            if i == j:
+                continue
+            date_parts.append(np.array(dates[i:j]))
+            for name in columns:
+                values = np.load(os.path.join(path, f'{name}.npy'), mmap_mode='r')
+                column_parts[name].append(np.array(values[i:j]))
+
+        if not date_parts:
+            return pd.DataFrame(columns=['Date'] + columns)
+
+        dates = pd.DatetimeIndex(np.concatenate(date_parts).view('datetime64[ns]'))
+        if index['tz'] is not None:
+            dates = dates.tz_localize('UTC').tz_convert(index['tz'])
+
+        data = {'Date': dates}
+        data.update({name: np.concatenate(parts) for name, parts in column_parts.items()})
+        return pd.DataFrame(data)
+
+    def last_timestamp(self, symbol: str) -> Optional[pd.Timestamp]:
+        """Return the most recent stored timestamp of ``symbol``"""
+        index = self._load_index(symbol)
+        if not index['partitions']:
+            return None
+        ts = pd.Timestamp(index['partitions'][-1]['end'], unit='ns')
+        return ts.tz_localize('UTC').tz_convert(index['tz']) if index['tz'] else ts
+
+    def _bound(self, value, tz: Optional[str], default: int) -> int:
+        if value is None:
+            return default
+        ts = pd.Timestamp(value)
+        if tz is not None:
+            ts = (ts.tz_localize(tz) if ts.tzinfo is None else ts).tz_convert('UTC').tz_localize(None)
+        elif ts.tzinfo is not None:
+            ts = ts.tz_convert('UTC').tz_localize(None)
+        return int(ts.as_unit('ns').value)
+
+    def _merge(self, symbol: str, key: str, dates: np.ndarray, columns: Dict[str, np.ndarray]):
+        """Merge new rows into an existing partition, new rows winning on equal timestamps"""
+        path = self._partition_path(symbol, key)
+        old_dates = np.load(os.path.join(path, 'Date.npy'))
+        names = set(columns) | {f[:-4] for f in os.listdir(path) if f.endswith('.npy') and f != 'Date.npy'}
+
+        merged_dates = np.concatenate((old_dates, dates))
+        order = np.argsort(merged_dates, kind='stable')
+        merged_dates = merged_dates[order]
+        # Keep the last occurrence of each timestamp (the newly written row)
+        keep = np.append(merged_dates[1:] != merged_dates[:-1], True)
+
+        merged = {}
+        for name in names:
+            old_file = os.path.join(path, f'{name}.npy')
+            old = np.load(old_file) if os.path.exists(old_file) else np.full(len(old_dates), np.nan)
+            new = columns[name] if name in columns else np.full(len(dates), np.nan)
+            merged[name] = np.concatenate((old, new))[order][keep]
+        return merged_dates[keep], merged
+
+    def _write_partition(self, symbol: str, key: str, dates: np.ndarray,
+                         columns: Dict[str, np.ndarray]) -> None:
+        path = self._partition_path(symbol, key)
+        tmp_path = path + '.tmp'
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        os.makedirs(tmp_path)
+        np.save(os.path.join(tmp_path, 'Date.npy'), np.ascontiguousarray(dates, dtype=np.int64))
+        for name, values in columns.items():
+            np.save(os.path.join(tmp_path, f'{name}.npy'), np.ascontiguousarray(values))
+        shutil.rmtree(path, ignore_errors=True)
+        os.replace(tmp_path, path)
+
+    def _partition_path(self, symbol: str, key: str) -> str:
+        return os.path.join(self.root, symbol, key)
+
+    def _load_index(self, symbol: str, create: bool = False) -> Dict:
+        if symbol in self._indexes:
+            return self._indexes[symbol]
+
+        path = os.path.join(self.root, symbol, INDEX_FILE)
+        if os.path.exists(path):
+            with open(path) as f:
+                index = json.load(f)
+        elif create:
+            index = {'partition': self.partition, 'tz': None, 'columns': [], 'partitions': []}
+        else:
+            raise KeyError(f"Symbol {symbol} not found in store {self.root}")
+
+        if index['partition'] != self.partition:
+            raise ValueError(f"{symbol} is partitioned by {index['partition']}, not {self.partition}")
+
+        self._indexes[symbol] = index
+        return index
+
+    def _save_index(self, symbol: str, index: Dict) -> None:
+        os.makedirs(os.path.join(self.root, symbol), exist_ok=True)
+        path = os.path.join(self.root, symbol, INDEX_FILE)
+        with open(path + '.tmp', 'w') as f:
+            json.dump(index, f, indent=2)
+        os.replace(path + '.tmp', path)
+        self._indexes[symbol] = index
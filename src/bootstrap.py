@@ -0,0 +1,101 @@
+import numpy as np
+import pandas as pd
+from typing import Optional, Union
+from src.risk_metrics import RATIO_NAMES, ratio_kernel
+
+# Resampled return elements materialized per chunk
+MEMORY_BUDGET = 1 << 24
+
+
+def stationary_bootstrap_indices(n: int, n_resamples: int, mean_block: float,
+                                 rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """
+    Index matrix of a stationary bootstrap (Politis & Romano, 1994).
+
+    Each resample is built from blocks with geometrically distributed
+    lengths (mean ``mean_block``) starting at uniform positions and wrapping
+    around the end of the series. The whole (resamples x n) matrix is built
+    with array operations: a block restarts where a Bernoulli(1/mean_block)
+    draw fires, and every position offsets from the start of its block.
+
+    Args:
+        n (int): Length of the series
+        n_resamples (int): Number of resamples (rows)
+        mean_block (float): Expected block length (>= 1)
+        rng (np.random.Generator, optional): Random generator
+
+    Returns:
+        np.ndarray: Integer array of shape ``(n_resamples, n)``
+    """
+    if mean_block < 1:
+        raise ValueError("mean_block must be at least 1")
+    rng = np.random.default_rng() if rng is None else rng
+
+    positions = np.arange(n)
+    restart = rng.random((n_resamples, n)) < 1.0 / mean_block
+    restart[:, 0] = True
+    block_start = np.maximum.accumulate(np.where(restart, positions, 0), axis=1)
+    origins = rng.integers(0, n, (n_resamples, n))
+    start_index = np.take_along_axis(origins, block_start, axis=1)
+    return (start_index + positions - block_start) % n
+
+
+def bootstrap_ratio_intervals(returns: Union[pd.Series, pd.DataFrame, np.ndarray],
+                              n_resamples: int = 2000, confidence: float = 0.95,
+                              mean_block: Optional[float] = None, seed: Optional[int] = 0,
+                              memory_budget: int = MEMORY_BUDGET) -> pd.DataFrame:
+    """
+    Stationary-bootstrap confidence intervals for Sharpe, Sortino and Calmar.
+
+    One index matrix is shared by all strategies (so resamples keep their
+    cross-sectional dependence); resampled returns are gathered in chunks of
+    strategies and evaluated with the batched ratio kernel.
+
+    Args:
+        returns: Return series, or a (time x strategies) matrix
+        n_resamples (int): Bootstrap resamples
+        confidence (float): Two-sided confidence level of the percentile intervals
+        mean_block (float, optional): Expected block length; defaults to ``n ** (1/3)``
+        seed (int, optional): Seed for reproducible intervals
+        memory_budget (int): Maximum resampled elements held at once
+
+    Returns:
+        pd.DataFrame: One row per strategy with each ratio's point estimate and
+        ``(lower)``/``(upper)`` interval bounds
+    """
+    if isinstance(returns, pd.Series):
+        names = [returns.name if returns.name is not None else 0]
+    elif isinstance(returns, pd.DataFrame):
+        names = list(returns.columns)
+    else:
+        names = None
+    x = np.asarray(returns, dtype=float)
+    x = x[:, None] if x.ndim == 1 else x
+    if np.isnan(x).any():
+        raise ValueError("returns must not contain missing values")
+    n, n_strategies = x.shape
+    names = list(range(n_strategies)) if names is None else names
+
+    mean_block = max(1.0, n ** (1 / 3)) if mean_block is None else mean_block
+    indices = stationary_bootstrap_indices(n, n_resamples, mean_block, np.random.default_rng(seed))
+
+    alpha = (1 - confidence) / 2
+    estimates = ratio_kernel(x, axis=0)
+    columns = {}
+    for name in RATIO_NAMES:
+        columns[name] = estimates[name]
+        columns[f'{name} (lower)'] = np.empty(n_strategies)
+        columns[f'{name} (upper)'] = np.empty(n_strategies)
+
+    step = max(1, memory_budget // (n_resamples * n))
+    for start in range(0, n_strategies, step):
+        series = x[:, start:start + step].T  # strategies x time
+        resampled = series[:, indices].reshape(-1, n)  # (strategies * resamples) x time
+        ratios = ratio_kernel(resampled)
+        for name in RATIO_NAMES:
+            values = ratios[name].reshape(len(series), n_resamples)
+            lower, upper = np.nanquantile(values, [alpha, 1 - alpha], axis=1)
+            columns[f'{name} (lower)'][start:start + len(series)] = lower
+            columns[f'{name} (upper)'][start:start + len(series)] = upper
+
+    return pd.DataFrame(columns, index=names)
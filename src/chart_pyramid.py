@@ -0,0 +1,310 @@
+import json
+import os
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional
+
+# Columns stored in the pyramid by default
+PYRAMID_COLUMNS = ['Close', 'Portfolio_Value']
+
+# Bars merged per bucket between consecutive levels
+LEVEL_FACTOR = 8
+
+# Rows per tile file; the coarsest level fits in a single tile
+TILE_ROWS = 4096
+
+# Points the viewer aims to draw per line for the visible window
+VIEWER_TARGET_POINTS = 4000
+
+MANIFEST_FILE = 'manifest.json'
+VIEWER_FILE = 'viewer.html'
+
+# Tile layout: epoch-ms times (float64), then min, max and close (float32), each `rows` long
+TILE_FIELDS = [('time', np.float64), ('min', np.float32), ('max', np.float32), ('close', np.float32)]
+
+
+class ChartPyramid:
+    """
+    Multi-resolution min/max/close pyramid of long series, stored as binary tiles.
+
+    Level 0 holds every bar; each following level merges ``LEVEL_FACTOR``
+    buckets of the previous one into one (minimum of the minima, maximum of
+    the maxima, last close, first timestamp), until a level fits in a single
+    tile. Every level is cut into fixed-size tiles, so a viewer only fetches
+    the tiles overlapping the visible window at the level whose resolution
+    matches the zoom: the initial full-history view is one small tile per
+    series, whatever the length of the history.
+
+    Layout on disk::
+
+        out_dir/
+            manifest.json                 # levels, tile files and their time spans
+            Close/L0_00000.bin ...        # tiles (see TILE_FIELDS)
+            Portfolio_Value/L0_00000.bin
+            viewer.html                   # optional, see write_viewer
+    """
+
+    def __init__(self, directory: str):
+        """
+        Args:
+            directory: Directory written by ``ChartPyramid.build``
+        """
+        self.directory = directory
+        with open(os.path.join(directory, MANIFEST_FILE)) as f:
+            self.manifest = json.load(f)
+
+    @classmethod
+    def build(cls, results: pd.DataFrame, out_dir: str, columns: Optional[List[str]] = None,
+              symbol: str = '', level_factor: int = LEVEL_FACTOR, tile_rows: int = TILE_ROWS) -> 'ChartPyramid':
+        """
+        Build the pyramid of backtest results.
+
+        Args:
+            results: Results with a ``Date`` column
+            out_dir: Output directory
+            columns: Series to store (default: ``PYRAMID_COLUMNS`` present in ``results``)
+            symbol: Title shown by the viewer
+            level_factor: Bars merged per bucket between levels
+            tile_rows: Rows per tile file
+
+        Returns:
+            ChartPyramid: The written pyramid
+        """
+        if level_factor < 2:
+            raise ValueError("level_factor must be at least 2")
+        columns = [c for c in PYRAMID_COLUMNS if c in results.columns] if columns is None else columns
+        times = pd.to_datetime(results['Date']).to_numpy().astype('datetime64[ms]').astype(np.int64).astype(np.float64)
+
+        levels = []
+        for column in columns:
+            values = results[column].to_numpy(dtype=np.float64)
+            level = {'time': times, 'min': values, 'max': values, 'close': values}
+            bucket = 1
+            for depth in range(64):
+                if column == columns[0]:
+                    levels.append({'level': depth, 'bucket': bucket, 'rows': len(level['time']), 'tiles': {}})
+                levels[depth]['tiles'][column] = _write_tiles(level, out_dir, column, depth, tile_rows)
+                if len(level['time']) <= tile_rows:
+                    break
+                level = _merge(level, level_factor)
+                bucket *= level_factor
+
+        manifest = {
+            'symbol': symbol,
+            'columns': columns,
+            'start': float(times[0]) if len(times) else 0.0,
+            'end': float(times[-1]) if len(times) else 0.0,
+            'level_factor': level_factor,
+            'tile_fields': [[name, np.dtype(dtype).str] for name, dtype in TILE_FIELDS],
+            'levels': levels,
+        }
+        with open(os.path.join(out_dir, MANIFEST_FILE), 'w') as f:
+            json.dump(manifest, f)
+        return cls(out_dir)
+
+    @property
+    def levels(self) -> List[Dict]:
+        return self.manifest['levels']
+
+    def choose_level(self, start: float, end: float, target_points: int = VIEWER_TARGET_POINTS) -> int:
+        """
+        Finest level drawing at most ``target_points`` per line in [start, end] (epoch ms)
+
+        Mirrors the viewer's choice.
+        """
+        span = max(self.manifest['end'] - self.manifest['start'], 1.0)
+        for level in self.levels:
+            if level['rows'] * (end - start) / span <= target_points:
+                return level['level']
+        return self.levels[-1]['level']
+
+    def read(self, column: str, level: int, start=None, end=None) -> pd.DataFrame:
+        """
+        Read one level of a series, opening only the tiles overlapping the window.
+
+        Args:
+            column: Stored series
+            level: Pyramid level
+            start, end: Optional window bounds (timestamps)
+
+        Returns:
+            pd.DataFrame: Date-indexed min, max and close columns
+        """
+        start_ms = -np.inf if start is None else pd.Timestamp(start).value / 1e6
+        end_ms = np.inf if end is None else pd.Timestamp(end).value / 1e6
+        tiles = [tile for tile in self.levels[level]['tiles'][column]
+                 if tile['end'] >= start_ms and tile['start'] <= end_ms]
+        parts = [_read_tile(os.path.join(self.directory, tile['file']), tile['rows']) for tile in tiles]
+        data = {name: np.concatenate([part[name] for part in parts]) if parts else np.empty(0, dtype)
+                for name, dtype in TILE_FIELDS}
+        mask = (data['time'] >= start_ms) & (data['time'] <= end_ms)
+        index = pd.to_datetime(data['time'][mask].astype(np.int64), unit='ms')
+        return pd.DataFrame({name: data[name][mask] for name in ('min', 'max', 'close')}, index=index)
+
+    def write_viewer(self, target_points: int = VIEWER_TARGET_POINTS) -> str:
+        """
+        Write the viewer page next to the manifest.
+
+        The page loads the coarsest level, then fetches the level matching the
+        zoom window on every pan or zoom. Browsers do not allow ``fetch`` from
+        ``file://`` pages, so serve the directory, e.g.
+        ``python -m http.server --directory <out_dir>``.
+
+        Returns:
+            str: Path of the viewer page
+        """
+        from src.html_export import PLOTLYJS_BUNDLE
+        bundle = os.path.join(self.directory, PLOTLYJS_BUNDLE)
+        if not os.path.exists(bundle):
+            from plotly.offline import get_plotlyjs
+            with open(bundle, 'w', encoding='utf-8') as f:
+                f.write(get_plotlyjs())
+
+        path = os.path.join(self.directory, VIEWER_FILE)
+        html = (VIEWER_TEMPLATE.replace('__TITLE__', self.manifest['symbol'] or 'Chart pyramid')
+                .replace('__BUNDLE__', PLOTLYJS_BUNDLE)
+                .replace('__MANIFEST__', MANIFEST_FILE)
+                .replace('__TARGET_POINTS__', str(target_points)))
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(html)
+        return path
+
+
+def _merge(level: Dict[str, np.ndarray], factor: int) -> Dict[str, np.ndarray]:
+    """Merge every ``factor`` rows of a level into one bucket"""
+    starts = np.arange(0, len(level['time']), factor)
+    ends = np.minimum(starts + factor, len(level['time'])) - 1
+    return {
+        'time': level['time'][starts],
+        'min': np.fmin.reduceat(level['min'], starts),
+        'max': np.fmax.reduceat(level['max'], starts),
+        'close': level['close'][ends],
+    }
+
+
+def _write_tiles(level: Dict[str, np.ndarray], out_dir: str, column: str, depth: int,
+                 tile_rows: int) -> List[Dict]:
+    """Write one level of a series as tiles and return their manifest entries"""
+    os.makedirs(os.path.join(out_dir, column), exist_ok=True)
+    tiles = []
+    for number, first in enumerate(range(0, len(level['time']), tile_rows)):
+        rows = min(tile_rows, len(level['time']) - first)
+        name = f'{column}/L{depth}_{number:05d}.bin'
+        with open(os.path.join(out_dir, name), 'wb') as f:
+            for field, dtype in TILE_FIELDS:
+                f.write(np.ascontiguousarray(level[field][first:first + rows], dtype=np.dtype(dtype).newbyteorder('<')).tobytes())
+        tiles.append({'file': name, 'rows': rows,
+                      'start': float(level['time'][first]), 'end': float(level['time'][first + rows - 1])})
+    return tiles
+
+
+def _read_tile(path: str, rows: int) -> Dict[str, np.ndarray]:
+    buffer = np.fromfile(path, dtype=np.uint8)
+    fields, offset = {}, 0
+    for name, dtype in TILE_FIELDS:
+        dtype = np.dtype(dtype).newbyteorder('<')
+        fields[name] = np.frombuffer(buffer, dtype=dtype, count=rows, offset=offset)
+        offset += rows * dtype.itemsize
+    return fields
+
+
+VIEWER_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>__TITLE__</title>
+<script src="__BUNDLE__"></script>
+<style>body { margin: 0; font-family: sans-serif; } #status { position: absolute; right: 12px; top: 8px; color: #666; }</style>
+</head>
+<body>
+<div id="status"></div>
+<div id="chart" style="width: 100vw; height: 96vh;"></div>
+<script>
+const TARGET_POINTS = __TARGET_POINTS__;
+const COLORS = ['#2E86AB', '#C73E1D'];
+let manifest = null;
+const tileCache = {};
+
+function loadTile(tile) {
+  if (!tileCache[tile.file]) {
+    tileCache[tile.file] = fetch(tile.file).then(r => r.arrayBuffer()).then(buffer => {
+      const n = tile.rows;
+      return {
+        time: new Float64Array(buffer, 0, n),
+        min: new Float32Array(buffer, 8 * n, n),
+        max: new Float32Array(buffer, 12 * n, n),
+        close: new Float32Array(buffer, 16 * n, n),
+      };
+    });
+  }
+  return tileCache[tile.file];
+}
+
+function concat(parts, field, Type) {
+  const out = new Type(parts.reduce((total, part) => total + part[field].length, 0));
+  let offset = 0;
+  for (const part of parts) { out.set(part[field], offset); offset += part[field].length; }
+  return out;
+}
+
+function chooseLevel(start, end) {
+  const span = Math.max(manifest.end - manifest.start, 1);
+  for (const level of manifest.levels) {
+    if (level.rows * (end - start) / span <= TARGET_POINTS) return level;
+  }
+  return manifest.levels[manifest.levels.length - 1];
+}
+
+async function draw(start, end) {
+  const level = chooseLevel(start, end);
+  const traces = [];
+  const layout = {
+    title: manifest.symbol, uirevision: 'pyramid', showlegend: true, hovermode: 'x unified',
+    grid: {rows: manifest.columns.length, columns: 1, pattern: 'independent'},
+  };
+  for (const [i, column] of manifest.columns.entries()) {
+    const tiles = level.tiles[column].filter(t => t.end >= start && t.start <= end);
+    const parts = await Promise.all(tiles.map(loadTile));
+    const time = concat(parts, 'time', Float64Array);
+    const axis = i === 0 ? '' : String(i + 1);
+    const refs = {xaxis: 'x' + axis, yaxis: 'y' + axis};
+    if (level.bucket > 1) {
+      traces.push({type: 'scattergl', x: time, y: concat(parts, 'max', Float32Array), ...refs,
+                   line: {width: 0}, showlegend: false, hoverinfo: 'skip'});
+      traces.push({type: 'scattergl', x: time, y: concat(parts, 'min', Float32Array), ...refs,
+                   fill: 'tonexty', fillcolor: 'rgba(120,120,120,0.25)', line: {width: 0},
+                   name: column + ' range', hoverinfo: 'skip'});
+    }
+    traces.push({type: 'scattergl', x: time, y: concat(parts, 'close', Float32Array), ...refs,
+                 name: column, line: {color: COLORS[i % COLORS.length], width: 1.5}});
+    layout['xaxis' + axis] = {type: 'date', matches: i === 0 ? undefined : 'x'};
+    layout['yaxis' + axis] = {title: column};
+  }
+  document.getElementById('status').textContent =
+    'level ' + level.level + ' (' + level.bucket + ' bars per point)';
+  await Plotly.react('chart', traces, layout);
+}
+
+function toMs(value) {
+  return typeof value === 'number' ? value : new Date(value.replace(' ', 'T') + 'Z').getTime();
+}
+
+fetch('__MANIFEST__').then(r => r.json()).then(async loaded => {
+  manifest = loaded;
+  await draw(manifest.start, manifest.end);
+  document.getElementById('chart').on('plotly_relayout', event => {
+    const key = Object.keys(event).find(k => /^xaxis\\d*\\.range\\[0\\]$/.test(k));
+    const pair = Object.keys(event).find(k => /^xaxis\\d*\\.range$/.test(k));
+    if (key) {
+      draw(toMs(event[key]), toMs(event[key.replace('[0]', '[1]')]));
+    } else if (pair) {
+      draw(toMs(event[pair][0]), toMs(event[pair][1]));
+    } else if (Object.keys(event).some(k => k.endsWith('autorange'))) {
+      draw(manifest.start, manifest.end);
+    }
+  });
+});
+</script>
+</body>
+</html>
+"""
@@ -0,0 +1,122 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Sequence, Tuple
+
+# Symbols drawn individually (one line / bar / label each) in comparison
+# charts; larger universes switch to aggregate views and pages
+DETAIL_SYMBOL_LIMIT = 12
+
+# Percentile bands of the fan charts, outermost first
+PERCENTILE_BANDS = ((5, 95), (25, 75))
+
+# Metrics shown in the cross-sectional heatmaps
+COMPARISON_METRICS = ['Total Return (%)', 'Annual Return (%)', 'Sharpe Ratio', 'Max Drawdown (%)']
+
+
+def value_matrix(results_dict: Dict[str, Dict], column: str = 'Portfolio_Value') -> pd.DataFrame:
+    """
+    Outer-aligned (time x symbols) matrix of one results column.
+
+    Unlike ``universe_risk.returns_matrix`` the dates are not intersected:
+    each symbol is NaN outside its own history, and gaps inside it are
+    forward filled.
+
+    Args:
+        results_dict: Mapping of symbol to ``{'data': results}``
+        column: Results column to align
+
+    Returns:
+        pd.DataFrame: Values indexed by date, one column per symbol
+    """
+    symbols = list(results_dict)
+    dates = [_dates(results_dict[symbol]['data']['Date']) for symbol in symbols]
+    index = np.unique(np.concatenate(dates))
+
+    # Scatter every symbol into its rows of one preallocated matrix
+    array = np.full((len(index), len(symbols)), np.nan)
+    for j, (symbol, symbol_dates) in enumerate(zip(symbols, dates)):
+        array[np.searchsorted(index, symbol_dates), j] = results_dict[symbol]['data'][column].to_numpy(dtype=float)
+
+    values = pd.DataFrame(array, index=pd.DatetimeIndex(index), columns=symbols)
+    inside = values.ffill().notna() & values.bfill().notna()
+    return values.ffill().where(inside)
+
+
+def cumulative_returns(values: pd.DataFrame) -> pd.DataFrame:
+    """Growth of 1 from each symbol's first value"""
+    first = values.bfill().iloc[0]
+    return values / first
+
+
+def drawdown_matrix(values: pd.DataFrame) -> pd.DataFrame:
+    """Drawdown in percent of every column from its running peak (NaN-aware)"""
+    array = values.to_numpy(dtype=float)
+    running_max = np.fmax.accumulate(array, axis=0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        drawdown = (array - running_max) / running_max * 100
+    return pd.DataFrame(drawdown, index=values.index, columns=values.columns)
+
+
+def percentile_bands(matrix: pd.DataFrame, bands: Sequence[Tuple[int, int]] = PERCENTILE_BANDS) -> pd.DataFrame:
+    """
+    Cross-sectional percentiles of a (time x symbols) matrix for each date.
+
+    Args:
+        matrix: Values per date and symbol (NaN where a symbol has no data)
+        bands: (lower, upper) percentile pairs
+
+    Returns:
+        pd.DataFrame: One column per percentile (the bands' bounds and 50),
+        indexed like ``matrix``; dates without any value are dropped
+    """
+    percentiles = sorted({p for band in bands for p in band} | {50})
+    array = matrix.to_numpy(dtype=float)
+    rows = ~np.isnan(array).all(axis=1)
+    values = np.nanpercentile(array[rows], percentiles, axis=1).T
+    return pd.DataFrame(values, index=matrix.index[rows], columns=percentiles)
+
+
+def metrics_frame(results_dict: Dict[str, Dict], metrics: Sequence[str] = COMPARISON_METRICS) -> pd.DataFrame:
+    """(symbols x metrics) table of the metrics every symbol reports"""
+    frame = pd.DataFrame.from_dict({symbol: entry['metrics'] for symbol, entry in results_dict.items()},
+                                   orient='index')
+    return frame[[m for m in metrics if m in frame.columns]].astype(float)
+
+
+def zscore(frame: pd.DataFrame) -> pd.DataFrame:
+    """Standardize every column (constant columns become 0)"""
+    std = frame.std(ddof=0).replace(0, 1)
+    return ((frame - frame.mean()) / std).fillna(0)
+
+
+def cluster_order(frame: pd.DataFrame) -> List:
+    """
+    Row labels ordered so that similar metric profiles are adjacent.
+
+    Rows are standardized per column and ordered by the leaves of a Ward
+    hierarchical clustering, which puts groups of similar symbols in
+    contiguous blocks of a heatmap.
+
+    Args:
+        frame: (symbols x metrics) table
+
+    Returns:
+        List: Index labels in display order
+    """
+    if len(frame) < 3:
+        return list(frame.index)
+    from scipy.cluster.hierarchy import leaves_list, linkage
+    return list(frame.index[leaves_list(linkage(zscore(frame).to_numpy(), method='ward'))])
+
+
+def paginate(symbols: Sequence, per_page: int = DETAIL_SYMBOL_LIMIT) -> List[List]:
+    """Split symbols into consecutive pages of at most ``per_page``"""
+    symbols = list(symbols)
+    return [symbols[i:i + per_page] for i in range(0, len(symbols), per_page)]
+
+
+def _dates(column: pd.Series) -> np.ndarray:
+    """datetime64[ns] array of a Date column (parsed only if it is not already datetime)"""
+    if column.dtype.kind != 'M':
+        column = pd.to_datetime(column)
+    return column.to_numpy().astype('datetime64[ns]')
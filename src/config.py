@@ -49,7 +49,11 @@ class Config:
             'figure_size_width': '15',
             'figure_size_height': '10',
             'dpi': '300',
-            'save_format': 'png'
+            'save_format': 'png',
+            'render_mode': 'interactive',
+            'max_plot_points': '5000',
+            'html_export': 'standalone',
+            'render_cache': 'false'
         }
         
         self.config['symbols'] = {
@@ -96,7 +100,11 @@ class Config:
                 self.get('plotting', 'figure_size_height', 10)
             ),
             'dpi': self.get('plotting', 'dpi', 300),
-            'format': self.get('plotting', 'save_format', 'png')
+            'format': self.get('plotting', 'save_format', 'png'),
+            'render_mode': self.get('plotting', 'render_mode', 'interactive'),
+            'max_plot_points': self.get('plotting', 'max_plot_points', 5000),
+            'html_export': self.get('plotting', 'html_export', 'standalone'),
+            'render_cache': self.get('plotting', 'render_cache', False)
         }
     
     def update(self, section: str, key: str, value: Any):
@@ -110,5 +118,11 @@ class Config:
         with open(self.config_file, 'w') as f:
             self.config.write(f)
 
-# Global config instance
-config = Config()
\ No newline at end of file
+# Global config instance, created on first access so that importing this module
+# never reads or writes config.ini
+def __getattr__(name: str):
+    """Create the global ``config`` on first access"""
+    if name == 'config':
+        globals()[name] = Config()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
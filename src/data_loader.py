@@ -1,11 +1,177 @@
-import yfinance as yf
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+import re
+import numpy as np
 import pandas as pd
-from typing import Optional
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 from datetime import datetime, timedelta
+from src.data_sources import DataSource, REQUIRED_COLUMNS, get_data_source, request_key
+from src.data_validation import validate_bars
+
+# Explicit column types for streamed bar files; unknown columns are inferred
+BAR_DTYPES = {
+    'Open': 'float64',
+    'High': 'float64',
+    'Low': 'float64',
+    'Close': 'float64',
+    'Adj Close': 'float64',
+    'Volume': 'int64',
+    'Dividends': 'float64',
+    'Stock Splits': 'float64',
+}
+
+# Width of each fixed-format timestamp field
+_TIMESTAMP_FIELDS = {'%Y': 4, '%m': 2, '%d': 2, '%H': 2, '%M': 2, '%S': 2, '%z': 6}
+
+# Days per month of a non-leap year
+_DAYS_IN_MONTH = np.array([31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31], dtype=np.int32)
+
+
+def parse_fixed_timestamps(values, date_format: str = '%Y-%m-%d') -> pd.DatetimeIndex:
+    """
+    Parse fixed-width timestamp strings without per-element Python work.
+
+    The strings are viewed as a (rows x width) code point matrix and every field is
+    decoded with integer arithmetic, which is several times faster than
+    ``pd.to_datetime`` with format inference. Supported fields are %Y, %m,
+    %d, %H, %M, %S and %z (as ``+HH:MM``); any other character is a literal
+    separator. Strings of another length, with a non-digit in a field or a
+    wrong separator, or with an out-of-range date or time are rejected.
+
+    Args:
+        values: Array-like of timestamp strings that all match ``date_format``
+        date_format (str): Fixed layout such as '%Y-%m-%d %H:%M:%S%z'
+
+    Returns:
+        pd.DatetimeIndex: Parsed timestamps, UTC-aware when the format has %z
+
+    Raises:
+        ValueError: If any string does not match ``date_format``
+    """
+    positions = {}
+    literals = {}
+    width = 0
+    for token in re.findall(r'%[A-Za-z]|[^%]', date_format):
+        if token.startswith('%'):
+            if token not in _TIMESTAMP_FIELDS:
+                raise ValueError(f"Unsupported timestamp field {token} in {date_format}")
+            positions[token] = width
+            width += _TIMESTAMP_FIELDS[token]
+        else:
+            literals[width] = ord(token)
+            width += 1
+
+    # Read as unicode so longer strings are rejected instead of truncated
+    raw = np.asarray(values)
+    if raw.dtype.kind != 'U':
+        raw = raw.astype(str)
+    if len(raw) and (np.char.str_len(raw) != width).any():
+        raise ValueError(f"Timestamps do not match fixed format {date_format}: "
+                         f"{raw[np.char.str_len(raw) != width][0]!r}")
+    raw = raw.astype(f'U{width}')
+
+    # One contiguous row of code points per position in the layout
+    chars = np.ascontiguousarray(raw.view(np.uint32).reshape(len(raw), width).T)
+
+    def check(valid: np.ndarray, what: str) -> None:
+        if not valid.all():
+            raise ValueError(f"Timestamps do not match fixed format {date_format} "
+                             f"({what}): {raw[~valid][0]!r}")
+
+    # Every field position must be a digit (the %z sign and colon excepted)
+    # and every other position its literal separator
+    valid = np.ones(len(raw), dtype=bool)
+    for token, start in positions.items():
+        for i in range(_TIMESTAMP_FIELDS[token]):
+            if token == '%z' and i == 0:
+                valid &= (chars[start] == ord('+')) | (chars[start] == ord('-'))
+            elif token == '%z' and i == 3:
+                valid &= chars[start + 3] == ord(':')
+            else:
+                valid &= (chars[start + i] >= ord('0')) & (chars[start + i] <= ord('9'))
+    for position, code in literals.items():
+        valid &= chars[position] == code
+    check(valid, 'unexpected character')
+
+    def digit(position: int) -> np.ndarray:
+        return chars[position].astype(np.int32) - ord('0')
+
+    def field(token: str, default: int = 0) -> np.ndarray:
+        if token not in positions:
+            return np.full(len(raw), default, dtype=np.int32)
+        start = positions[token]
+        out = digit(start)
+        for i in range(1, _TIMESTAMP_FIELDS[token]):
+            out *= 10
+            out += digit(start + i)
+        return out
+
+    year, month, day = field('%Y', 1970), field('%m', 1), field('%d', 1)
+    hour, minute, second = field('%H'), field('%M'), field('%S')
+    leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    month_days = _DAYS_IN_MONTH[np.clip(month, 1, 12) - 1] + (leap & (month == 2))
+    check((month >= 1) & (month <= 12) & (day >= 1) & (day <= month_days), 'invalid date')
+    check((hour <= 23) & (minute <= 59) & (second <= 59), 'invalid time')
+    if '%z' in positions:
+        start = positions['%z']
+        check((digit(start + 1) * 10 + digit(start + 2) <= 23) &
+              (digit(start + 4) * 10 + digit(start + 5) <= 59), 'invalid offset')
+
+    # Days since epoch from the civil date (proleptic Gregorian calendar)
+    year -= month <= 2
+    era = np.floor_divide(year, 400)
+    year_of_era = year - era * 400
+    day_of_year = (153 * (month + np.where(month > 2, -3, 9)) + 2) // 5 + day - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    days = (era * 146097 + day_of_era - 719468).astype(np.int64)
+
+    seconds = days * 86400 + (hour * 3600 + minute * 60 + second)
+
+    if '%z' in positions:
+        start = positions['%z']
+        sign = np.where(chars[start] == ord('-'), -1, 1)
+        offset = (digit(start + 1) * 10 + digit(start + 2)) * 3600 + \
+                 (digit(start + 4) * 10 + digit(start + 5)) * 60
+        seconds -= sign * offset
+        return pd.DatetimeIndex(seconds.astype('datetime64[s]')).tz_localize('UTC')
+
+    return pd.DatetimeIndex(seconds.astype('datetime64[s]'))
+
 
 class DataLoader:
-    @staticmethod
+    def __init__(self, source: Union[str, DataSource, None] = None,
+                 cache_dir: Optional[str] = None, validate: bool = True,
+                 repair: bool = False, max_workers: int = 4, **source_options):
+        """
+        Initialize the loader with a market data source.
+
+        Args:
+            source (str | DataSource, optional): Registered source name or instance.
+                Defaults to the ``data_source`` key of the ``[general]`` config section.
+            cache_dir (str, optional): Directory where ingested bars and their
+                validation reports are cached. Cached requests skip both the
+                source and revalidation.
+            validate (bool): Run ingest-time validation on fetched bars
+            repair (bool): Repair issues found by validation instead of only flagging them
+            max_workers (int): Concurrent requests used for long chunked downloads
+            **source_options: Options forwarded to the source constructor when
+                ``source`` is a name (e.g. ``data_dir`` for the csv source)
+        """
+        if source is None:
+            from src.config import config
+            source = config.get('general', 'data_source', 'yfinance')
+        if isinstance(source, str):
+            source = get_data_source(source, **source_options)
+        self.source = source
+        self.cache_dir = cache_dir
+        self.validate = validate
+        self.repair = repair
+        self.max_workers = max_workers
+        self.validation_reports: Dict[str, Dict] = {}
+
     def fetch_data(
+        self,
         symbol: str,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
@@ -13,55 +179,259 @@ class DataLoader:
         interval: str = "1d"
     ) -> pd.DataFrame:
         """
-        Fetch historical market data using yfinance.
-        
+        Fetch historical market data from the configured data source.
+
         Args:
             symbol (str): The stock symbol to fetch data for (e.g., 'AAPL', 'SPY')
             start_date (str, optional): Start date in 'YYYY-MM-DD' format
             end_date (str, optional): End date in 'YYYY-MM-DD' format
             period (str, optional): Valid periods: 1d,5d,1mo,3mo,6mo,1y,2y,5y,10y,ytd,max
             interval (str, optional): Valid intervals: 1m,2m,5m,15m,30m,60m,90m,1h,1d,5d,1wk,1mo,3mo
-            
+
         Returns:
             pd.DataFrame: DataFrame containing the historical market data
         """
         try:
-            ticker = yf.Ticker(symbol)
-            
-            if start_date and end_date:
-                df = ticker.history(start=start_date, end=end_date, interval=interval)
+            request = dict(start_date=start_date, end_date=end_date, period=period, interval=interval)
+            cached = self._load_cached(symbol, request)
+            if cached is not None:
+                return cached
+
+            if self._chunk_windows(request):
+                df = self._fetch_chunked(symbol, request)
             else:
-                df = ticker.history(period=period, interval=interval)
-            
-            if df.empty:
-                raise ValueError(f"No data found for symbol {symbol}")
-            
-            # Reset index to make Date a column
-            df.reset_index(inplace=True)
-            
-            # Ensure all required columns are present
-            required_columns = ['Date', 'Open', 'High', 'Low', 'Close', 'Volume']
-            for col in required_columns:
-                if col not in df.columns:
-                    raise ValueError(f"Missing required column: {col}")
-            
-            return df
-            
+                df = self.source.fetch(symbol, **request)
+            return self._ingest(self._check_bars(df, symbol), symbol, request)
+
         except Exception as e:
             raise Exception(f"Error fetching data for {symbol}: {str(e)}")
 
+    def fetch_many(
+        self,
+        symbols: List[str],
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        period: str = "1y",
+        interval: str = "1d"
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch historical market data for many symbols with one bulk request.
+
+        Args:
+            symbols (List[str]): Symbols to fetch
+            start_date (str, optional): Start date in 'YYYY-MM-DD' format
+            end_date (str, optional): End date in 'YYYY-MM-DD' format
+            period (str, optional): Lookback period used when no dates are given
+            interval (str, optional): Bar interval
+
+        Returns:
+            Dict[str, pd.DataFrame]: Market data keyed by symbol
+        """
+        request = dict(start_date=start_date, end_date=end_date, period=period, interval=interval)
+        frames = {}
+        for symbol in symbols:
+            cached = self._load_cached(symbol, request)
+            if cached is not None:
+                frames[symbol] = cached
+
+        missing = [symbol for symbol in symbols if symbol not in frames]
+        if missing:
+            try:
+                fetched = self.source.fetch_many(missing, **request)
+            except Exception as e:
+                raise Exception(f"Error fetching data for {', '.join(missing)}: {str(e)}")
+
+            for symbol in missing:
+                df = self._check_bars(fetched.get(symbol, pd.DataFrame()), symbol)
+                frames[symbol] = self._ingest(df, symbol, request)
+
+        return {symbol: frames[symbol] for symbol in symbols}
+
+    def _chunk_windows(self, request: Dict) -> List[Tuple[str, str]]:
+        """
+        Split a date-range request into windows the source can serve in one call.
+
+        Returns an empty list when the request fits in a single call.
+        """
+        max_days = self.source.max_request_days.get(request['interval'])
+        if not (max_days and request['start_date'] and request['end_date']):
+            return []
+
+        start = pd.Timestamp(request['start_date'])
+        end = pd.Timestamp(request['end_date'])
+        if end - start <= timedelta(days=max_days):
+            return []
+
+        bounds = list(pd.date_range(start, end, freq=f'{max_days}D'))
+        if bounds[-1] < end:
+            bounds.append(end)
+        return [(lo.strftime('%Y-%m-%d'), hi.strftime('%Y-%m-%d'))
+                for lo, hi in zip(bounds[:-1], bounds[1:])]
+
+    def _fetch_chunked(self, symbol: str, request: Dict) -> pd.DataFrame:
+        """
+        Fetch a long intraday history as concurrent provider-sized chunks.
+
+        Completed chunks are written to ``cache_dir`` as they arrive, so an
+        interrupted download resumes with only the missing chunks. The
+        chunks are stitched into one de-duplicated, monotonic series clipped
+        to the requested ``[start_date, end_date)`` window.
+        """
+        windows = self._chunk_windows(request)
+
+        def fetch_window(window: Tuple[str, str]) -> pd.DataFrame:
+            chunk_request = dict(request, start_date=window[0], end_date=window[1])
+            path = None
+            if self.cache_dir is not None:
+                key = request_key(symbol, **chunk_request)
+                path = os.path.join(self.cache_dir, self.source.name or type(self.source).__name__,
+                                    'chunks', key + '.pkl')
+                if os.path.exists(path):
+                    return pd.read_pickle(path)
+
+            chunk = self.source.fetch(symbol, **chunk_request)
+
+            # Windows reaching into the future are incomplete and not cached
+            if path is not None and pd.Timestamp(window[1]) <= pd.Timestamp.now():
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                chunk.to_pickle(path + '.tmp')
+                os.replace(path + '.tmp', path)
+            return chunk
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            chunks = list(executor.map(fetch_window, windows))
+
+        chunks = [chunk for chunk in chunks if not chunk.empty]
+        if not chunks:
+            return pd.DataFrame()
+
+        df = pd.concat(chunks, ignore_index=True)
+        df = df.drop_duplicates('Date', keep='last').sort_values('Date', kind='stable')
+
+        # Providers may return bars past a window's end; keep [start_date, end_date)
+        dates = pd.to_datetime(df['Date'])
+        start, end = pd.Timestamp(request['start_date']), pd.Timestamp(request['end_date'])
+        if dates.dt.tz is not None:
+            start, end = start.tz_localize(dates.dt.tz), end.tz_localize(dates.dt.tz)
+        df = df[(dates >= start) & (dates < end)]
+        return df.reset_index(drop=True)
+
+    def _cache_paths(self, symbol: str, request: Dict) -> Tuple[str, str]:
+        """Return the cached data and validation report paths for a request"""
+        key = request_key(symbol, **request)
+        if not (request['start_date'] and request['end_date']):
+            # Period requests are relative to today, so they are cached per day
+            key += f"__{datetime.now().strftime('%Y-%m-%d')}"
+        base = os.path.join(self.cache_dir, self.source.name or type(self.source).__name__, key)
+        return base + '.pkl', base + '.validation.json'
+
+    def _load_cached(self, symbol: str, request: Dict) -> Optional[pd.DataFrame]:
+        """Load previously ingested bars, skipping revalidation when a matching report exists"""
+        if self.cache_dir is None:
+            return None
+
+        data_path, report_path = self._cache_paths(symbol, request)
+        if not os.path.exists(data_path):
+            return None
+
+        if self.validate:
+            if not os.path.exists(report_path):
+                return None
+            with open(report_path) as f:
+                report = json.load(f)
+            if report.get('repaired') != self.repair:
+                return None
+            self.validation_reports[symbol] = report
+
+        return pd.read_pickle(data_path)
+
+    def _ingest(self, df: pd.DataFrame, symbol: str, request: Dict) -> pd.DataFrame:
+        """Validate freshly fetched bars and write them (with their report) to the cache"""
+        report = None
+        if self.validate:
+            df, report = validate_bars(df, repair=self.repair)
+            self.validation_reports[symbol] = report
+
+        if self.cache_dir is not None:
+            data_path, report_path = self._cache_paths(symbol, request)
+            os.makedirs(os.path.dirname(data_path), exist_ok=True)
+            df.to_pickle(data_path)
+            if report is not None:
+                with open(report_path, 'w') as f:
+                    json.dump(report, f, indent=2)
+
+        return df
+
+    @staticmethod
+    def _check_bars(df: pd.DataFrame, symbol: str) -> pd.DataFrame:
+        """Ensure a source returned data with all required columns"""
+        if df.empty:
+            raise ValueError(f"No data found for symbol {symbol}")
+
+        # Ensure all required columns are present
+        for col in REQUIRED_COLUMNS:
+            if col not in df.columns:
+                raise ValueError(f"Missing required column: {col}")
+
+        return df
+
+    @staticmethod
+    def read_csv_chunks(
+        filepath: str,
+        chunksize: int = 1_000_000,
+        dtypes: Optional[Dict[str, str]] = None,
+        date_column: str = 'Date',
+        date_format: Optional[str] = '%Y-%m-%d',
+        usecols: Optional[List[str]] = None
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Stream a bar CSV file in fixed-size chunks.
+
+        Column types are given explicitly (``BAR_DTYPES`` by default) so pandas
+        never has to infer them, and the date column is read as raw text and
+        decoded with ``parse_fixed_timestamps``. Only one chunk is held in
+        memory at a time, so files larger than RAM can feed chunked backtests
+        or be converted into a binary store.
+
+        Args:
+            filepath (str): Path to the CSV file
+            chunksize (int): Number of rows per yielded chunk
+            dtypes (Dict[str, str], optional): Column types, merged over ``BAR_DTYPES``
+            date_column (str): Name of the timestamp column
+            date_format (str, optional): Fixed timestamp layout, e.g. '%Y-%m-%d %H:%M:%S%z'.
+                ``None`` falls back to ``pd.to_datetime`` inference.
+            usecols (List[str], optional): Subset of columns to read
+
+        Yields:
+            pd.DataFrame: Consecutive chunks with a parsed date column
+        """
+        column_types = dict(BAR_DTYPES)
+        column_types.update(dtypes or {})
+        column_types[date_column] = 'object'
+
+        reader = pd.read_csv(filepath, chunksize=chunksize, dtype=column_types,
+                             usecols=usecols, engine='c', low_memory=False)
+        with reader:
+            for chunk in reader:
+                raw_dates = chunk[date_column].to_numpy()
+                if date_format is None:
+                    chunk[date_column] = pd.to_datetime(raw_dates)
+                else:
+                    chunk[date_column] = parse_fixed_timestamps(raw_dates, date_format)
+                yield chunk
+
     @staticmethod
     def save_to_csv(df: pd.DataFrame, symbol: str) -> str:
         """
         Save the DataFrame to a CSV file in the data directory.
-        
+
         Args:
             df (pd.DataFrame): DataFrame containing the market data
             symbol (str): The stock symbol
-            
+
         Returns:
             str: Path to the saved CSV file
         """
         filepath = f"data/{symbol}.csv"
         df.to_csv(filepath, index=False)
-        return filepath
\ No newline at end of file
+        return filepath
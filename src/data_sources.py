@@ -0,0 +1,366 @@
+from abc import ABC, abstractmethod
+import os
+import re
+import pandas as pd
+from typing import Callable, Dict, List, Optional
+from src.bar_store import PartitionedBarStore
+
+REQUIRED_COLUMNS = ['Date', 'Open', 'High', 'Low', 'Close', 'Volume']
+
+# Registry of data source classes, keyed by the name used in config.ini
+DATA_SOURCES: Dict[str, type] = {}
+
+
+def register_data_source(name: str) -> Callable[[type], type]:
+    """
+    Class decorator registering a DataSource under ``name``.
+
+    Args:
+        name (str): Name used to select the source (e.g. ``data_source = csv``)
+
+    Returns:
+        Callable: Decorator returning the class unchanged
+    """
+    def decorator(cls: type) -> type:
+        cls.name = name
+        DATA_SOURCES[name] = cls
+        return cls
+    return decorator
+
+
+def get_data_source(name: str, **options) -> 'DataSource':
+    """
+    Instantiate a registered data source by name.
+
+    Args:
+        name (str): Registered source name (yfinance, csv, replay, ...)
+        **options: Keyword arguments forwarded to the source constructor
+
+    Returns:
+        DataSource: Configured data source instance
+    """
+    try:
+        source_cls = DATA_SOURCES[name]
+    except KeyError:
+        available = ', '.join(sorted(DATA_SOURCES))
+        raise ValueError(f"Unknown data source '{name}'. Available sources: {available}")
+    return source_cls(**options)
+
+
+class DataSource(ABC):
+    """Interface every market data provider implements"""
+
+    name: str = None
+
+    # Longest date range (in days) a single request may span, per interval.
+    # Longer requests are split into chunks by DataLoader.
+    max_request_days: Dict[str, int] = {}
+
+    @abstractmethod
+    def fetch(self, symbol: str, start_date: Optional[str] = None,
+              end_date: Optional[str] = None, period: str = "1y",
+              interval: str = "1d") -> pd.DataFrame:
+        """
+        Fetch bars for a single symbol.
+
+        Must be implemented by concrete sources. The returned frame has a
+        ``Date`` column followed by at least Open, High, Low, Close and Volume.
+
+        Args:
+            symbol (str): Symbol to load
+            start_date (str, optional): Start date in 'YYYY-MM-DD' format
+            end_date (str, optional): End date in 'YYYY-MM-DD' format
+            period (str): Lookback period used when no dates are given
+            interval (str): Bar interval
+
+        Returns:
+            pd.DataFrame: Historical bars (empty if nothing is available)
+        """
+        pass
+
+    def fetch_many(self, symbols: List[str], start_date: Optional[str] = None,
+                   end_date: Optional[str] = None, period: str = "1y",
+                   interval: str = "1d") -> Dict[str, pd.DataFrame]:
+        """
+        Fetch bars for many symbols in one call.
+
+        The default implementation loops over ``fetch``; sources with a
+        native bulk endpoint override it.
+
+        Returns:
+            Dict[str, pd.DataFrame]: Bars keyed by symbol
+        """
+        return {
+            symbol: self.fetch(symbol, start_date=start_date, end_date=end_date,
+                               period=period, interval=interval)
+            for symbol in symbols
+        }
+
+
+def request_key(symbol: str, start_date: Optional[str] = None,
+                end_date: Optional[str] = None, period: str = "1y",
+                interval: str = "1d") -> str:
+    """
+    Build a filesystem-safe key identifying a data request.
+
+    Args:
+        symbol (str): Requested symbol
+        start_date (str, optional): Start date of the request
+        end_date (str, optional): End date of the request
+        period (str): Period used when no dates are given
+        interval (str): Bar interval
+
+    Returns:
+        str: Key such as ``AAPL__1d__2023-01-01_2023-12-31``
+    """
+    window = f"{start_date}_{end_date}" if start_date and end_date else period
+    key = f"{symbol}__{interval}__{window}"
+    return re.sub(r'[^A-Za-z0-9_.=-]', '-', key)
+
+
+def _period_start(last_date: pd.Timestamp, period: str) -> Optional[pd.Timestamp]:
+    """Translate a yfinance-style period ('5d', '6mo', '2y', 'ytd', 'max') into a start date"""
+    if period in (None, 'max'):
+        return None
+    if period == 'ytd':
+        return last_date.replace(month=1, day=1, hour=0, minute=0, second=0, microsecond=0)
+
+    match = re.fullmatch(r'(\d+)(d|wk|mo|y)', period)
+    if match is None:
+        raise ValueError(f"Unsupported period: {period}")
+
+    count, unit = int(match.group(1)), match.group(2)
+    offsets = {
+        'd': pd.DateOffset(days=count),
+        'wk': pd.DateOffset(weeks=count),
+        'mo': pd.DateOffset(months=count),
+        'y': pd.DateOffset(years=count),
+    }
+    return last_date - offsets[unit]
+
+
+def _to_bound(date: Optional[str], tz) -> Optional[pd.Timestamp]:
+    """Convert a date string into a timestamp comparable with a (possibly tz-aware) Date column"""
+    if date is None:
+        return None
+    ts = pd.Timestamp(date)
+    if tz is not None and ts.tzinfo is None:
+        ts = ts.tz_localize(tz)
+    return ts
+
+
+def _parse_dates(values: pd.Series) -> pd.Series:
+    """Parse a Date column, normalising mixed UTC offsets (e.g. across DST) to UTC"""
+    try:
+        dates = pd.to_datetime(values)
+    except ValueError:
+        dates = None
+    if dates is None or not pd.api.types.is_datetime64_any_dtype(dates):
+        dates = pd.to_datetime(values, utc=True)
+    return dates
+
+
+def slice_bars(df: pd.DataFrame, start_date: Optional[str] = None,
+               end_date: Optional[str] = None, period: str = "1y") -> pd.DataFrame:
+    """
+    Apply yfinance request semantics to locally stored bars.
+
+    ``start_date`` is inclusive and ``end_date`` exclusive, as with
+    ``Ticker.history``. Without explicit dates the trailing ``period`` is kept.
+
+    Args:
+        df (pd.DataFrame): Bars with a datetime ``Date`` column
+        start_date (str, optional): Inclusive start date
+        end_date (str, optional): Exclusive end date
+        period (str): Trailing period used when no dates are given
+
+    Returns:
+        pd.DataFrame: Selected bars with a fresh RangeIndex
+    """
+    if df.empty:
+        return df
+
+    dates = df['Date']
+    tz = dates.dt.tz
+    mask = pd.Series(True, index=df.index)
+
+    if start_date or end_date:
+        start = _to_bound(start_date, tz)
+        end = _to_bound(end_date, tz)
+        if start is not None:
+            mask &= dates >= start
+        if end is not None:
+            mask &= dates < end
+    else:
+        start = _period_start(dates.iloc[-1], period)
+        if start is not None:
+            mask &= dates > start
+
+    return df.loc[mask].reset_index(drop=True)
+
+
+@register_data_source('yfinance')
+class YFinanceDataSource(DataSource):
+    """Yahoo Finance data via the yfinance package"""
+
+    # Yahoo only serves 7 days of 1m bars and 60 days of other sub-hourly bars per request
+    max_request_days = {
+        '1m': 7, '2m': 59, '5m': 59, '15m': 59, '30m': 59, '90m': 59,
+        '60m': 729, '1h': 729,
+    }
+
+    def fetch(self, symbol: str, start_date: Optional[str] = None,
+              end_date: Optional[str] = None, period: str = "1y",
+              interval: str = "1d") -> pd.DataFrame:
+        import yfinance as yf
+
+        ticker = yf.Ticker(symbol)
+
+        if start_date and end_date:
+            df = ticker.history(start=start_date, end=end_date, interval=interval)
+        else:
+            df = ticker.history(period=period, interval=interval)
+
+        # Reset index to make Date a column (intraday bars are indexed by 'Datetime')
+        return df.reset_index().rename(columns={'Datetime': 'Date'})
+
+    def fetch_many(self, symbols: List[str], start_date: Optional[str] = None,
+                   end_date: Optional[str] = None, period: str = "1y",
+                   interval: str = "1d") -> Dict[str, pd.DataFrame]:
+        """Download all symbols with a single threaded ``yf.download`` request"""
+        import yfinance as yf
+
+        if start_date and end_date:
+            window = dict(start=start_date, end=end_date)
+        else:
+            window = dict(period=period)
+
+        raw = yf.download(list(symbols), interval=interval, group_by='ticker',
+                          auto_adjust=True, actions=True, threads=True,
+                          progress=False, **window)
+
+        frames = {}
+        for symbol in symbols:
+            if isinstance(raw.columns, pd.MultiIndex):
+                if symbol not in raw.columns.get_level_values(0):
+                    frames[symbol] = pd.DataFrame()
+                    continue
+                df = raw[symbol]
+            else:
+                df = raw
+            df = df.dropna(how='all')
+            df.columns.name = None
+            frames[symbol] = df.reset_index().rename(columns={'Datetime': 'Date'})
+        return frames
+
+
+@register_data_source('csv')
+class CSVDataSource(DataSource):
+    """
+    Offline bars read from a local directory such as ``data/``.
+
+    For each request the first existing file of ``{symbol}_{interval}.parquet``,
+    ``{symbol}_{interval}.csv``, ``{symbol}.parquet`` and ``{symbol}.csv`` is
+    loaded. Parquet files require pyarrow (or fastparquet).
+    """
+
+    def __init__(self, data_dir: str = "data"):
+        self.data_dir = data_dir
+
+    def _find_file(self, symbol: str, interval: str) -> Optional[str]:
+        for stem in (f"{symbol}_{interval}", symbol):
+            for ext in ('.parquet', '.csv'):
+                path = os.path.join(self.data_dir, stem + ext)
+                if os.path.exists(path):
+                    return path
+        return None
+
+    def read_file(self, path: str) -> pd.DataFrame:
+        """Read one stored bar file and parse its Date column"""
+        if path.endswith('.parquet'):
+            df = pd.read_parquet(path)
+        else:
+            df = pd.read_csv(path)
+
+        if 'Date' in df.columns and not pd.api.types.is_datetime64_any_dtype(df['Date']):
+            df['Date'] = _parse_dates(df['Date'])
+        return df
+
+    def fetch(self, symbol: str, start_date: Optional[str] = None,
+              end_date: Optional[str] = None, period: str = "1y",
+              interval: str = "1d") -> pd.DataFrame:
+        path = self._find_file(symbol, interval)
+        if path is None:
+            return pd.DataFrame()
+        return slice_bars(self.read_file(path), start_date, end_date, period)
+
+
+@register_data_source('store')
+class StoreDataSource(DataSource):
+    """
+    Offline bars read from a ``PartitionedBarStore``.
+
+    Date-range requests only open the partitions overlapping the range, which
+    keeps walk-forward and rolling-window jobs cheap on long histories.
+    """
+
+    def __init__(self, root: str = "data/store", partition: str = "year"):
+        self.store = PartitionedBarStore(root, partition)
+
+    def fetch(self, symbol: str, start_date: Optional[str] = None,
+              end_date: Optional[str] = None, period: str = "1y",
+              interval: str = "1d") -> pd.DataFrame:
+        if symbol not in self.store.symbols():
+            return pd.DataFrame()
+
+        if not (start_date or end_date):
+            start_date = _period_start(self.store.last_timestamp(symbol), period)
+            if start_date is not None:
+                # Trailing periods exclude the start instant, as in slice_bars
+                start_date = start_date + pd.Timedelta(1, 'ns')
+        return self.store.read(symbol, start_date, end_date)
+
+
+@register_data_source('replay')
+class ReplayDataSource(DataSource):
+    """
+    Replays previously recorded provider responses.
+
+    Each request is stored as a pickle named after its parameters, so a run
+    recorded once against yfinance can be repeated offline with identical
+    input. With ``record=True`` missing responses are fetched from
+    ``upstream`` and written to ``recordings_dir``; otherwise a missing
+    recording is an error.
+    """
+
+    def __init__(self, recordings_dir: str = "data/recordings",
+                 upstream: Optional[object] = None, record: bool = False):
+        self.recordings_dir = recordings_dir
+        self.record = record
+        if isinstance(upstream, str):
+            upstream = get_data_source(upstream)
+        self.upstream = upstream
+
+    def recording_path(self, symbol: str, start_date: Optional[str] = None,
+                       end_date: Optional[str] = None, period: str = "1y",
+                       interval: str = "1d") -> str:
+        """Path of the recording that answers the given request"""
+        key = request_key(symbol, start_date, end_date, period, interval)
+        return os.path.join(self.recordings_dir, key + '.pkl')
+
+    def fetch(self, symbol: str, start_date: Optional[str] = None,
+              end_date: Optional[str] = None, period: str = "1y",
+              interval: str = "1d") -> pd.DataFrame:
+        path = self.recording_path(symbol, start_date, end_date, period, interval)
+
+        if os.path.exists(path):
+            return pd.read_pickle(path)
+
+        if not self.record or self.upstream is None:
+            raise ValueError(f"No recorded response for {symbol} at {path}")
+
+        df = self.upstream.fetch(symbol, start_date=start_date, end_date=end_date,
+                                 period=period, interval=interval)
+        os.makedirs(self.recordings_dir, exist_ok=True)
+        df.to_pickle(path)
+        return df
@@ -0,0 +1,183 @@
+import numpy as np
+import pandas as pd
+from pandas.tseries.holiday import (AbstractHolidayCalendar, GoodFriday, Holiday, USLaborDay,
+                                    USMartinLutherKingJr, USMemorialDay, USPresidentsDay,
+                                    USThanksgivingDay, nearest_workday, sunday_to_monday)
+from typing import Dict, Optional, Sequence, Tuple
+
+PRICE_COLUMNS = ['Open', 'High', 'Low', 'Close']
+
+# Maximum number of example gap timestamps kept in a report
+MAX_REPORTED_GAPS = 20
+
+
+class ExchangeHolidayCalendar(AbstractHolidayCalendar):
+    """Regular NYSE full-day holidays (one-off closures are not included)"""
+    rules = [
+        Holiday('New Years Day', month=1, day=1, observance=sunday_to_monday),
+        USMartinLutherKingJr,
+        USPresidentsDay,
+        GoodFriday,
+        USMemorialDay,
+        Holiday('Juneteenth', month=6, day=19, start_date='2022-06-19', observance=nearest_workday),
+        Holiday('Independence Day', month=7, day=4, observance=nearest_workday),
+        USLaborDay,
+        USThanksgivingDay,
+        Holiday('Christmas', month=12, day=25, observance=nearest_workday),
+    ]
+
+
+def validate_bars(df: pd.DataFrame, repair: bool = False,
+                  holidays: Optional[Sequence] = None) -> Tuple[pd.DataFrame, Dict]:
+    """
+    Validate and optionally normalize a frame of OHLCV bars.
+
+    All checks are vectorized over the full frame and run once at ingest:
+    missing values, non-monotonic and duplicate timestamps, gaps in the bar
+    calendar, zero volumes, non-positive prices, inconsistent High/Low and
+    unadjusted stock splits (from the ``Stock Splits`` column).
+
+    With ``repair=True`` the frame is sorted by date, duplicate timestamps
+    keep their last bar, High/Low are widened to contain Open/Close, missing
+    prices are forward-filled and prices/volumes before an unadjusted split are
+    back-adjusted. Gaps, zero volumes and non-positive prices are only flagged.
+
+    Args:
+        df (pd.DataFrame): Bars with Date, Open, High, Low, Close and Volume columns
+        repair (bool): Whether to fix repairable issues
+        holidays (Sequence, optional): Exchange holidays of daily bars, which are
+            not gaps. Defaults to ``ExchangeHolidayCalendar``; pass ``[]`` to
+            check against plain weekdays.
+
+    Returns:
+        Tuple[pd.DataFrame, Dict]: The (possibly repaired) bars and a JSON-serializable report
+    """
+    df = df.copy()
+    deltas = np.diff(_datetime_values(df['Date']).view('int64'))
+
+    report = {
+        'rows': int(len(df)),
+        'repaired': bool(repair),
+        'missing_values': {col: int(n) for col, n in df[PRICE_COLUMNS + ['Volume']].isna().sum().items() if n},
+        'non_monotonic_dates': int((deltas < 0).sum()),
+        'duplicate_dates': int(df['Date'].duplicated().sum()),
+    }
+
+    if repair:
+        if report['non_monotonic_dates']:
+            df = df.sort_values('Date', kind='stable')
+        if report['duplicate_dates']:
+            df = df.drop_duplicates('Date', keep='last')
+        df = df.reset_index(drop=True)
+        if report['missing_values']:
+            df[PRICE_COLUMNS] = df[PRICE_COLUMNS].ffill()
+
+    report['gaps'] = _find_gaps(df['Date'], holidays)
+
+    volume = df['Volume'].to_numpy()
+    prices = df[PRICE_COLUMNS].to_numpy(dtype=float)
+    open_, high, low, close = prices.T
+    body_high = np.fmax(open_, close)
+    body_low = np.fmin(open_, close)
+
+    report['zero_volume'] = int((volume == 0).sum())
+    report['non_positive_prices'] = int((prices <= 0).any(axis=1).sum())
+    report['high_low_inconsistent'] = int(((high < body_high) | (low > body_low) | (high < low)).sum())
+
+    if repair and report['high_low_inconsistent']:
+        df['High'] = np.fmax(np.fmax(high, low), body_high)
+        df['Low'] = np.fmin(np.fmin(high, low), body_low)
+
+    df, report['unadjusted_splits'] = _check_splits(df, repair)
+
+    report['issues'] = int(
+        sum(report['missing_values'].values()) + report['non_monotonic_dates'] +
+        report['duplicate_dates'] + report['gaps']['count'] + report['zero_volume'] +
+        report['non_positive_prices'] + report['high_low_inconsistent'] +
+        len(report['unadjusted_splits'])
+    )
+    return df, report
+
+
+def _datetime_values(dates: pd.Series, wall_time: bool = False) -> np.ndarray:
+    """Return dates as naive datetime64[ns] values, in UTC or in local wall time"""
+    if dates.dt.tz is not None:
+        dates = dates.dt.tz_localize(None) if wall_time else dates.dt.tz_convert('UTC').dt.tz_localize(None)
+    return dates.to_numpy().astype('datetime64[ns]')
+
+
+def _find_gaps(dates: pd.Series, holidays: Optional[Sequence] = None) -> Dict:
+    """
+    Detect missing bars.
+
+    Daily (or coarser) data is checked against the business-day calendar
+    without exchange holidays; intraday data against the median bar spacing
+    within a session.
+    """
+    if len(dates) < 3:
+        return {'count': 0, 'first': []}
+
+    values = _datetime_values(dates, wall_time=True)
+    deltas = np.diff(values.view('int64'))
+    step = np.median(deltas)
+
+    if step >= np.timedelta64(1, 'D') / np.timedelta64(1, 'ns'):
+        days = values.astype('datetime64[D]')
+        if holidays is None:
+            holidays = ExchangeHolidayCalendar().holidays(days.min(), days.max())
+        holidays = np.asarray(pd.DatetimeIndex(holidays).values, dtype='datetime64[D]')
+        is_gap = np.busday_count(days[:-1], days[1:], holidays=holidays) > max(1, round(step / 86_400e9 * 5 / 7))
+    else:
+        same_session = values[1:].astype('datetime64[D]') == values[:-1].astype('datetime64[D]')
+        is_gap = same_session & (deltas > 1.5 * step)
+
+    gap_starts = dates.iloc[:-1][is_gap]
+    return {
+        'count': int(is_gap.sum()),
+        'first': [str(ts) for ts in gap_starts.iloc[:MAX_REPORTED_GAPS]],
+    }
+
+
+def _check_splits(df: pd.DataFrame, repair: bool) -> Tuple[pd.DataFrame, list]:
+    """
+    Find splits whose price discontinuity is still present in the data.
+
+    A split of ratio ``s`` is considered unadjusted when the close-to-close
+    move on the split date is closer to ``1/s`` than to 1 in log space.
+    Repair divides earlier prices by the cumulative split ratio and multiplies
+    earlier volumes by it.
+    """
+    if 'Stock Splits' not in df.columns or len(df) < 2:
+        return df, []
+
+    ratios = df['Stock Splits'].fillna(0).to_numpy(dtype=float)
+    close = df['Close'].to_numpy(dtype=float)
+
+    prev_close = np.empty_like(close)
+    prev_close[0] = np.nan
+    prev_close[1:] = close[:-1]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        move = np.log(close / prev_close)
+        expected = -np.log(np.where(ratios > 0, ratios, 1.0))
+
+    is_split = (ratios > 0) & (ratios != 1)
+    unadjusted = is_split & (np.abs(move - expected) < np.abs(move))
+
+    splits = [
+        {'date': str(date), 'ratio': float(ratio)}
+        for date, ratio in zip(df['Date'][unadjusted], ratios[unadjusted])
+    ]
+
+    if repair and splits:
+        # Factor for each bar = product of all unadjusted split ratios after it
+        factors = np.where(unadjusted, ratios, 1.0)
+        after = np.cumprod(factors[::-1])[::-1]
+        adjustment = np.empty_like(after)
+        adjustment[:-1] = after[1:]
+        adjustment[-1] = 1.0
+
+        df[PRICE_COLUMNS] = df[PRICE_COLUMNS].to_numpy(dtype=float) / adjustment[:, None]
+        volume = df['Volume'].to_numpy() * adjustment
+        df['Volume'] = np.rint(volume).astype(df['Volume'].dtype) if df['Volume'].dtype.kind in 'iu' else volume
+
+    return df, splits
@@ -0,0 +1,115 @@
+import numpy as np
+import pandas as pd
+from typing import Optional
+
+# Default point budget per plotted line when [plotting] max_plot_points is not set
+MAX_PLOT_POINTS = 5000
+
+
+def plot_budget() -> int:
+    """Point budget per line from the ``[plotting]`` config section"""
+    from src.config import config
+    return int(config.get('plotting', 'max_plot_points', MAX_PLOT_POINTS))
+
+
+def lttb_indices(y, n_out: int, x=None) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets selection (Steinarsson, 2013).
+
+    The first and last points are always kept; the points in between are
+    split into ``n_out - 2`` buckets and each bucket keeps the point forming
+    the largest triangle with the previously kept point and the average of
+    the next bucket. Bucket averages come from prefix sums, so the only loop
+    is one vectorized argmax per bucket.
+
+    Args:
+        y: Values
+        n_out (int): Number of points to keep
+        x: Optional positions (default: evenly spaced)
+
+    Returns:
+        np.ndarray: Sorted indices of the kept points
+    """
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = np.arange(n, dtype=float) if x is None else np.asarray(x, dtype=float)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    y_filled = np.nan_to_num(y)
+    prefix_x = np.concatenate([[0.0], np.cumsum(x)])
+    prefix_y = np.concatenate([[0.0], np.cumsum(y_filled)])
+    counts = np.diff(edges)
+    avg_x = np.append((prefix_x[edges[1:]] - prefix_x[edges[:-1]]) / counts, x[-1])
+    avg_y = np.append((prefix_y[edges[1:]] - prefix_y[edges[:-1]]) / counts, y_filled[-1])
+
+    selected = np.empty(n_out, dtype=int)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for bucket in range(n_out - 2):
+        lo, hi = edges[bucket], edges[bucket + 1]
+        next_x, next_y = avg_x[bucket + 1], avg_y[bucket + 1]
+        area = np.abs((x[a] - next_x) * (y_filled[lo:hi] - y_filled[a])
+                      - (x[a] - x[lo:hi]) * (next_y - y_filled[a]))
+        a = lo + int(np.argmax(area))
+        selected[bucket + 1] = a
+    return selected
+
+
+def minmax_indices(y, n_buckets: int) -> np.ndarray:
+    """
+    Positions of the minimum and maximum of each of ``n_buckets`` equal-width buckets.
+
+    Keeping both extremes preserves the visual envelope of the line (spikes
+    and gaps that LTTB alone can smooth over).
+
+    Returns:
+        np.ndarray: Sorted unique indices
+    """
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n_buckets <= 0 or n == 0:
+        return np.arange(0)
+    width = -(-n // n_buckets)
+    rows = -(-n // width)
+    padded = np.full(rows * width, np.nan)
+    padded[:n] = y
+    padded = padded.reshape(rows, width)
+    offsets = np.arange(rows) * width
+    lows = offsets + np.argmin(np.where(np.isnan(padded), np.inf, padded), axis=1)
+    highs = offsets + np.argmax(np.where(np.isnan(padded), -np.inf, padded), axis=1)
+    return np.unique(np.concatenate([lows, highs]))
+
+
+def downsample_indices(y, max_points: Optional[int] = None, keep=None) -> np.ndarray:
+    """
+    Indices of a line to plot within a point budget.
+
+    Series within the budget are returned whole. Longer series keep the
+    union of an LTTB selection (half the budget, for the shape) and a
+    min/max envelope (the other half, for the extremes), plus every index
+    flagged in ``keep`` such as trade signals.
+
+    Args:
+        y: Values of the line
+        max_points (int, optional): Point budget (default: ``plot_budget()``)
+        keep: Optional boolean mask of points that must be kept
+
+    Returns:
+        np.ndarray: Sorted positional indices
+    """
+    max_points = plot_budget() if max_points is None else max_points
+    n = len(y)
+    if n <= max_points:
+        return np.arange(n)
+    indices = np.union1d(lttb_indices(y, max_points // 2), minmax_indices(y, max_points // 4))
+    if keep is not None:
+        indices = np.union1d(indices, np.flatnonzero(np.asarray(keep, dtype=bool)))
+    return indices
+
+
+def downsample_frame(frame: pd.DataFrame, column: str, max_points: Optional[int] = None,
+                     keep=None) -> pd.DataFrame:
+    """Rows of ``frame`` selected by ``downsample_indices`` on one column"""
+    return frame.iloc[downsample_indices(frame[column], max_points, keep)]
@@ -0,0 +1,299 @@
+import matplotlib.pyplot as plt
+import matplotlib.dates as mdates
+from matplotlib.cm import ScalarMappable
+from matplotlib.colors import Normalize
+import numpy as np
+import pandas as pd
+from typing import Dict, Optional, Tuple
+import os
+from src.downsampling import downsample_frame, downsample_indices
+from src.drawdown import drawdown_episodes, drawdown_series
+
+# Bins of the dashboard's daily returns histogram
+RETURN_BINS = 30
+
+# Templates created in this process, keyed by kind and settings
+_templates: Dict[Tuple, object] = {}
+
+
+def dashboard_template(visualizer) -> 'DashboardTemplate':
+    """Per-process ``DashboardTemplate`` for an ``AdvancedVisualizer``'s colors and dpi"""
+    key = ('dashboard', visualizer.dpi, tuple(sorted(visualizer.colors.items())))
+    if key not in _templates:
+        _templates[key] = DashboardTemplate(visualizer.colors, visualizer.dpi)
+    return _templates[key]
+
+
+def risk_template(analyzer) -> 'RiskAnalysisTemplate':
+    """Per-process ``RiskAnalysisTemplate`` drawing with a ``RiskAnalyzer``'s panel methods"""
+    key = ('risk',)
+    if key not in _templates:
+        _templates[key] = RiskAnalysisTemplate(analyzer)
+    return _templates[key]
+
+
+def clear_templates() -> None:
+    """Close every template figure of this process"""
+    for template in _templates.values():
+        plt.close(template.fig)
+    _templates.clear()
+
+
+class DashboardTemplate:
+    """
+    The comprehensive dashboard figure, built once and refilled per symbol.
+
+    Figure, gridspec, axes, styling, legends and the metrics table are
+    created in the constructor. ``render`` only swaps line data, scatter
+    offsets, histogram bar geometry, the drawdown polygon and text before
+    saving, so rendering one symbol after another produces the same image as
+    a freshly built template.
+    """
+
+    def __init__(self, colors: Dict[str, str], dpi: int = 300):
+        self.colors = colors
+        self.dpi = dpi
+        self.fig = plt.figure(figsize=(20, 14))
+        self.title = self.fig.suptitle('', fontsize=20, fontweight='bold', y=0.95)
+        gs = self.fig.add_gridspec(4, 4, hspace=0.3, wspace=0.3)
+
+        # 1. Price action and signals
+        ax = self.price_ax = self.fig.add_subplot(gs[0:2, :2])
+        ax.xaxis_date()
+        self.price, = ax.plot([], [], label='Price', color=colors['price'], linewidth=1.5, alpha=0.8)
+        self.sma_short, = ax.plot([], [], label='SMA Short', color=colors['sma_short'], linewidth=1.2, alpha=0.8)
+        self.sma_long, = ax.plot([], [], label='SMA Long', color=colors['sma_long'], linewidth=1.2, alpha=0.8)
+        self.buys = ax.scatter([], [], marker='^', color=colors['buy'], s=100, label='Buy Signal', zorder=5, alpha=0.8)
+        self.sells = ax.scatter([], [], marker='v', color=colors['sell'], s=100, label='Sell Signal', zorder=5, alpha=0.8)
+        self.price_title = ax.set_title('', fontsize=14, fontweight='bold')
+        ax.set_ylabel('Price ($)', fontsize=12)
+        ax.legend(loc='upper left', framealpha=0.9)
+        self._format_dates(ax)
+
+        # 2. Portfolio performance
+        ax = self.performance_ax = self.fig.add_subplot(gs[0:2, 2:])
+        ax.xaxis_date()
+        self.strategy, = ax.plot([], [], label='Strategy', color=colors['portfolio'], linewidth=2.5)
+        self.buy_hold, = ax.plot([], [], label='Buy & Hold', color=colors['price'], linewidth=1.5, alpha=0.7, linestyle='--')
+        self.performance_text = ax.text(0.02, 0.98, '', transform=ax.transAxes, fontsize=10, verticalalignment='top',
+                                        bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
+        ax.set_title('Portfolio Performance vs Buy & Hold', fontsize=14, fontweight='bold')
+        ax.set_ylabel('Cumulative Returns', fontsize=12)
+        ax.legend(loc='upper left')
+        self._format_dates(ax)
+
+        # 3. Returns distribution
+        ax = self.returns_ax = self.fig.add_subplot(gs[2, :2])
+        _, _, self.bars = ax.hist(np.zeros(1), bins=RETURN_BINS, alpha=0.7, color=colors['portfolio'],
+                                  edgecolor='black', linewidth=0.5)
+        self.normal, = ax.plot([], [], 'r--', linewidth=2, label='Normal Distribution')
+        self.mean_line = ax.axvline(0, color='red', linestyle='-', linewidth=2, alpha=0.8, label='Mean')
+        self.upper_line = ax.axvline(0, color='orange', linestyle='--', alpha=0.8, label='+1σ')
+        self.lower_line = ax.axvline(0, color='orange', linestyle='--', alpha=0.8, label='-1σ')
+        ax.set_title('Daily Returns Distribution', fontsize=14, fontweight='bold')
+        ax.set_xlabel('Daily Return (%)', fontsize=12)
+        ax.set_ylabel('Frequency', fontsize=12)
+        self.returns_legend = ax.legend(fontsize=9)
+        ax.grid(True, alpha=0.3)
+
+        # 4. Drawdown
+        ax = self.drawdown_ax = self.fig.add_subplot(gs[2, 2:])
+        ax.xaxis_date()
+        self.drawdown_fill = ax.fill_between([], [], 0, color=colors['sell'], alpha=0.3, label='Drawdown')
+        self.drawdown, = ax.plot([], [], color=colors['sell'], linewidth=1.5)
+        self.max_drawdown = ax.scatter([], [], color='red', s=100, zorder=5, label='Max DD')
+        ax.set_title('Drawdown Analysis', fontsize=14, fontweight='bold')
+        ax.set_ylabel('Drawdown (%)', fontsize=12)
+        self.drawdown_legend = ax.legend()
+        self._format_dates(ax)
+
+        # 5. Metrics table (built on first render, when the metric names are known)
+        self.table_ax = self.fig.add_subplot(gs[3, :])
+        self.table_ax.axis('off')
+        self.table_title = self.table_ax.set_title('', fontsize=14, fontweight='bold', pad=20)
+        self.table = None
+        self.table_keys = None
+
+    def render(self, results: pd.DataFrame, symbol: str, metrics: Dict, save_path: Optional[str] = None) -> None:
+        """
+        Refill the template with one backtest and save it.
+
+        Args:
+            results: Backtest results
+            symbol: Stock symbol
+            metrics: Performance metrics
+            save_path: Optional output file
+        """
+        self.title.set_text(f'{symbol} - Comprehensive Backtesting Dashboard')
+        self._update_price(results, symbol)
+        self._update_performance(results, metrics)
+        self._update_returns(results)
+        self._update_drawdown(results)
+        self._update_table(metrics, symbol)
+        for ax in (self.price_ax, self.performance_ax, self.returns_ax, self.drawdown_ax):
+            ax.relim()
+            ax.autoscale_view()
+
+        if save_path:
+            os.makedirs(os.path.dirname(save_path) if os.path.dirname(save_path) else 'plots', exist_ok=True)
+            self.fig.savefig(save_path, dpi=self.dpi, bbox_inches='tight', facecolor='white', edgecolor='none')
+            print(f"Dashboard saved to: {save_path}")
+
+    def _update_price(self, results: pd.DataFrame, symbol: str) -> None:
+        lines = downsample_frame(results, 'Close', keep=results['Signal'] != 0)
+        dates = mdates.date2num(pd.to_datetime(lines['Date']))
+        self.price.set_data(dates, lines['Close'].to_numpy())
+        self.sma_short.set_data(dates, lines['SMA_Short'].to_numpy())
+        self.sma_long.set_data(dates, lines['SMA_Long'].to_numpy())
+        for collection, signal in ((self.buys, 1), (self.sells, -1)):
+            trades = results[results['Signal'] == signal]
+            collection.set_offsets(np.column_stack([mdates.date2num(pd.to_datetime(trades['Date'])),
+                                                    trades['Close'].to_numpy()]))
+        self.price_title.set_text(f'{symbol} - Price Action & Trading Signals')
+
+    def _update_performance(self, results: pd.DataFrame, metrics: Dict) -> None:
+        dates = mdates.date2num(pd.to_datetime(results['Date']))
+        strategy = (1 + pd.Series(results['Portfolio_Value']).pct_change().fillna(0)).cumprod().to_numpy()
+        buy_hold = (1 + results['Close'].pct_change().fillna(0)).cumprod().to_numpy()
+        strategy_idx = downsample_indices(strategy, keep=results['Signal'] != 0)
+        buy_hold_idx = downsample_indices(buy_hold)
+        self.strategy.set_data(dates[strategy_idx], strategy[strategy_idx])
+        self.buy_hold.set_data(dates[buy_hold_idx], buy_hold[buy_hold_idx])
+        self.performance_text.set_text(f"Strategy Return: {metrics['Total Return (%)']:.2f}%\n"
+                                       f"Sharpe Ratio: {metrics['Sharpe Ratio']:.2f}\n"
+                                       f"Max Drawdown: {metrics['Max Drawdown (%)']:.2f}%")
+
+    def _update_returns(self, results: pd.DataFrame) -> None:
+        returns = pd.Series(results['Portfolio_Value']).pct_change().dropna() * 100
+        counts, edges = np.histogram(returns, bins=RETURN_BINS)
+        for bar, height, left, width in zip(self.bars, counts, edges[:-1], np.diff(edges)):
+            bar.set_x(left)
+            bar.set_width(width)
+            bar.set_height(height)
+
+        mu, sigma = returns.mean(), returns.std()
+        x = np.linspace(returns.min(), returns.max(), 100)
+        normal = ((1 / (sigma * np.sqrt(2 * np.pi))) *
+                  np.exp(-0.5 * ((x - mu) / sigma) ** 2)) * len(returns) * (edges[1] - edges[0])
+        self.normal.set_data(x, normal)
+        labels = [f'Mean: {mu:.3f}%', f'+1σ: {mu + sigma:.3f}%', f'-1σ: {mu - sigma:.3f}%']
+        for line, value, label in zip((self.mean_line, self.upper_line, self.lower_line),
+                                      (mu, mu + sigma, mu - sigma), labels):
+            line.set_xdata([value, value])
+            line.set_label(label)
+        for text, label in zip(self.returns_legend.get_texts()[1:], labels):
+            text.set_text(label)
+
+    def _update_drawdown(self, results: pd.DataFrame) -> None:
+        dates = mdates.date2num(pd.to_datetime(results['Date']))
+        values = pd.Series(results['Portfolio_Value'])
+        drawdown = drawdown_series(values) * 100
+        episodes = drawdown_episodes(values, drawdown=drawdown / 100)
+        worst = int(episodes.loc[episodes['depth'].idxmin(), 'trough']) if len(episodes) else 0
+
+        self.drawdown_fill.set_data(dates, drawdown, 0)
+        self.drawdown.set_data(dates, drawdown)
+        self.max_drawdown.set_offsets([[dates[worst], drawdown[worst]]])
+        self.drawdown_legend.get_texts()[1].set_text(f'Max DD: {drawdown[worst]:.2f}%')
+
+    def _update_table(self, metrics: Dict, symbol: str) -> None:
+        rows = [[key, _format_metric(key, value)] for key, value in metrics.items()]
+        if self.table is None or self.table_keys != list(metrics):
+            if self.table is not None:
+                self.table.remove()
+            self.table = self._build_table(rows)
+            self.table_keys = list(metrics)
+        else:
+            for i, (_, value) in enumerate(rows, start=1):
+                self.table[i, 1].get_text().set_text(value)
+        self.table_title.set_text(f'{symbol} - Performance Summary')
+
+    def _build_table(self, rows):
+        table = self.table_ax.table(cellText=rows, colLabels=['Metric', 'Value'], cellLoc='center',
+                                    loc='center', colWidths=[0.6, 0.4])
+        table.auto_set_font_size(False)
+        table.set_fontsize(11)
+        table.scale(1, 2)
+        for i in range(len(rows) + 1):
+            for j in range(2):
+                cell = table[i, j]
+                if i == 0:
+                    cell.set_facecolor(self.colors['sma_short'])
+                    cell.set_text_props(weight='bold', color='white')
+                else:
+                    cell.set_facecolor('#F8F9FA' if i % 2 == 0 else 'white')
+        return table
+
+    @staticmethod
+    def _format_dates(ax) -> None:
+        ax.grid(True, alpha=0.3)
+        ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
+        ax.xaxis.set_major_locator(mdates.MonthLocator(interval=2))
+        ax.tick_params(axis='x', labelrotation=45)
+
+
+class RiskAnalysisTemplate:
+    """
+    The risk analysis figure, built once per process.
+
+    The 2x3 figure and the time-progress colorbar are created once;
+    ``render`` clears the six panels, redraws them with the ``RiskAnalyzer``
+    panel methods and reruns ``tight_layout`` from the default margins, so
+    the output matches ``RiskAnalyzer.plot_risk_analysis`` pixel for pixel
+    while skipping figure construction and colorbar axes creation.
+    """
+
+    def __init__(self, analyzer):
+        self.analyzer = analyzer
+        self.fig, self.axes = plt.subplots(2, 3, figsize=(18, 12))
+        params = self.fig.subplotpars
+        self.default_margins = dict(left=params.left, right=params.right, bottom=params.bottom,
+                                    top=params.top, wspace=params.wspace, hspace=params.hspace)
+        self.title = self.fig.suptitle('', fontsize=16, fontweight='bold')
+        # Like the colorbar of the standard renderer's scatter, whose point colors
+        # are explicit RGBA values: default colormap over 0..1, scatter alpha
+        self.fig.colorbar(ScalarMappable(norm=Normalize(0, 1)), ax=self.axes[1, 2],
+                          label='Time Progress', alpha=0.7)
+
+    def render(self, analysis: Dict, symbol: str, save_path: Optional[str] = None) -> None:
+        """
+        Redraw the panels for one symbol and save the figure.
+
+        Args:
+            analysis: Output of ``src.risk_metrics.compute_risk_analysis``
+            symbol: Stock symbol
+            save_path: Optional output file
+        """
+        for ax in self.axes.flat:
+            ax.cla()
+        self.title.set_text(f'{symbol} - Comprehensive Risk Analysis')
+
+        self.analyzer._plot_drawdown_analysis(self.axes[0, 0], analysis)
+        self.analyzer._plot_returns_distribution_with_risk(self.axes[0, 1], analysis)
+        self.analyzer._plot_rolling_volatility(self.axes[0, 2], analysis)
+        self.analyzer._plot_var_analysis(self.axes[1, 0], analysis)
+        if 'rolling_beta' in analysis:
+            self.analyzer._plot_beta_analysis(self.axes[1, 1], analysis)
+        else:
+            self.analyzer._plot_correlation_analysis(self.axes[1, 1], analysis)
+        self.analyzer._plot_risk_return_evolution(self.axes[1, 2], analysis, colorbar=False)
+        # Same data-dependent layout pass as RiskAnalyzer.plot_risk_analysis,
+        # started from the default margins like on a new figure
+        self.fig.subplots_adjust(**self.default_margins)
+        self.fig.tight_layout()
+
+        if save_path:
+            os.makedirs(os.path.dirname(save_path) if os.path.dirname(save_path) else 'plots', exist_ok=True)
+            self.fig.savefig(save_path, dpi=300, bbox_inches='tight', facecolor='white')
+            print(f"Risk analysis saved to: {save_path}")
+
+
+def _format_metric(key: str, value) -> str:
+    """Metric value as shown in the dashboard table"""
+    if isinstance(value, (int, float)):
+        if '%' in key:
+            return f"{value:.2f}%"
+        elif 'Value' in key:
+            return f"${value:,.2f}"
+        return f"{value:.3f}"
+    return str(value)
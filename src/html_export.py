@@ -0,0 +1,138 @@
+import base64
+import os
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
+from typing import Dict, Optional
+
+# Supported values of the [plotting] html_export option
+HTML_EXPORT_MODES = ('standalone', 'compact')
+
+# Scatter traces with at least this many points are drawn with WebGL
+WEBGL_THRESHOLD = 10_000
+
+# Name of the plotly.js bundle shared by every compact file of a directory
+PLOTLYJS_BUNDLE = 'plotly.min.js'
+
+# Data attributes converted to typed arrays
+ARRAY_ATTRIBUTES = ('x', 'y', 'z')
+
+# Trace types accepting x0/dx (y0/dy) in place of evenly spaced coordinates
+EVENLY_SPACED_TYPES = ('scatter', 'bar')
+
+
+def html_export_mode() -> str:
+    """HTML export mode from the ``[plotting]`` config section"""
+    from src.config import config
+    return config.get('plotting', 'html_export', 'standalone')
+
+
+def compact_figure(fig: go.Figure, webgl_threshold: int = WEBGL_THRESHOLD,
+                   float32: bool = False) -> Dict:
+    """
+    Figure dict whose data serializes to typed binary arrays.
+
+    - Numeric and datetime data become base64 typed-array blocks instead of
+      JSON numbers. Datetimes are sent as epoch milliseconds on a date axis
+      instead of ISO strings.
+    - Evenly spaced coordinates (e.g. a regular intraday clock) are replaced
+      by a start and a step.
+    - Scatter traces with ``webgl_threshold`` points or more become
+      ``Scattergl`` traces, drawn by the GPU instead of as SVG paths.
+
+    Args:
+        fig: Figure to convert (left unchanged)
+        webgl_threshold: Minimum points for a WebGL trace
+        float32: Also narrow float data to float32 (half the size; about 7
+            significant digits in hover labels)
+
+    Returns:
+        Dict: Figure dict accepted by ``plotly.io`` (already validated, so it
+        can be written with ``validate=False``)
+    """
+    figure = fig.to_plotly_json()
+    for props in figure['data']:
+        points = 0
+        for attr in ARRAY_ATTRIBUTES:
+            if props.get(attr) is None:
+                continue
+            values = np.asarray(props[attr])
+            if values.ndim == 0:
+                continue
+            points = max(points, len(values))
+            if values.dtype.kind == 'M':
+                values = values.astype('datetime64[ms]').astype(np.int64).astype(float)
+                if attr in ('x', 'y'):
+                    axis = _layout_axis(attr, props.get(f'{attr}axis'))
+                    figure['layout'].setdefault(axis, {})['type'] = 'date'
+            if attr in ('x', 'y') and props['type'] in EVENLY_SPACED_TYPES and _evenly_spaced(values):
+                # Regular coordinates need only a start and a step
+                del props[attr]
+                props[f'{attr}0'] = values[0].item()
+                props[f'd{attr}'] = (values[1] - values[0]).item()
+                continue
+            if values.dtype.kind == 'f' and float32:
+                values = values.astype(np.float32)
+            if values.dtype.kind in 'iuf':
+                props[attr] = typed_array(values)
+        if props['type'] == 'scatter' and points >= webgl_threshold:
+            props['type'] = 'scattergl'
+    return figure
+
+
+def typed_array(values: np.ndarray) -> Dict:
+    """
+    plotly.js typed-array spec (``dtype`` + base64 ``bdata``) of a numeric array.
+
+    plotly.js has no 64-bit integer arrays, so int64 data is narrowed to
+    int32 when it fits and sent as float64 otherwise.
+    """
+    if values.dtype.kind in 'iu' and values.dtype.itemsize == 8:
+        fits = values.size == 0 or (values.min() >= np.iinfo(np.int32).min and values.max() <= np.iinfo(np.int32).max)
+        values = values.astype(np.int32 if fits else np.float64)
+    values = np.ascontiguousarray(values)
+    spec = {'dtype': values.dtype.str[1:], 'bdata': base64.b64encode(values.tobytes()).decode('ascii')}
+    if values.ndim > 1:
+        spec['shape'] = ', '.join(str(size) for size in values.shape)
+    return spec
+
+
+def write_html(fig: go.Figure, save_path: str, mode: Optional[str] = None) -> str:
+    """
+    Write a figure to HTML in the configured export mode.
+
+    ``standalone`` embeds plotly.js in every file (plotly's default).
+    ``compact`` converts the figure with ``compact_figure`` and references
+    one ``plotly.min.js`` copied next to the file, so a directory of
+    dashboards holds the bundle once.
+
+    Args:
+        fig: Figure to write
+        save_path: Output HTML file
+        mode: 'standalone' or 'compact' (default: ``[plotting] html_export``)
+
+    Returns:
+        str: ``save_path``
+    """
+    mode = html_export_mode() if mode is None else mode
+    if mode not in HTML_EXPORT_MODES:
+        raise ValueError(f"Unknown HTML export mode '{mode}'. Available: {', '.join(HTML_EXPORT_MODES)}")
+    os.makedirs(os.path.dirname(save_path) or '.', exist_ok=True)
+    if mode == 'compact':
+        pio.write_html(compact_figure(fig), save_path, include_plotlyjs='directory', validate=False)
+    else:
+        fig.write_html(save_path)
+    return save_path
+
+
+def _evenly_spaced(values: np.ndarray) -> bool:
+    if values.ndim != 1 or len(values) < 3 or values.dtype.kind not in 'iuf':
+        return False
+    steps = np.diff(values)
+    return bool(steps[0] != 0 and np.all(steps == steps[0]))
+
+
+def _layout_axis(attr: str, reference: Optional[str]) -> str:
+    """Layout key of a trace axis reference ('x2' -> 'xaxis2')"""
+    reference = reference or attr
+    return f'{attr}axis{reference[1:]}'
@@ -0,0 +1,316 @@
+import base64
+from html import escape
+import json
+import os
+import re
+import zlib
+import numpy as np
+import pandas as pd
+from typing import Dict, Tuple
+from src.html_export import PLOTLYJS_BUNDLE, WEBGL_THRESHOLD
+from src.rendering import timed_render
+
+# Result columns stored in a report with their little-endian types (time is
+# added first as float64 epoch milliseconds); the widest type comes first so
+# every column block starts aligned
+REPORT_COLUMNS = (('Close', '<f4'), ('SMA_Short', '<f4'), ('SMA_Long', '<f4'),
+                  ('Portfolio_Value', '<f4'), ('Signal', '<i1'))
+
+# zlib level of the data blob (the browser inflates it with DecompressionStream)
+COMPRESSION_LEVEL = 6
+
+# Script tags holding the header and the data blob
+HEADER_ID = 'report-header'
+DATA_ID = 'report-data'
+
+
+def pack_results(results_dict: Dict[str, Dict], float32: bool = True) -> Tuple[Dict, bytes]:
+    """
+    Pack every symbol's results into one columnar binary blob.
+
+    Each column holds the rows of all symbols back to back, so the browser
+    maps it with a single typed array and slices a symbol by its row range.
+
+    Args:
+        results_dict: ``run_multiple_symbols`` output ({'data', 'metrics'} per symbol)
+        float32: Store prices and values as float32 (else float64)
+
+    Returns:
+        Tuple[Dict, bytes]: Header (row ranges, metrics and column layout)
+        and the uncompressed blob
+    """
+    frames = {symbol: entry['data'] for symbol, entry in results_dict.items()}
+    columns = [('time', '<f8')] + [
+        (name, dtype if float32 or dtype[1] != 'f' else '<f8') for name, dtype in REPORT_COLUMNS
+        if all(name in frame.columns for frame in frames.values())
+    ]
+    columns.sort(key=lambda column: -np.dtype(column[1]).itemsize)
+
+    symbols, start = [], 0
+    for symbol, frame in frames.items():
+        symbols.append({'symbol': symbol, 'start': start, 'rows': len(frame),
+                        'metrics': _json_metrics(results_dict[symbol].get('metrics', {}))})
+        start += len(frame)
+
+    blocks, layout, offset = [], [], 0
+    for name, dtype in columns:
+        if name == 'time':
+            parts = [_epoch_ms(frame['Date']) for frame in frames.values()]
+        else:
+            parts = [frame[name].to_numpy() for frame in frames.values()]
+        block = np.concatenate(parts).astype(dtype) if parts else np.empty(0, dtype=dtype)
+        blocks.append(block.tobytes())
+        layout.append({'name': name, 'dtype': dtype, 'offset': offset})
+        offset += block.nbytes
+    return {'rows': start, 'symbols': symbols, 'columns': layout}, b''.join(blocks)
+
+
+def _epoch_ms(dates: pd.Series) -> np.ndarray:
+    """Milliseconds since the epoch (UTC instants for tz-aware dates)"""
+    dates = pd.DatetimeIndex(pd.to_datetime(dates))
+    if dates.tz is not None:
+        dates = dates.tz_convert(None)
+    return dates.as_unit('ms').asi8
+
+
+@timed_render('html report')
+def write_report(results_dict: Dict[str, Dict], save_path: str = 'plots/report.html',
+                 title: str = 'Backtest Report', plotlyjs: str = 'inline', float32: bool = True) -> str:
+    """
+    Write one HTML report covering every symbol of a multi-symbol run.
+
+    The page holds a metrics table, a symbol selector, plotly.js once and
+    the results of all symbols as one zlib-compressed, base64-encoded
+    columnar blob. The browser inflates the blob on load and builds the
+    price, portfolio and drawdown charts of a symbol when it is selected, so
+    the file grows with the data instead of with symbols x plotly.js.
+
+    Args:
+        results_dict: ``run_multiple_symbols`` output
+        save_path: Output HTML file
+        title: Page title
+        plotlyjs: 'inline' (self-contained file) or 'directory' (reference a
+            ``plotly.min.js`` copied next to the file, shared with compact exports)
+        float32: Store prices and values as float32 (about 7 significant digits)
+
+    Returns:
+        str: ``save_path``
+    """
+    if plotlyjs not in ('inline', 'directory'):
+        raise ValueError(f"Unknown plotlyjs mode '{plotlyjs}'. Available: inline, directory")
+    from plotly.offline import get_plotlyjs
+
+    header, blob = pack_results(results_dict, float32=float32)
+    payload = base64.b64encode(zlib.compress(blob, COMPRESSION_LEVEL)).decode('ascii')
+
+    directory = os.path.dirname(save_path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    if plotlyjs == 'inline':
+        library = f'<script>{get_plotlyjs()}</script>'
+    else:
+        bundle = os.path.join(directory, PLOTLYJS_BUNDLE)
+        if not os.path.exists(bundle):
+            with open(bundle, 'w', encoding='utf-8') as f:
+                f.write(get_plotlyjs())
+        library = f'<script src="{PLOTLYJS_BUNDLE}"></script>'
+
+    # '</' inside the JSON would end its script tag early; plotly.js goes in
+    # last so its source is never scanned for placeholders
+    page = (REPORT_TEMPLATE.replace('__TITLE__', escape(title))
+            .replace('__WEBGL_THRESHOLD__', str(WEBGL_THRESHOLD))
+            .replace('__HEADER__', json.dumps(header).replace('</', '<\\/'))
+            .replace('__DATA__', payload)
+            .replace('__PLOTLYJS__', library))
+    with open(save_path, 'w', encoding='utf-8') as f:
+        f.write(page)
+    print(f"HTML report saved to: {save_path}")
+    return save_path
+
+
+def read_report(path: str) -> Dict[str, pd.DataFrame]:
+    """
+    Decode the data of a report written by ``write_report``.
+
+    Returns:
+        Dict[str, pd.DataFrame]: Results columns (with 'Date') per symbol
+    """
+    with open(path, encoding='utf-8') as f:
+        html = f.read()
+    header = json.loads(_script(html, HEADER_ID))
+    buffer = zlib.decompress(base64.b64decode(_script(html, DATA_ID)))
+    columns = {c['name']: np.frombuffer(buffer, dtype=c['dtype'], count=header['rows'], offset=c['offset'])
+               for c in header['columns']}
+
+    frames = {}
+    for entry in header['symbols']:
+        rows = slice(entry['start'], entry['start'] + entry['rows'])
+        frame = pd.DataFrame({name: values[rows] for name, values in columns.items() if name != 'time'})
+        frame.insert(0, 'Date', pd.to_datetime(columns['time'][rows].astype(np.int64), unit='ms'))
+        frames[entry['symbol']] = frame
+    return frames
+
+
+def _json_metrics(metrics: Dict) -> Dict:
+    """Metrics as plain JSON numbers (null when not finite) and strings"""
+    plain = {}
+    for key, value in metrics.items():
+        if isinstance(value, (int, float, np.number)):
+            plain[key] = float(value) if np.isfinite(value) else None
+        else:
+            plain[key] = str(value)
+    return plain
+
+
+def _script(html: str, element_id: str) -> str:
+    match = re.search(rf'<script id="{element_id}"[^>]*>(.*?)</script>', html, re.S)
+    if match is None:
+        raise ValueError(f"No '{element_id}' block in report")
+    return match.group(1).strip()
+
+
+REPORT_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>__TITLE__</title>
+__PLOTLYJS__
+<style>
+body { margin: 0; font-family: sans-serif; display: flex; height: 100vh; }
+#sidebar { width: 360px; overflow-y: auto; border-right: 1px solid #ddd; padding: 8px; box-sizing: border-box; }
+#main { flex: 1; display: flex; flex-direction: column; }
+#chart { flex: 1; }
+table { border-collapse: collapse; width: 100%; font-size: 12px; }
+th, td { padding: 2px 4px; text-align: right; border-bottom: 1px solid #eee; }
+th { position: sticky; top: 0; background: #fff; cursor: pointer; }
+td:first-child, th:first-child { text-align: left; }
+tr.selected { background: #dbeafe; }
+tbody tr { cursor: pointer; }
+</style>
+</head>
+<body>
+<div id="sidebar">
+<h3>__TITLE__</h3>
+<select id="symbol"></select>
+<table><thead id="metrics-head"></thead><tbody id="metrics-body"></tbody></table>
+</div>
+<div id="main"><div id="chart"></div></div>
+<script id="report-header" type="application/json">__HEADER__</script>
+<script id="report-data" type="application/octet-stream">__DATA__</script>
+<script>
+const WEBGL_THRESHOLD = __WEBGL_THRESHOLD__;
+const TYPES = {'<f8': Float64Array, '<f4': Float32Array, '<i1': Int8Array};
+const COLORS = {price: '#2E86AB', sma_short: '#A23B72', sma_long: '#F18F01', portfolio: '#C73E1D',
+                buy: '#00C851', sell: '#FF4444'};
+const header = JSON.parse(document.getElementById('report-header').textContent);
+let columns = null;
+
+async function inflate(text) {
+  const binary = atob(text.trim());
+  const bytes = new Uint8Array(binary.length);
+  for (let i = 0; i < binary.length; i++) bytes[i] = binary.charCodeAt(i);
+  const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('deflate'));
+  return new Response(stream).arrayBuffer();
+}
+
+function symbolColumns(entry) {
+  const out = {};
+  for (const [name, values] of Object.entries(columns)) {
+    out[name] = values.subarray(entry.start, entry.start + entry.rows);
+  }
+  return out;
+}
+
+function drawdown(values) {
+  const out = new Float64Array(values.length);
+  let peak = -Infinity;
+  for (let i = 0; i < values.length; i++) {
+    peak = Math.max(peak, values[i]);
+    out[i] = (values[i] - peak) / peak * 100;
+  }
+  return out;
+}
+
+function markers(data, signal, name, symbol, color) {
+  const x = [], y = [];
+  for (let i = 0; i < data.Signal.length; i++) {
+    if (data.Signal[i] === signal) { x.push(data.time[i]); y.push(data.Close[i]); }
+  }
+  return {type: 'scatter', mode: 'markers', x: x, y: y, name: name,
+          marker: {symbol: symbol, size: 11, color: color}};
+}
+
+function draw(symbol) {
+  const entry = header.symbols.find(s => s.symbol === symbol);
+  const data = symbolColumns(entry);
+  const type = entry.rows >= WEBGL_THRESHOLD ? 'scattergl' : 'scatter';
+  const line = (name, y, color, axis, extra) => Object.assign(
+    {type: type, mode: 'lines', x: data.time, y: y, name: name, line: {color: color, width: 1.5},
+     xaxis: 'x', yaxis: axis}, extra || {});
+  const traces = [];
+  if (data.Close) traces.push(line('Price', data.Close, COLORS.price, 'y'));
+  if (data.SMA_Short) traces.push(line('SMA Short', data.SMA_Short, COLORS.sma_short, 'y'));
+  if (data.SMA_Long) traces.push(line('SMA Long', data.SMA_Long, COLORS.sma_long, 'y'));
+  if (data.Signal && data.Close) {
+    traces.push(markers(data, 1, 'Buy Signal', 'triangle-up', COLORS.buy));
+    traces.push(markers(data, -1, 'Sell Signal', 'triangle-down', COLORS.sell));
+  }
+  if (data.Portfolio_Value) {
+    traces.push(line('Portfolio Value', data.Portfolio_Value, COLORS.portfolio, 'y2'));
+    traces.push(line('Drawdown', drawdown(data.Portfolio_Value), COLORS.sell, 'y3',
+                     {fill: 'tozeroy', fillcolor: 'rgba(255,68,68,0.3)'}));
+  }
+  const metrics = Object.entries(entry.metrics).slice(0, 4)
+    .map(([k, v]) => k + ': ' + (typeof v === 'number' ? v.toFixed(2) : v)).join(' | ');
+  Plotly.react('chart', traces, {
+    title: {text: symbol + '<br><sub>' + metrics + '</sub>'}, hovermode: 'x unified',
+    xaxis: {type: 'date', anchor: 'y3'}, yaxis: {title: 'Price ($)', domain: [0.45, 1]},
+    yaxis2: {title: 'Portfolio ($)', domain: [0.2, 0.42]}, yaxis3: {title: 'Drawdown (%)', domain: [0, 0.17]},
+  });
+  document.getElementById('symbol').value = symbol;
+  for (const row of document.querySelectorAll('#metrics-body tr')) {
+    row.classList.toggle('selected', row.dataset.symbol === symbol);
+  }
+}
+
+function buildTable() {
+  const names = Object.keys(header.symbols.length ? header.symbols[0].metrics : {});
+  const head = document.getElementById('metrics-head');
+  head.innerHTML = '<tr><th>Symbol</th>' + names.map(n => '<th>' + n + '</th>').join('') + '</tr>';
+  let order = header.symbols.slice();
+  let sortKey = null, descending = true;
+  const body = document.getElementById('metrics-body');
+  const render = () => {
+    body.innerHTML = order.map(s => '<tr data-symbol="' + s.symbol + '"><td>' + s.symbol + '</td>' +
+      names.map(n => '<td>' + (typeof s.metrics[n] === 'number' ? s.metrics[n].toFixed(2) : s.metrics[n]) + '</td>').join('') +
+      '</tr>').join('');
+  };
+  head.querySelectorAll('th').forEach((th, i) => th.addEventListener('click', () => {
+    const key = i === 0 ? null : names[i - 1];
+    descending = key === sortKey ? !descending : true;
+    sortKey = key;
+    order.sort((a, b) => {
+      const [x, y] = key === null ? [a.symbol, b.symbol] : [a.metrics[key], b.metrics[key]];
+      return (x < y ? -1 : x > y ? 1 : 0) * (descending ? -1 : 1);
+    });
+    render();
+  }));
+  body.addEventListener('click', event => {
+    const row = event.target.closest('tr');
+    if (row) draw(row.dataset.symbol);
+  });
+  render();
+}
+
+inflate(document.getElementById('report-data').textContent).then(buffer => {
+  columns = {};
+  for (const c of header.columns) columns[c.name] = new TYPES[c.dtype](buffer, c.offset, header.rows);
+  const select = document.getElementById('symbol');
+  select.innerHTML = header.symbols.map(s => '<option>' + s.symbol + '</option>').join('');
+  select.addEventListener('change', () => draw(select.value));
+  buildTable();
+  if (header.symbols.length) draw(header.symbols[0].symbol);
+});
+</script>
+</body>
+</html>
+"""
@@ -5,6 +5,16 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional
 import os
+from src.drawdown import drawdown_series
+from src.rolling_stats import rolling_stats
+from src.rendering import show_plotly, timed_render
+from src.downsampling import downsample_indices
+from src.html_export import write_html
+from src.chart_pyramid import ChartPyramid
+from src.comparison_views import cluster_order, metrics_frame, zscore
+
+# Performance heatmaps with more cells than this are drawn without value labels
+ANNOTATED_CELL_LIMIT = 400
 
 class InteractiveVisualizer:
     """Interactive visualization class using Plotly for web-based charts"""
@@ -20,6 +30,7 @@ class InteractiveVisualizer:
             'volume': '#95A5A6'
         }
     
+    @timed_render('interactive dashboard')
     def create_interactive_dashboard(self, results: pd.DataFrame, symbol: str, 
                                    metrics: Dict, save_path: str = None) -> None:
         """
@@ -31,6 +42,29 @@ class InteractiveVisualizer:
             metrics (Dict): Performance metrics
             save_path (str): Optional path to save the HTML file
         """
+        fig = self.build_interactive_dashboard(results, symbol, metrics)
+        
+        # Save as HTML
+        if save_path:
+            os.makedirs(os.path.dirname(save_path) if os.path.dirname(save_path) else 'plots', exist_ok=True)
+            write_html(fig, save_path)
+            print(f"Interactive dashboard saved to: {save_path}")
+        
+        # Show the plot
+        show_plotly(fig)
+    
+    def build_interactive_dashboard(self, results: pd.DataFrame, symbol: str, metrics: Dict) -> go.Figure:
+        """
+        Build the interactive dashboard figure without saving or showing it
+        
+        Args:
+            results (pd.DataFrame): Backtest results
+            symbol (str): Stock symbol
+            metrics (Dict): Performance metrics
+            
+        Returns:
+            go.Figure: Dashboard figure
+        """
         # Create subplots
         fig = make_subplots(
             rows=4, cols=2,
@@ -51,10 +85,17 @@ class InteractiveVisualizer:
         
         dates = pd.to_datetime(results['Date'])
         
+        # Lines longer than the point budget are thinned; signal bars are always kept
+        signal_bars = results['Signal'] != 0
+        price_idx = downsample_indices(results['Close'], keep=signal_bars)
+        value_idx = downsample_indices(results['Portfolio_Value'], keep=signal_bars)
+        volume_idx = downsample_indices(results['Volume'])
+        price_dates = dates.iloc[price_idx]
+        
         # 1. Price Action & Signals (Row 1, Col 1)
         # Price line
         fig.add_trace(
-            go.Scatter(x=dates, y=results['Close'], name='Price',
+            go.Scatter(x=price_dates, y=results['Close'].iloc[price_idx], name='Price',
                       line=dict(color=self.colors['price'], width=2),
                       hovertemplate='Date: %{x}<br>Price: $%{y:.2f}<extra></extra>'),
             row=1, col=1
@@ -62,13 +103,13 @@ class InteractiveVisualizer:
         
         # Moving averages
         fig.add_trace(
-            go.Scatter(x=dates, y=results['SMA_Short'], name='SMA Short',
+            go.Scatter(x=price_dates, y=results['SMA_Short'].iloc[price_idx], name='SMA Short',
                       line=dict(color=self.colors['sma_short'], width=1.5, dash='dash')),
             row=1, col=1
         )
         
         fig.add_trace(
-            go.Scatter(x=dates, y=results['SMA_Long'], name='SMA Long',
+            go.Scatter(x=price_dates, y=results['SMA_Long'].iloc[price_idx], name='SMA Long',
                       line=dict(color=self.colors['sma_long'], width=1.5, dash='dot')),
             row=1, col=1
         )
@@ -97,7 +138,7 @@ class InteractiveVisualizer:
         
         # Volume (secondary y-axis)
         fig.add_trace(
-            go.Bar(x=dates, y=results['Volume'], name='Volume',
+            go.Bar(x=dates.iloc[volume_idx], y=results['Volume'].iloc[volume_idx], name='Volume',
                   marker_color=self.colors['volume'], opacity=0.3,
                   hovertemplate='Date: %{x}<br>Volume: %{y:,.0f}<extra></extra>'),
             row=1, col=1, secondary_y=True
@@ -105,7 +146,7 @@ class InteractiveVisualizer:
         
         # 2. Portfolio Performance (Row 1, Col 2)
         fig.add_trace(
-            go.Scatter(x=dates, y=results['Portfolio_Value'], name='Portfolio Value',
+            go.Scatter(x=dates.iloc[value_idx], y=results['Portfolio_Value'].iloc[value_idx], name='Portfolio Value',
                       line=dict(color=self.colors['portfolio'], width=3),
                       hovertemplate='Date: %{x}<br>Portfolio: $%{y:,.2f}<extra></extra>'),
             row=1, col=2
@@ -118,23 +159,27 @@ class InteractiveVisualizer:
         benchmark_values = (results['Close'] / initial_price) * initial_portfolio
         
         fig.add_trace(
-            go.Scatter(x=dates, y=benchmark_values, name='Buy & Hold',
+            go.Scatter(x=price_dates, y=benchmark_values.iloc[price_idx], name='Buy & Hold',
                       line=dict(color=self.colors['price'], width=2, dash='dash'),
                       hovertemplate='Date: %{x}<br>Buy & Hold: $%{y:,.2f}<extra></extra>'),
             row=1, col=2
         )
         
         # 3. Volume Analysis (Row 2, Col 1)
-        # Volume bars with color coding based on price change
-        price_change = results['Close'].pct_change()
-        volume_colors = ['green' if x > 0 else 'red' for x in price_change]
-        
-        fig.add_trace(
-            go.Bar(x=dates, y=results['Volume'], name='Volume',
-                  marker_color=volume_colors, opacity=0.7,
-                  hovertemplate='Date: %{x}<br>Volume: %{y:,.0f}<extra></extra>'),
-            row=2, col=1
-        )
+        # Volume bars colored by price change: one trace per color, since
+        # plotly validates per-bar color arrays element by element (the
+        # layout's overlay barmode keeps each bar full width on its date)
+        volume_dates = dates.iloc[volume_idx].to_numpy()
+        volume = results['Volume'].iloc[volume_idx].to_numpy()
+        up_days = results['Close'].pct_change().iloc[volume_idx].to_numpy() > 0
+        
+        for mask, name, color in ((up_days, 'Volume (Up)', 'green'), (~up_days, 'Volume (Down)', 'red')):
+            fig.add_trace(
+                go.Bar(x=volume_dates[mask], y=volume[mask], name=name,
+                      marker_color=color, opacity=0.7,
+                      hovertemplate='Date: %{x}<br>Volume: %{y:,.0f}<extra></extra>'),
+                row=2, col=1
+            )
         
         # 4. Returns Distribution (Row 2, Col 2)
         portfolio_returns = pd.Series(results['Portfolio_Value']).pct_change().dropna() * 100
@@ -147,60 +192,66 @@ class InteractiveVisualizer:
         )
         
         # 5. Drawdown Analysis (Row 3, Col 1)
-        portfolio_values = pd.Series(results['Portfolio_Value'])
-        running_max = portfolio_values.expanding().max()
-        drawdown = (portfolio_values - running_max) / running_max * 100
+        drawdown = drawdown_series(results['Portfolio_Value']) * 100
+        drawdown_idx = downsample_indices(drawdown)
         
         fig.add_trace(
-            go.Scatter(x=dates, y=drawdown, fill='tonexty', name='Drawdown',
+            go.Scatter(x=dates.iloc[drawdown_idx], y=drawdown[drawdown_idx], fill='tonexty', name='Drawdown',
                       line=dict(color=self.colors['sell']),
                       hovertemplate='Date: %{x}<br>Drawdown: %{y:.2f}%<extra></extra>'),
             row=3, col=1
         )
         
         # 6. Rolling Metrics (Row 3, Col 2)
-        # Calculate 30-day rolling Sharpe ratio
-        rolling_returns = portfolio_returns.rolling(30).mean()
-        rolling_std = portfolio_returns.rolling(30).std()
-        rolling_sharpe = np.sqrt(252) * rolling_returns / rolling_std
+        # Calculate 30-day rolling Sharpe ratio (shares the risk module's rolling-stats engine)
+        stats = rolling_stats(pd.Series(results['Portfolio_Value']).pct_change().dropna())
+        rolling_sharpe = np.sqrt(252) * stats.mean(30) / stats.std(30)
+        sharpe_idx = downsample_indices(rolling_sharpe.iloc[29:])
         
         fig.add_trace(
-            go.Scatter(x=dates[30:], y=rolling_sharpe[30:], name='30-Day Rolling Sharpe',
+            go.Scatter(x=dates.iloc[30:].iloc[sharpe_idx], y=rolling_sharpe.iloc[29:].iloc[sharpe_idx],
+                      name='30-Day Rolling Sharpe',
                       line=dict(color=self.colors['portfolio'], width=2),
                       hovertemplate='Date: %{x}<br>Rolling Sharpe: %{y:.3f}<extra></extra>'),
             row=3, col=2
         )
         
         # 7. Trade Analysis (Row 4, spanning both columns)
-        # Calculate trade statistics
-        signals = results['Signal']
-        trade_points = signals[signals != 0]
-        
-        if len(trade_points) > 0:
-            trade_dates = []
-            trade_values = []
-            trade_types = []
-            
-            for idx in trade_points.index:
-                trade_dates.append(dates.iloc[idx])
-                trade_values.append(results['Portfolio_Value'].iloc[idx])
-                trade_types.append('Buy' if signals.iloc[idx] == 1 else 'Sell')
+        # Trades are selected with boolean masks: the portfolio path through
+        # all of them plus one marker trace per trade type, so the number of
+        # traces and the build time do not grow with the number of trades
+        signals = results['Signal'].to_numpy()
+        trade_mask = signals != 0
+        
+        if trade_mask.any():
+            trade_dates = dates.to_numpy()[trade_mask]
+            trade_values = results['Portfolio_Value'].to_numpy()[trade_mask]
+            trade_signals = signals[trade_mask]
             
             fig.add_trace(
-                go.Scatter(x=trade_dates, y=trade_values, mode='markers+lines',
-                          name='Trade Points',
-                          marker=dict(size=10, color=[self.colors['buy'] if t == 'Buy' else self.colors['sell'] for t in trade_types]),
-                          hovertemplate='%{text}<br>Date: %{x}<br>Portfolio: $%{y:,.2f}<extra></extra>',
-                          text=trade_types),
+                go.Scatter(x=trade_dates, y=trade_values, mode='lines', name='Trade Points',
+                          line=dict(color=self.colors['portfolio'], width=1), hoverinfo='skip'),
                 row=4, col=1
             )
+            
+            for signal, trade_type in ((1, 'Buy'), (-1, 'Sell')):
+                mask = trade_signals == signal
+                if mask.any():
+                    fig.add_trace(
+                        go.Scatter(x=trade_dates[mask], y=trade_values[mask], mode='markers',
+                                  name=f'{trade_type} Trades',
+                                  marker=dict(size=10, color=self.colors[trade_type.lower()]),
+                                  hovertemplate=f'{trade_type}<br>Date: %{{x}}<br>Portfolio: $%{{y:,.2f}}<extra></extra>'),
+                        row=4, col=1
+                    )
         
         # Update layout
         fig.update_layout(
             title=f'{symbol} - Interactive Backtesting Dashboard',
             height=1200,
             showlegend=True,
-            hovermode='x unified'
+            hovermode='x unified',
+            barmode='overlay'
         )
         
         # Update axes labels
@@ -235,15 +286,31 @@ class InteractiveVisualizer:
             borderwidth=1
         )
         
-        # Save as HTML
-        if save_path:
-            os.makedirs(os.path.dirname(save_path) if os.path.dirname(save_path) else 'plots', exist_ok=True)
-            fig.write_html(save_path)
-            print(f"Interactive dashboard saved to: {save_path}")
+        return fig
+    
+    @timed_render('zoomable report')
+    def create_zoomable_report(self, results: pd.DataFrame, symbol: str, out_dir: str) -> str:
+        """
+        Create a zoomable report of the price and equity curves
         
-        # Show the plot
-        fig.show()
+        Precomputes a min/max/close pyramid of ``Close`` and ``Portfolio_Value``
+        in binary tiles, so the viewer page loads one small tile per series at
+        first and the level matching each zoom window afterwards.
+        
+        Args:
+            results (pd.DataFrame): Backtest results
+            symbol (str): Stock symbol
+            out_dir (str): Output directory (serve it over HTTP to open the viewer)
+            
+        Returns:
+            str: Path of the viewer page
+        """
+        pyramid = ChartPyramid.build(results, out_dir, symbol=f'{symbol} - Zoomable Price & Equity')
+        viewer_path = pyramid.write_viewer()
+        print(f"Zoomable report saved to: {viewer_path} (serve with: python -m http.server --directory {out_dir})")
+        return viewer_path
     
+    @timed_render('performance heatmap')
     def create_performance_heatmap(self, results_dict: Dict[str, Dict], save_path: str = None) -> None:
         """
         Create a performance heatmap for multiple symbols
@@ -252,38 +319,36 @@ class InteractiveVisualizer:
             results_dict: Dictionary with symbol as key and {'data': df, 'metrics': dict} as value
             save_path: Optional path to save the HTML file
         """
-        symbols = list(results_dict.keys())
         metrics_names = ['Total Return (%)', 'Annual Return (%)', 'Sharpe Ratio', 'Max Drawdown (%)']
-        
-        # Create data matrix
-        data_matrix = []
-        for metric in metrics_names:
-            row = []
-            for symbol in symbols:
-                value = results_dict[symbol]['metrics'][metric]
-                row.append(value)
-            data_matrix.append(row)
-        
-        # Create heatmap
-        fig = go.Figure(data=go.Heatmap(
-            z=data_matrix,
-            x=symbols,
-            y=metrics_names,
-            colorscale='RdYlGn',
-            hoverongaps=False,
-            hovertemplate='Symbol: %{x}<br>Metric: %{y}<br>Value: %{z:.2f}<extra></extra>'
-        ))
-        
-        # Add text annotations
-        for i, metric in enumerate(metrics_names):
-            for j, symbol in enumerate(symbols):
-                value = data_matrix[i][j]
-                fig.add_annotation(
-                    x=j, y=i,
-                    text=f"{value:.2f}",
-                    showarrow=False,
-                    font=dict(color="black" if abs(value) < max(abs(min(data_matrix[i])), abs(max(data_matrix[i]))) * 0.7 else "white")
-                )
+        metrics = metrics_frame(results_dict, metrics_names)
+        
+        if metrics.size <= ANNOTATED_CELL_LIMIT:
+            # Values printed in the cells by the heatmap trace itself
+            fig = go.Figure(data=go.Heatmap(
+                z=metrics.T.to_numpy(),
+                x=list(metrics.index),
+                y=list(metrics.columns),
+                colorscale='RdYlGn',
+                hoverongaps=False,
+                texttemplate='%{z:.2f}',
+                hovertemplate='Symbol: %{x}<br>Metric: %{y}<br>Value: %{z:.2f}<extra></extra>'
+            ))
+        else:
+            # Too many cells to label: similar symbols clustered together and
+            # colored by per-metric z-score, raw values in the hover
+            order = cluster_order(metrics)
+            fig = go.Figure(data=go.Heatmap(
+                z=zscore(metrics).loc[order].T.to_numpy(),
+                customdata=metrics.loc[order].T.to_numpy(),
+                x=order,
+                y=list(metrics.columns),
+                colorscale='RdYlGn',
+                zmid=0,
+                colorbar=dict(title='z-score'),
+                hoverongaps=False,
+                hovertemplate='Symbol: %{x}<br>Metric: %{y}<br>Value: %{customdata:.2f}<extra></extra>'
+            ))
+            fig.update_xaxes(showticklabels=False)
         
         fig.update_layout(
             title='Performance Metrics Heatmap',
@@ -293,10 +358,15 @@ class InteractiveVisualizer:
         
         if save_path:
             os.makedirs(os.path.dirname(save_path) if os.path.dirname(save_path) else 'plots', exist_ok=True)
-            fig.write_html(save_path)
+            write_html(fig, save_path)
             print(f"Performance heatmap saved to: {save_path}")
         
-        fig.show()
+        show_plotly(fig)
 
-# Global interactive visualizer instance
-interactive_visualizer = InteractiveVisualizer()
\ No newline at end of file
+# Global interactive visualizer instance, created on first access
+def __getattr__(name: str):
+    """Create the global ``interactive_visualizer`` on first access"""
+    if name == 'interactive_visualizer':
+        globals()[name] = InteractiveVisualizer()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
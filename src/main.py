@@ -1,15 +1,20 @@
 from src.data_loader import DataLoader
 from strategies.sma_crossover import SMACrossoverStrategy
-from src.visualizer import AdvancedVisualizer
-from src.interactive_viz import InteractiveVisualizer
-from src.risk_analyzer import RiskAnalyzer
-import matplotlib.pyplot as plt
+from src.rendering import show_figure, timed_render
+from src.render_queue import RenderQueue
+from src.render_cache import RenderCache, render_cache_enabled
+from src.risk_metrics import compute_risk_analysis
 import pandas as pd
 import os
+from contextlib import nullcontext
+
+# The plotting modules (matplotlib, seaborn, scipy, plotly) are imported by the
+# functions that draw, so importing this module only loads the backtesting core
 
 def run_backtest(symbol: str, start_date: str = None, end_date: str = None, 
                 initial_capital: float = 100000, short_period: int = 20, 
-                long_period: int = 50) -> None:
+                long_period: int = 50, render_queue: RenderQueue = None,
+                render_cache: RenderCache = None) -> None:
     """
     Run a backtest for the SMA Crossover strategy.
     
@@ -20,6 +25,10 @@ def run_backtest(symbol: str, start_date: str = None, end_date: str = None,
         initial_capital (float): Initial capital for the strategy
         short_period (int): Short-term SMA period
         long_period (int): Long-term SMA period
+        render_queue (RenderQueue, optional): Queue the plots to worker
+            processes instead of drawing them before returning
+        render_cache (RenderCache, optional): Skip plots whose inputs are
+            unchanged since they were last rendered
     """
     # Fetch data
     data_loader = DataLoader()
@@ -43,22 +52,37 @@ def run_backtest(symbol: str, start_date: str = None, end_date: str = None,
         for metric, value in metrics.items():
             print(f"{metric}: {value:.2f}")
             
-        # Create advanced visualizations
-        visualizer = AdvancedVisualizer()
-        interactive_viz = InteractiveVisualizer()
-        risk_analyzer = RiskAnalyzer()
-        
-        # Create comprehensive dashboard
-        dashboard_path = f"plots/{symbol}_dashboard.png"
-        visualizer.create_comprehensive_dashboard(results, symbol, metrics, dashboard_path)
-        
-        # Create interactive dashboard
-        interactive_path = f"plots/{symbol}_interactive.html"
-        interactive_viz.create_interactive_dashboard(results, symbol, metrics, interactive_path)
-        
-        # Create risk analysis
-        risk_path = f"plots/{symbol}_risk_analysis.png"
-        risk_metrics = risk_analyzer.comprehensive_risk_analysis(results, symbol, save_path=risk_path)
+        if render_queue is not None:
+            # Only the risk numbers are needed here; the workers draw every plot
+            analysis = compute_risk_analysis(results)
+            render_queue.submit_backtest(results, symbol, metrics, analysis)
+            risk_metrics = analysis['metrics']
+        else:
+            from src.visualizer import AdvancedVisualizer
+            from src.interactive_viz import InteractiveVisualizer
+            from src.risk_analyzer import RiskAnalyzer
+            
+            # Create advanced visualizations
+            visualizer = AdvancedVisualizer()
+            interactive_viz = InteractiveVisualizer()
+            risk_analyzer = RiskAnalyzer()
+            
+            # Create comprehensive dashboard
+            dashboard_path = f"plots/{symbol}_dashboard.png"
+            _render(render_cache, 'dashboard', dashboard_path, (results, symbol, metrics),
+                    lambda: visualizer.create_comprehensive_dashboard(results, symbol, metrics, dashboard_path))
+            
+            # Create interactive dashboard
+            interactive_path = f"plots/{symbol}_interactive.html"
+            _render(render_cache, 'interactive', interactive_path, (results, symbol, metrics),
+                    lambda: interactive_viz.create_interactive_dashboard(results, symbol, metrics, interactive_path))
+            
+            # Create risk analysis
+            risk_path = f"plots/{symbol}_risk_analysis.png"
+            analysis = compute_risk_analysis(results)
+            _render(render_cache, 'risk_analysis', risk_path, (analysis, symbol),
+                    lambda: risk_analyzer.plot_risk_analysis(analysis, symbol, risk_path))
+            risk_metrics = analysis['metrics']
         
         # Print risk metrics
         print(f"\nRisk Analysis for {symbol}:")
@@ -73,7 +97,9 @@ def run_backtest(symbol: str, start_date: str = None, end_date: str = None,
                 print(f"{metric}: {value}")
         
         # Also create traditional plot for compatibility
-        plot_results(results, symbol)
+        if render_queue is None:
+            _render(render_cache, 'backtest_plot', f'plots/{symbol}_backtest_plot.png', (results, symbol),
+                    lambda: plot_results(results, symbol))
         
         # Save results
         output_file = data_loader.save_to_csv(results, f"{symbol}_backtest_results")
@@ -85,14 +111,26 @@ def run_backtest(symbol: str, start_date: str = None, end_date: str = None,
         print(f"Error during backtesting: {str(e)}")
         return None, None
 
-def plot_results(results: pd.DataFrame, symbol: str) -> None:
+def _render(render_cache: RenderCache, artifact: str, path: str, inputs: tuple, renderer) -> None:
+    """Call ``renderer`` through the render cache, if one is used"""
+    if render_cache is None:
+        renderer()
+    else:
+        render_cache.render(artifact, path, inputs, renderer)
+
+@timed_render('backtest plot')
+def plot_results(results: pd.DataFrame, symbol: str, save_path: str = None) -> None:
     """
     Plot the backtest results.
     
     Args:
         results (pd.DataFrame): DataFrame containing backtest results
         symbol (str): Stock symbol
+        save_path (str, optional): Output file (default: plots/{symbol}_backtest_plot.png)
     """
+    import matplotlib.pyplot as plt
+    
+    save_path = save_path or f'plots/{symbol}_backtest_plot.png'
     plt.figure(figsize=(15, 10))
     
     # Plot price and moving averages
@@ -129,50 +167,83 @@ def plot_results(results: pd.DataFrame, symbol: str) -> None:
     plt.tight_layout()
     
     # Create plots directory if it doesn't exist
-    os.makedirs('plots', exist_ok=True)
-    plt.savefig(f'plots/{symbol}_backtest_plot.png', dpi=300, bbox_inches='tight')
-    print(f"Plot saved to: plots/{symbol}_backtest_plot.png")
-    plt.show()
+    os.makedirs(os.path.dirname(save_path) or 'plots', exist_ok=True)
+    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    print(f"Plot saved to: {save_path}")
+    show_figure()
 
-def run_multiple_symbols(symbols: list, **kwargs) -> dict:
+def run_multiple_symbols(symbols: list, render_workers: int = 0, render_cache: bool = None,
+                         html_report: bool = False, **kwargs) -> dict:
     """
     Run backtests for multiple symbols.
     
     Args:
         symbols (list): List of stock symbols to backtest
+        render_workers (int): If positive, draw the plots in this many worker
+            processes while the backtests keep running
+        render_cache (bool): Skip plots whose inputs are unchanged since the
+            last run (default: ``[plotting] render_cache``)
+        html_report (bool): Also write plots/report.html, one file with the
+            data of every symbol and a symbol selector
         **kwargs: Additional arguments for run_backtest
         
     Returns:
         dict: Dictionary with results for each symbol
     """
     results = {}
+    if render_cache is None:
+        render_cache = render_cache_enabled()
+    cache = RenderCache('plots') if render_cache else None
     
-    for symbol in symbols:
-        print(f"\n{'='*50}")
-        print(f"Running backtest for {symbol}")
-        print('='*50)
+    # The worker pool is stopped even if a backtest or a submission fails
+    with RenderQueue(render_workers, cache=cache) if render_workers > 0 else nullcontext() as render_queue:
+        for symbol in symbols:
+            print(f"\n{'='*50}")
+            print(f"Running backtest for {symbol}")
+            print('='*50)
+            
+            result, metrics = run_backtest(symbol, render_queue=render_queue,
+                                           render_cache=None if render_queue else cache, **kwargs)
+            if result is not None and metrics is not None:
+                results[symbol] = {
+                    'data': result,
+                    'metrics': metrics
+                }
         
-        result, metrics = run_backtest(symbol, **kwargs)
-        if result is not None and metrics is not None:
-            results[symbol] = {
-                'data': result,
-                'metrics': metrics
-            }
-    
-    # Create comparison visualizations if we have multiple results
-    if len(results) > 1:
-        print(f"\nCreating comparison visualizations...")
+        # Create comparison visualizations if we have multiple results
+        if len(results) > 1:
+            print(f"\nCreating comparison visualizations...")
+            
+            # Static comparison chart
+            comparison_path = "plots/multi_symbol_comparison.png"
+            if render_queue is not None:
+                render_queue.submit_comparison(results, comparison_path)
+            else:
+                from src.visualizer import AdvancedVisualizer
+                visualizer = AdvancedVisualizer()
+                _render(cache, 'comparison', comparison_path, (results,),
+                        lambda: visualizer.create_comparison_chart(results, comparison_path))
+                print(f"Comparison chart saved to: {comparison_path}")
+            
+            # Interactive performance heatmap
+            from src.interactive_viz import InteractiveVisualizer
+            interactive_viz = InteractiveVisualizer()
+            heatmap_path = "plots/performance_heatmap.html"
+            _render(cache, 'performance_heatmap', heatmap_path, (results,),
+                    lambda: interactive_viz.create_performance_heatmap(results, heatmap_path))
         
-        # Static comparison chart
-        visualizer = AdvancedVisualizer()
-        comparison_path = "plots/multi_symbol_comparison.png"
-        visualizer.create_comparison_chart(results, comparison_path)
-        print(f"Comparison chart saved to: {comparison_path}")
+        if html_report and results:
+            from src.html_report import write_report
+            report_path = "plots/report.html"
+            _render(cache, 'html_report', report_path, (results,), lambda: write_report(results, report_path))
         
-        # Interactive performance heatmap
-        interactive_viz = InteractiveVisualizer()
-        heatmap_path = "plots/performance_heatmap.html"
-        interactive_viz.create_performance_heatmap(results, heatmap_path)
+        if render_queue is not None:
+            rendered = render_queue.wait()
+            print(f"Rendered {len(rendered)} artifacts in {render_queue.max_workers} worker processes")
+    
+    if cache is not None:
+        cache.save()
+        print(cache.summary())
     
     return results
 
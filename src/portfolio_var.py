@@ -0,0 +1,164 @@
+import numpy as np
+import pandas as pd
+from statistics import NormalDist
+from typing import Optional
+from src.risk_metrics import TAIL_LEVELS, tail_depth, tail_risk_kernel
+
+# Matrix elements materialized at once (portfolio returns or simulated draws)
+MEMORY_BUDGET = 1 << 24
+
+# Simulations drawn per seeded chunk (fixed so results do not depend on the memory budget)
+SIMULATION_CHUNK = 8192
+
+VAR_COLUMNS = [f'{kind} ({label})' for kind in ('VaR', 'CVaR') for label in TAIL_LEVELS]
+
+
+class PortfolioVaR:
+    """
+    Portfolio-level VaR/CVaR for many weight vectors at once.
+
+    Weights are a (portfolios x assets) matrix, so each method is a few BLAS
+    calls over the whole batch:
+
+    - ``historical``: portfolio return histories ``R @ W.T`` and their
+      empirical tails (same definition as the single-series risk metrics)
+    - ``parametric``: normal VaR/CVaR from ``W @ mu`` and ``diag(W Σ W.T)``
+    - ``monte_carlo``: correlated normal draws ``Z @ (W L).T`` with ``L`` the
+      Cholesky factor of Σ, generated once per chunk with per-chunk seeds so
+      every portfolio sees the same scenarios; only each portfolio's tail is
+      kept across chunks
+
+    VaR and CVaR are reported like ``calculate_risk_metrics``: as return
+    quantiles (negative numbers for losses) at the ``TAIL_LEVELS`` tails.
+    """
+
+    def __init__(self, returns: pd.DataFrame, covariance: Optional[pd.DataFrame] = None,
+                 memory_budget: int = MEMORY_BUDGET):
+        """
+        Args:
+            returns: Aligned (time x assets) returns without missing values
+            covariance: Optional covariance to use instead of the sample one
+                (e.g. ``UniverseRiskAnalyzer(returns).covariance()``)
+            memory_budget: Maximum matrix elements materialized per chunk
+        """
+        if returns.isna().any().any():
+            raise ValueError("Returns matrix must be aligned without missing values")
+        self.returns = returns
+        self.assets = list(returns.columns)
+        self.memory_budget = memory_budget
+        self._values = returns.to_numpy(dtype=float)
+        self._mean = self._values.mean(axis=0)
+        if covariance is None:
+            self._cov = np.cov(self._values, rowvar=False).reshape(len(self.assets), len(self.assets))
+        else:
+            self._cov = covariance.reindex(index=self.assets, columns=self.assets).to_numpy(dtype=float)
+
+    def historical(self, weights) -> pd.DataFrame:
+        """Historical-simulation VaR/CVaR of every portfolio"""
+        w, index = self._weights(weights)
+        n_obs = len(self._values)
+        step = max(1, self.memory_budget // n_obs)
+        out = np.empty((len(w), len(VAR_COLUMNS)))
+        for start in range(0, len(w), step):
+            portfolio_returns = self._values @ w[start:start + step].T  # time x portfolios
+            tails = tail_risk_kernel(portfolio_returns, axis=0)
+            out[start:start + step] = np.column_stack([tails[name] for name in VAR_COLUMNS])
+        return pd.DataFrame(out, index=index, columns=VAR_COLUMNS)
+
+    def parametric(self, weights) -> pd.DataFrame:
+        """Variance-covariance (normal) VaR/CVaR of every portfolio"""
+        w, index = self._weights(weights)
+        mean = w @ self._mean
+        std = np.sqrt(np.maximum(np.einsum('ij,ij->i', w @ self._cov, w), 0))
+
+        normal = NormalDist()
+        columns = {}
+        for label, alpha in TAIL_LEVELS.items():
+            z = normal.inv_cdf(alpha)
+            columns[f'VaR ({label})'] = mean + std * z
+            columns[f'CVaR ({label})'] = mean - std * normal.pdf(z) / alpha
+        return pd.DataFrame(columns, index=index)[VAR_COLUMNS]
+
+    def monte_carlo(self, weights, n_simulations: int = 100_000, seed: int = 0) -> pd.DataFrame:
+        """
+        Monte Carlo VaR/CVaR from correlated normal draws.
+
+        Args:
+            weights: Weight vector(s)
+            n_simulations: Number of simulated return vectors
+            seed: Seed of the per-chunk random generators
+
+        Returns:
+            pd.DataFrame: VaR/CVaR per portfolio
+        """
+        w, index = self._weights(weights)
+        loadings = w @ self._cholesky()  # portfolio exposure to each independent draw
+        mean = w @ self._mean
+
+        # Each draw chunk is generated once and applied to every portfolio in
+        # column blocks; only the smallest simulated returns of each portfolio,
+        # which determine its VaR/CVaR, are kept between chunks
+        depth = tail_depth(n_simulations)
+        tails = np.full((depth, len(w)), np.inf)  # smallest returns x portfolios
+        n_assets = len(self.assets)
+        for chunk, first in enumerate(range(0, n_simulations, SIMULATION_CHUNK)):
+            rng = np.random.default_rng([seed, chunk])
+            draws = rng.standard_normal((min(SIMULATION_CHUNK, n_simulations - first), n_assets))
+            portfolio_step = max(1, self.memory_budget // (len(draws) + depth))
+            for start in range(0, len(w), portfolio_step):
+                columns = slice(start, start + portfolio_step)
+                simulated = draws @ loadings[columns].T + mean[columns]
+                candidates = np.concatenate([tails[:, columns], simulated])
+                tails[:, columns] = np.partition(candidates, depth - 1, axis=0)[:depth]
+
+        stats = tail_risk_kernel(tails, axis=0, n=n_simulations)
+        out = np.column_stack([stats[name] for name in VAR_COLUMNS])
+        return pd.DataFrame(out, index=index, columns=VAR_COLUMNS)
+
+    def all_methods(self, weights, **monte_carlo_options) -> pd.DataFrame:
+        """Historical, parametric and Monte Carlo results side by side"""
+        return pd.concat({
+            'historical': self.historical(weights),
+            'parametric': self.parametric(weights),
+            'monte_carlo': self.monte_carlo(weights, **monte_carlo_options),
+        }, axis=1)
+
+    def _cholesky(self) -> np.ndarray:
+        """Cholesky factor of the covariance, with jitter for singular estimates"""
+        jitter = 0.0
+        # An all-zero covariance (e.g. constant prices) still needs a non-zero jitter
+        scale = np.trace(self._cov) / len(self._cov) if len(self._cov) else 0.0
+        scale = scale if scale > 0 else 1.0
+        for _ in range(8):
+            try:
+                return np.linalg.cholesky(self._cov + jitter * np.eye(len(self._cov)))
+            except np.linalg.LinAlgError:
+                jitter = scale * 1e-10 if jitter == 0 else jitter * 10
+        raise ValueError("Covariance matrix is not positive semi-definite")
+
+    def _weights(self, weights):
+        """Return weights as a (portfolios x assets) array aligned to the assets, plus an index"""
+        if isinstance(weights, pd.DataFrame):
+            index = weights.index
+            w = weights.reindex(columns=self.assets, fill_value=0.0).to_numpy(dtype=float)
+        elif isinstance(weights, pd.Series):
+            index = pd.RangeIndex(1)
+            w = weights.reindex(self.assets, fill_value=0.0).to_numpy(dtype=float)[None, :]
+        else:
+            w = np.atleast_2d(np.asarray(weights, dtype=float))
+            index = pd.RangeIndex(len(w))
+        if w.shape[1] != len(self.assets):
+            raise ValueError(f"Expected {len(self.assets)} weights per portfolio, got {w.shape[1]}")
+        return w, index
+
+
+def random_weights(n_portfolios: int, assets, seed: Optional[int] = None) -> pd.DataFrame:
+    """
+    Random long-only, fully invested weight vectors to scan candidate allocations.
+
+    Returns:
+        pd.DataFrame: ``n_portfolios`` x assets weights summing to 1 per row
+    """
+    assets = list(assets)
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(rng.dirichlet(np.ones(len(assets)), n_portfolios), columns=assets)
@@ -0,0 +1,202 @@
+import hashlib
+import json
+import os
+import time
+import numpy as np
+import pandas as pd
+from importlib.metadata import PackageNotFoundError, version
+from typing import Any, Callable, Dict, List, Optional
+
+# Manifest file kept in the plots directory
+MANIFEST_FILE = '.render_cache.json'
+
+# Bump when a renderer changes its output for the same inputs
+RENDER_CACHE_VERSION = 1
+
+# Libraries whose version is part of every fingerprint
+FINGERPRINT_LIBRARIES = ('matplotlib', 'seaborn', 'plotly', 'numpy', 'pandas')
+
+# [plotting] settings that change rendered output
+FINGERPRINT_SETTINGS = ('dpi', 'max_plot_points', 'html_export')
+
+
+def render_cache_enabled() -> bool:
+    """Whether the ``[plotting] render_cache`` option is on"""
+    from src.config import config
+    return bool(config.get('plotting', 'render_cache', False))
+
+
+def library_versions() -> Dict[str, Optional[str]]:
+    """Installed versions of the plotting stack (``None`` if a library is missing)"""
+    versions = {}
+    for library in FINGERPRINT_LIBRARIES:
+        try:
+            versions[library] = version(library)
+        except PackageNotFoundError:
+            versions[library] = None
+    return versions
+
+
+def plot_settings() -> Dict[str, Any]:
+    """Output-affecting ``[plotting]`` settings"""
+    from src.config import config
+    params = config.get_plotting_params()
+    return {key: params[key] for key in FINGERPRINT_SETTINGS}
+
+
+def fingerprint(artifact: str, *inputs: Any) -> str:
+    """
+    Content hash of an artifact's inputs.
+
+    DataFrames, Series and arrays are hashed by value (with their columns,
+    dtypes and shapes); dicts, lists and scalars recursively. The cache
+    version, library versions and plot settings are always included.
+
+    Args:
+        artifact: Artifact type (e.g. 'dashboard')
+        *inputs: Everything the renderer reads
+
+    Returns:
+        str: Hex SHA-256 digest
+    """
+    hasher = hashlib.sha256()
+    _update(hasher, [RENDER_CACHE_VERSION, artifact, library_versions(), plot_settings(), list(inputs)])
+    return hasher.hexdigest()
+
+
+class RenderCache:
+    """
+    Skip re-rendering plots whose inputs have not changed.
+
+    A JSON manifest in the plots directory maps each artifact path to the
+    fingerprint of the inputs it was rendered from. ``render`` calls the
+    renderer only when the file is missing or its fingerprint changed, and
+    the manifest records the hits and misses of the last run. Artifacts not
+    used for a while can be removed with ``collect_garbage``.
+    """
+
+    def __init__(self, directory: str = 'plots'):
+        """
+        Args:
+            directory: Plots directory holding the artifacts and the manifest
+        """
+        self.directory = directory
+        self.manifest_path = os.path.join(directory, MANIFEST_FILE)
+        self.entries: Dict[str, Dict] = {}
+        self.hits: List[str] = []
+        self.misses: List[str] = []
+        self.session_start = time.time()
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path) as f:
+                self.entries = json.load(f).get('artifacts', {})
+
+    def lookup(self, artifact: str, path: str, *inputs: Any) -> Optional[str]:
+        """
+        Check an artifact against the manifest.
+
+        Args:
+            artifact: Artifact type
+            path: Output file
+            *inputs: Everything the renderer reads
+
+        Returns:
+            Optional[str]: ``None`` if the file is up to date (a hit),
+            otherwise the fingerprint to ``store`` once it is rendered
+        """
+        key = fingerprint(artifact, *inputs)
+        entry = self.entries.get(path)
+        if entry is not None and entry['fingerprint'] == key and os.path.exists(path):
+            entry['last_used'] = time.time()
+            self.hits.append(path)
+            return None
+        self.misses.append(path)
+        return key
+
+    def store(self, artifact: str, path: str, key: str) -> None:
+        """Record a freshly rendered artifact"""
+        now = time.time()
+        self.entries[path] = {'artifact': artifact, 'fingerprint': key, 'rendered_at': now, 'last_used': now}
+
+    def render(self, artifact: str, path: str, inputs: tuple, renderer: Callable[[], Any]) -> bool:
+        """
+        Render an artifact unless an identical one already exists.
+
+        Args:
+            artifact: Artifact type
+            path: Output file
+            inputs: Everything the renderer reads
+            renderer: Writes ``path`` when called
+
+        Returns:
+            bool: True if the renderer ran, False on a cache hit
+        """
+        key = self.lookup(artifact, path, *inputs)
+        if key is None:
+            print(f"Up to date, skipped rendering: {path}")
+            return False
+        renderer()
+        self.store(artifact, path, key)
+        return True
+
+    def collect_garbage(self, max_age_days: float = 30) -> List[str]:
+        """
+        Delete artifacts that have not been rendered or reused recently.
+
+        Entries whose file no longer exists are dropped as well. Artifacts
+        used by this cache instance are always kept.
+
+        Args:
+            max_age_days: Keep artifacts used within this many days
+
+        Returns:
+            List[str]: Paths of the deleted files
+        """
+        cutoff = min(time.time() - max_age_days * 86400, self.session_start)
+        removed = []
+        for path, entry in list(self.entries.items()):
+            if not os.path.exists(path):
+                del self.entries[path]
+            elif entry['last_used'] < cutoff:
+                os.remove(path)
+                del self.entries[path]
+                removed.append(path)
+        return removed
+
+    def save(self) -> str:
+        """Write the manifest (artifacts plus this run's hits and misses)"""
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self.manifest_path, 'w') as f:
+            json.dump({'version': RENDER_CACHE_VERSION, 'artifacts': self.entries,
+                       'last_run': {'hits': self.hits, 'misses': self.misses}}, f, indent=2)
+        return self.manifest_path
+
+    def summary(self) -> str:
+        return f"Render cache: {len(self.hits)} hits, {len(self.misses)} misses"
+
+
+def _update(hasher, value: Any) -> None:
+    """Feed a value into a hash, recursing into containers"""
+    if isinstance(value, pd.DataFrame):
+        hasher.update(repr((list(value.columns), [str(t) for t in value.dtypes])).encode())
+        hasher.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+    elif isinstance(value, pd.Series):
+        hasher.update(repr((value.name, str(value.dtype))).encode())
+        hasher.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+    elif isinstance(value, np.ndarray) and value.dtype.kind == 'O':
+        _update(hasher, value.tolist())
+    elif isinstance(value, np.ndarray):
+        hasher.update(repr((value.dtype.str, value.shape)).encode())
+        hasher.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, dict):
+        hasher.update(b'{')
+        for key in sorted(value, key=str):
+            hasher.update(repr(key).encode())
+            _update(hasher, value[key])
+        hasher.update(b'}')
+    elif isinstance(value, (list, tuple)):
+        hasher.update(b'[')
+        for item in value:
+            _update(hasher, item)
+        hasher.update(b']')
+    else:
+        hasher.update(repr(value).encode())
@@ -0,0 +1,175 @@
+import multiprocessing
+import os
+import pandas as pd
+from concurrent.futures import Future, ProcessPoolExecutor, wait as wait_futures
+from typing import Dict, List, Optional
+
+# Result columns read by the plotting code; everything else stays in the parent process
+RENDER_COLUMNS = ['Date', 'Close', 'Volume', 'SMA_Short', 'SMA_Long', 'Signal', 'Portfolio_Value']
+
+# Artifact types accepted by RenderQueue.submit
+ARTIFACT_TYPES = ('dashboard', 'interactive', 'risk_analysis', 'backtest_plot', 'comparison')
+
+# Per-worker plotting objects, created once by the pool initializer
+_worker_state: Dict = {}
+
+
+def compact_results(results: pd.DataFrame) -> pd.DataFrame:
+    """
+    Reduce backtest results to the columns the renderers need.
+
+    Prices and values are stored as float32 and signals as int8, which is
+    ample for plotting and keeps the pickled job payload small.
+    """
+    frame = results[[c for c in RENDER_COLUMNS if c in results.columns]].copy()
+    for column in frame.columns:
+        if column == 'Signal':
+            frame[column] = frame[column].astype('int8')
+        elif column != 'Date':
+            frame[column] = frame[column].astype('float32')
+    return frame
+
+
+def _init_worker() -> None:
+    """Pool initializer: select the headless backend and build the visualizers once per process
+
+    Dashboards and risk analyses use figure templates, so each worker builds
+    those figures once and only refills them per symbol.
+    """
+    from src.rendering import set_render_mode
+    set_render_mode('headless')
+
+    from src.visualizer import AdvancedVisualizer
+    from src.interactive_viz import InteractiveVisualizer
+    from src.risk_analyzer import RiskAnalyzer
+    from src.main import plot_results
+
+    _worker_state.update({
+        'visualizer': AdvancedVisualizer(template=True),
+        'interactive': InteractiveVisualizer(),
+        'risk': RiskAnalyzer(template=True),
+        'plot_results': plot_results,
+    })
+
+
+def _render(artifact: str, payload: Dict, path: str) -> str:
+    """Render one artifact inside a worker process and return its path"""
+    if not _worker_state:
+        _init_worker()
+    if artifact == 'dashboard':
+        _worker_state['visualizer'].create_comprehensive_dashboard(
+            payload['results'], payload['symbol'], payload['metrics'], path)
+    elif artifact == 'interactive':
+        _worker_state['interactive'].create_interactive_dashboard(
+            payload['results'], payload['symbol'], payload['metrics'], path)
+    elif artifact == 'risk_analysis':
+        _worker_state['risk'].plot_risk_analysis(payload['analysis'], payload['symbol'], path)
+    elif artifact == 'backtest_plot':
+        _worker_state['plot_results'](payload['results'], payload['symbol'], path)
+    elif artifact == 'comparison':
+        _worker_state['visualizer'].create_comparison_chart(payload['results_dict'], path)
+    return path
+
+
+class RenderQueue:
+    """
+    Render plots in a pool of worker processes.
+
+    Jobs are (artifact type, payload, output path) triples; ``submit``
+    returns immediately with a future that resolves to the output path once
+    the file is written. Each worker initializes matplotlib with the headless
+    backend and builds its visualizers once, so the per-job cost is drawing
+    and encoding only.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, cache=None):
+        """
+        Args:
+            max_workers: Worker processes (default: number of CPUs)
+            cache: Optional ``RenderCache``; jobs whose artifact is up to date
+                are not sent to the workers
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.cache = cache
+        self.futures: List[Future] = []
+        # (future, artifact, path, fingerprint) of jobs to record in the cache
+        self._uncached: List[tuple] = []
+        self._executor = ProcessPoolExecutor(max_workers=self.max_workers,
+                                             mp_context=multiprocessing.get_context('spawn'),
+                                             initializer=_init_worker)
+
+    def submit(self, artifact: str, payload: Dict, path: str) -> Future:
+        """
+        Queue a render job.
+
+        Args:
+            artifact: One of ``ARTIFACT_TYPES``
+            payload: Data for the renderer ('results', 'symbol', 'metrics',
+                'analysis' or 'results_dict' depending on the artifact)
+            path: Output file
+
+        Returns:
+            Future: Resolves to ``path`` when the artifact is written
+        """
+        if artifact not in ARTIFACT_TYPES:
+            raise ValueError(f"Unknown artifact type '{artifact}'. Available: {', '.join(ARTIFACT_TYPES)}")
+        # The fingerprint is of the (float32) payload actually rendered, so these
+        # artifacts never reuse entries written by the float64 serial renderers
+        key = self.cache.lookup(artifact, path, payload) if self.cache is not None else None
+        if self.cache is not None and key is None:
+            # Up to date: resolve immediately without a worker round trip
+            future = Future()
+            future.set_result(path)
+        else:
+            future = self._executor.submit(_render, artifact, payload, path)
+            if key is not None:
+                self._uncached.append((future, artifact, path, key))
+        self.futures.append(future)
+        return future
+
+    def submit_backtest(self, results: pd.DataFrame, symbol: str, metrics: Dict,
+                        analysis: Dict, plots_dir: str = 'plots') -> List[Future]:
+        """Queue every per-symbol artifact drawn by ``run_backtest``"""
+        payload = {'results': compact_results(results), 'symbol': symbol, 'metrics': metrics}
+        return [
+            self.submit('dashboard', payload, os.path.join(plots_dir, f'{symbol}_dashboard.png')),
+            self.submit('interactive', payload, os.path.join(plots_dir, f'{symbol}_interactive.html')),
+            self.submit('risk_analysis', {'analysis': analysis, 'symbol': symbol},
+                        os.path.join(plots_dir, f'{symbol}_risk_analysis.png')),
+            self.submit('backtest_plot', payload, os.path.join(plots_dir, f'{symbol}_backtest_plot.png')),
+        ]
+
+    def submit_comparison(self, results_dict: Dict[str, Dict], path: str) -> Future:
+        """Queue the multi-symbol comparison chart"""
+        compact = {symbol: {'data': compact_results(entry['data']), 'metrics': entry['metrics']}
+                   for symbol, entry in results_dict.items()}
+        return self.submit('comparison', {'results_dict': compact}, path)
+
+    def wait(self) -> List[str]:
+        """
+        Block until every queued job is done.
+
+        Returns:
+            List[str]: Paths of the rendered artifacts, in submission order
+
+        Raises:
+            Exception: The first error raised by a failed job
+        """
+        wait_futures(self.futures)
+        paths = [future.result() for future in self.futures]
+        for future, artifact, path, key in self._uncached:
+            self.cache.store(artifact, path, key)
+        self.futures = []
+        self._uncached = []
+        return paths
+
+    def close(self, cancel_pending: bool = False) -> None:
+        """Wait for running jobs and stop the workers (dropping queued jobs if ``cancel_pending``)"""
+        self._executor.shutdown(wait=True, cancel_futures=cancel_pending)
+
+    def __enter__(self) -> 'RenderQueue':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        # After an error the queued jobs are abandoned rather than rendered
+        self.close(cancel_pending=exc_type is not None)
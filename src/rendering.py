@@ -0,0 +1,98 @@
+import functools
+import inspect
+import time
+from typing import Dict, List, Optional
+
+# Supported values of the [plotting] render_mode option
+RENDER_MODES = ('interactive', 'headless')
+
+# Non-GUI matplotlib backend used in headless mode
+HEADLESS_BACKEND = 'Agg'
+
+_render_mode: Optional[str] = None
+_render_timings: List[Dict] = []
+
+
+def get_render_mode() -> str:
+    """Current render mode, read from the ``[plotting]`` config section on first use"""
+    global _render_mode
+    if _render_mode is None:
+        from src.config import config
+        set_render_mode(config.get_plotting_params()['render_mode'])
+    return _render_mode
+
+
+def set_render_mode(mode: str) -> None:
+    """
+    Switch between interactive and headless rendering.
+
+    Headless mode selects a non-GUI matplotlib backend and never calls
+    ``show``, so batch runs neither block nor open windows or browsers.
+
+    Args:
+        mode (str): 'interactive' or 'headless'
+    """
+    global _render_mode
+    if mode not in RENDER_MODES:
+        raise ValueError(f"Unknown render mode '{mode}'. Available: {', '.join(RENDER_MODES)}")
+    if mode == 'headless':
+        import matplotlib
+        matplotlib.use(HEADLESS_BACKEND)
+    _render_mode = mode
+
+
+def is_headless() -> bool:
+    return get_render_mode() == 'headless'
+
+
+def timed_render(artifact: str):
+    """
+    Decorator reporting the render time of a plotting method.
+
+    The render mode is resolved before the figure is built, so the headless
+    backend is active when the decorated function creates its figure.
+
+    Args:
+        artifact (str): Artifact label used in the report
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            get_render_mode()
+            save_path = signature.bind(*args, **kwargs).arguments.get('save_path')
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - started
+                _render_timings.append({'artifact': artifact, 'path': save_path, 'seconds': elapsed})
+                print(f"Rendered {artifact} in {elapsed:.2f}s")
+        return wrapper
+    return decorator
+
+
+def show_figure(fig=None) -> None:
+    """Show a matplotlib figure (default: the current one) in interactive mode, then close it in every mode"""
+    import matplotlib.pyplot as plt
+    try:
+        if not is_headless():
+            plt.show()
+    finally:
+        plt.close(fig)
+
+
+def show_plotly(fig) -> None:
+    """Show a plotly figure in interactive mode only"""
+    if not is_headless():
+        fig.show()
+
+
+def render_timings() -> List[Dict]:
+    """Artifacts rendered so far with their path and render time in seconds"""
+    return list(_render_timings)
+
+
+def clear_render_timings() -> None:
+    _render_timings.clear()
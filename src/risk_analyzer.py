@@ -2,20 +2,24 @@ import matplotlib.pyplot as plt
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple
-import seaborn as sns
-from scipy import stats
 import os
+from src.risk_metrics import (compute_risk_analysis, calculate_risk_metrics, calculate_calmar_ratio,
+                              calculate_sortino_ratio, calculate_drawdown_duration)
+from src.rendering import show_figure, timed_render
+from src.figure_templates import risk_template
 
 class RiskAnalyzer:
     """Advanced risk analysis and visualization class"""
     
-    def __init__(self, figsize: Tuple[int, int] = (16, 12)):
+    def __init__(self, figsize: Tuple[int, int] = (16, 12), template: bool = False):
         self.figsize = figsize
+        # Reuse one persistent figure across symbols (batch rendering)
+        self.template = template
         plt.style.use('seaborn-v0_8')
         
     def comprehensive_risk_analysis(self, results: pd.DataFrame, symbol: str, 
                                   benchmark_data: pd.DataFrame = None, 
-                                  save_path: str = None) -> Dict:
+                                  save_path: str = None, bootstrap_resamples: int = 0) -> Dict:
         """
         Create comprehensive risk analysis dashboard
         
@@ -24,41 +28,55 @@ class RiskAnalyzer:
             symbol: Stock symbol
             benchmark_data: Optional benchmark data for comparison
             save_path: Optional path to save the plot
+            bootstrap_resamples: If positive, also report bootstrap confidence
+                intervals for the Sharpe, Sortino and Calmar ratios
             
         Returns:
             Dict: Calculated risk metrics
         """
-        fig, axes = plt.subplots(2, 3, figsize=(18, 12))
-        fig.suptitle(f'{symbol} - Comprehensive Risk Analysis', fontsize=16, fontweight='bold')
+        analysis = compute_risk_analysis(results, benchmark_data, bootstrap_resamples)
+        self.plot_risk_analysis(analysis, symbol, save_path)
+        if 'ratio_intervals' in analysis:
+            return {**analysis['metrics'], **analysis['ratio_intervals']}
+        return analysis['metrics']
+    
+    @timed_render('risk analysis')
+    def plot_risk_analysis(self, analysis: Dict, symbol: str, save_path: str = None) -> None:
+        """
+        Render the risk analysis dashboard from precomputed values
         
-        # Calculate returns and metrics
-        portfolio_values = pd.Series(results['Portfolio_Value'])
-        returns = portfolio_values.pct_change().dropna()
-        price_returns = results['Close'].pct_change().dropna()
+        Args:
+            analysis: Output of ``src.risk_metrics.compute_risk_analysis``
+            symbol: Stock symbol
+            save_path: Optional path to save the plot
+        """
+        if self.template:
+            risk_template(self).render(analysis, symbol, save_path)
+            return
         
-        risk_metrics = self._calculate_risk_metrics(returns)
+        fig, axes = plt.subplots(2, 3, figsize=(18, 12))
+        fig.suptitle(f'{symbol} - Comprehensive Risk Analysis', fontsize=16, fontweight='bold')
         
         # 1. Drawdown Analysis (Top Left)
-        self._plot_drawdown_analysis(axes[0, 0], portfolio_values, symbol)
+        self._plot_drawdown_analysis(axes[0, 0], analysis)
         
         # 2. Returns Distribution with Risk Measures (Top Center)
-        self._plot_returns_distribution_with_risk(axes[0, 1], returns)
+        self._plot_returns_distribution_with_risk(axes[0, 1], analysis)
         
         # 3. Rolling Volatility (Top Right)
-        self._plot_rolling_volatility(axes[0, 2], returns)
+        self._plot_rolling_volatility(axes[0, 2], analysis)
         
         # 4. Value at Risk Analysis (Bottom Left)
-        self._plot_var_analysis(axes[1, 0], returns)
+        self._plot_var_analysis(axes[1, 0], analysis)
         
         # 5. Beta Analysis (Bottom Center) - if benchmark provided
-        if benchmark_data is not None:
-            benchmark_returns = benchmark_data['Close'].pct_change().dropna()
-            self._plot_beta_analysis(axes[1, 1], returns, benchmark_returns)
+        if 'rolling_beta' in analysis:
+            self._plot_beta_analysis(axes[1, 1], analysis)
         else:
-            self._plot_correlation_analysis(axes[1, 1], returns, price_returns)
+            self._plot_correlation_analysis(axes[1, 1], analysis)
         
         # 6. Risk-Return Scatter over time (Bottom Right)
-        self._plot_risk_return_evolution(axes[1, 2], returns)
+        self._plot_risk_return_evolution(axes[1, 2], analysis)
         
         plt.tight_layout()
         
@@ -67,71 +85,43 @@ class RiskAnalyzer:
             plt.savefig(save_path, dpi=300, bbox_inches='tight', facecolor='white')
             print(f"Risk analysis saved to: {save_path}")
         
-        plt.show()
-        
-        return risk_metrics
+        show_figure(fig)
     
     def _calculate_risk_metrics(self, returns: pd.Series) -> Dict:
         """Calculate comprehensive risk metrics"""
-        annual_factor = 252  # Trading days per year
-        
-        metrics = {
-            'Volatility (Annual)': returns.std() * np.sqrt(annual_factor),
-            'Skewness': stats.skew(returns),
-            'Kurtosis': stats.kurtosis(returns),
-            'VaR (95%)': np.percentile(returns, 5),
-            'VaR (99%)': np.percentile(returns, 1),
-            'CVaR (95%)': returns[returns <= np.percentile(returns, 5)].mean(),
-            'CVaR (99%)': returns[returns <= np.percentile(returns, 1)].mean(),
-            'Maximum Daily Loss': returns.min(),
-            'Maximum Daily Gain': returns.max(),
-            'Positive Days Ratio': (returns > 0).mean(),
-            'Calmar Ratio': self._calculate_calmar_ratio(returns),
-            'Sortino Ratio': self._calculate_sortino_ratio(returns),
-        }
-        
-        return metrics
+        return calculate_risk_metrics(returns)
     
     def _calculate_calmar_ratio(self, returns: pd.Series) -> float:
         """Calculate Calmar ratio (Annual return / Max drawdown)"""
-        annual_return = (1 + returns.mean()) ** 252 - 1
-        cumulative = (1 + returns).cumprod()
-        running_max = cumulative.expanding().max()
-        drawdown = (cumulative - running_max) / running_max
-        max_drawdown = abs(drawdown.min())
-        
-        return annual_return / max_drawdown if max_drawdown != 0 else 0
+        return calculate_calmar_ratio(returns)
     
     def _calculate_sortino_ratio(self, returns: pd.Series) -> float:
         """Calculate Sortino ratio (focuses on downside deviation)"""
-        annual_return = (1 + returns.mean()) ** 252 - 1
-        downside_returns = returns[returns < 0]
-        downside_deviation = downside_returns.std() * np.sqrt(252)
-        
-        return annual_return / downside_deviation if downside_deviation != 0 else 0
+        return calculate_sortino_ratio(returns)
     
-    def _plot_drawdown_analysis(self, ax, portfolio_values: pd.Series, symbol: str):
+    def _plot_drawdown_analysis(self, ax, analysis: Dict):
         """Plot detailed drawdown analysis"""
-        running_max = portfolio_values.expanding().max()
-        drawdown = (portfolio_values - running_max) / running_max * 100
+        drawdown = analysis['drawdown']
         
         # Plot drawdown
         ax.fill_between(range(len(drawdown)), drawdown, 0, 
                        color='red', alpha=0.3, label='Drawdown')
         ax.plot(drawdown, color='red', linewidth=1.5)
         
-        # Mark significant drawdowns
-        significant_dd = drawdown[drawdown < -5]  # More than 5% drawdown
-        if not significant_dd.empty:
-            ax.scatter(significant_dd.index, significant_dd.values, 
+        # Mark the troughs of significant drawdown episodes
+        episodes = analysis['drawdown_episodes']
+        significant = episodes[episodes['depth'] < -5]  # More than 5% drawdown
+        if not significant.empty:
+            ax.scatter(significant['trough'], significant['depth'], 
                       color='darkred', s=30, zorder=5)
         
         # Statistics
         max_dd = drawdown.min()
         avg_dd = drawdown[drawdown < 0].mean()
-        dd_duration = self._calculate_drawdown_duration(drawdown)
+        dd_duration = analysis['max_drawdown_duration']
         
-        textstr = f'Max DD: {max_dd:.2f}%\nAvg DD: {avg_dd:.2f}%\nMax Duration: {dd_duration} days'
+        textstr = (f'Max DD: {max_dd:.2f}%\nAvg DD: {avg_dd:.2f}%\nMax Duration: {dd_duration} days\n'
+                   f'Episodes: {len(episodes)}')
         ax.text(0.02, 0.02, textstr, transform=ax.transAxes, 
                bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
         
@@ -141,23 +131,11 @@ class RiskAnalyzer:
     
     def _calculate_drawdown_duration(self, drawdown: pd.Series) -> int:
         """Calculate maximum drawdown duration"""
-        in_drawdown = drawdown < 0
-        drawdown_periods = []
-        current_period = 0
-        
-        for is_dd in in_drawdown:
-            if is_dd:
-                current_period += 1
-            else:
-                if current_period > 0:
-                    drawdown_periods.append(current_period)
-                current_period = 0
-        
-        return max(drawdown_periods) if drawdown_periods else 0
+        return calculate_drawdown_duration(drawdown)
     
-    def _plot_returns_distribution_with_risk(self, ax, returns: pd.Series):
+    def _plot_returns_distribution_with_risk(self, ax, analysis: Dict):
         """Plot returns distribution with risk measures"""
-        returns_pct = returns * 100
+        returns_pct = analysis['returns'] * 100
         
         # Histogram
         n, bins, patches = ax.hist(returns_pct, bins=50, alpha=0.7, 
@@ -166,12 +144,13 @@ class RiskAnalyzer:
         # Fit normal distribution
         mu, sigma = returns_pct.mean(), returns_pct.std()
         x = np.linspace(returns_pct.min(), returns_pct.max(), 100)
+        from scipy import stats
         normal_curve = stats.norm.pdf(x, mu, sigma)
         ax.plot(x, normal_curve, 'r-', linewidth=2, label='Normal Distribution')
         
         # Mark VaR levels
-        var_95 = np.percentile(returns_pct, 5)
-        var_99 = np.percentile(returns_pct, 1)
+        var_95 = analysis['metrics']['VaR (95%)'] * 100
+        var_99 = analysis['metrics']['VaR (99%)'] * 100
         
         ax.axvline(var_95, color='orange', linestyle='--', linewidth=2, 
                   label=f'VaR 95%: {var_95:.2f}%')
@@ -181,8 +160,8 @@ class RiskAnalyzer:
                   label=f'Mean: {mu:.2f}%')
         
         # Add skewness and kurtosis info
-        skewness = stats.skew(returns_pct)
-        kurtosis = stats.kurtosis(returns_pct)
+        skewness = analysis['metrics']['Skewness']
+        kurtosis = analysis['metrics']['Kurtosis']
         textstr = f'Skewness: {skewness:.3f}\nKurtosis: {kurtosis:.3f}'
         ax.text(0.75, 0.95, textstr, transform=ax.transAxes, 
                bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
@@ -193,18 +172,16 @@ class RiskAnalyzer:
         ax.legend()
         ax.grid(True, alpha=0.3)
     
-    def _plot_rolling_volatility(self, ax, returns: pd.Series):
+    def _plot_rolling_volatility(self, ax, analysis: Dict):
         """Plot rolling volatility analysis"""
-        windows = [20, 60, 120]  # 1 month, 3 months, 6 months
         colors = ['blue', 'green', 'red']
         
-        for window, color in zip(windows, colors):
-            rolling_vol = returns.rolling(window).std() * np.sqrt(252) * 100
+        for (window, rolling_vol), color in zip(analysis['rolling_volatility'].items(), colors):
             ax.plot(rolling_vol, color=color, linewidth=1.5, 
                    label=f'{window}-day Rolling Volatility', alpha=0.8)
         
         # Add overall volatility line
-        overall_vol = returns.std() * np.sqrt(252) * 100
+        overall_vol = analysis['metrics']['Volatility (Annual)'] * 100
         ax.axhline(overall_vol, color='black', linestyle='--', 
                   label=f'Overall Volatility: {overall_vol:.2f}%')
         
@@ -213,12 +190,10 @@ class RiskAnalyzer:
         ax.legend()
         ax.grid(True, alpha=0.3)
     
-    def _plot_var_analysis(self, ax, returns: pd.Series):
+    def _plot_var_analysis(self, ax, analysis: Dict):
         """Plot Value at Risk analysis over time"""
-        window = 60  # 3-month rolling window
-        
-        rolling_var_95 = returns.rolling(window).quantile(0.05) * 100
-        rolling_var_99 = returns.rolling(window).quantile(0.01) * 100
+        rolling_var_95 = analysis['rolling_var'][0.05]
+        rolling_var_99 = analysis['rolling_var'][0.01]
         
         ax.plot(rolling_var_95, color='orange', linewidth=2, 
                label='Rolling VaR 95%', alpha=0.8)
@@ -226,7 +201,7 @@ class RiskAnalyzer:
                label='Rolling VaR 99%', alpha=0.8)
         
         # Mark actual losses beyond VaR
-        returns_pct = returns * 100
+        returns_pct = analysis['returns'] * 100
         var_95_breaches = returns_pct[returns_pct < rolling_var_95]
         var_99_breaches = returns_pct[returns_pct < rolling_var_99]
         
@@ -243,23 +218,16 @@ class RiskAnalyzer:
         ax.legend()
         ax.grid(True, alpha=0.3)
     
-    def _plot_beta_analysis(self, ax, returns: pd.Series, benchmark_returns: pd.Series):
+    def _plot_beta_analysis(self, ax, analysis: Dict):
         """Plot beta analysis against benchmark"""
-        # Align returns
-        aligned_data = pd.DataFrame({'Portfolio': returns, 'Benchmark': benchmark_returns}).dropna()
-        
-        # Calculate rolling beta
-        window = 60
-        rolling_beta = aligned_data['Portfolio'].rolling(window).cov(aligned_data['Benchmark']) / \
-                      aligned_data['Benchmark'].rolling(window).var()
+        rolling_beta = analysis['rolling_beta']
         
         ax.plot(rolling_beta, color='blue', linewidth=2, label='Rolling Beta (60-day)')
         ax.axhline(1, color='black', linestyle='--', alpha=0.7, label='Beta = 1')
         ax.axhline(0, color='gray', linestyle='-', alpha=0.5)
         
         # Overall beta
-        overall_beta = np.cov(aligned_data['Portfolio'], aligned_data['Benchmark'])[0, 1] / \
-                      np.var(aligned_data['Benchmark'])
+        overall_beta = analysis['overall_beta']
         ax.axhline(overall_beta, color='red', linestyle='--', 
                   label=f'Overall Beta: {overall_beta:.3f}')
         
@@ -268,18 +236,16 @@ class RiskAnalyzer:
         ax.legend()
         ax.grid(True, alpha=0.3)
     
-    def _plot_correlation_analysis(self, ax, returns: pd.Series, price_returns: pd.Series):
+    def _plot_correlation_analysis(self, ax, analysis: Dict):
         """Plot correlation analysis with underlying asset"""
-        # Rolling correlation
-        window = 60
-        rolling_corr = returns.rolling(window).corr(price_returns)
+        rolling_corr = analysis['rolling_correlation']
         
         ax.plot(rolling_corr, color='purple', linewidth=2, 
                label='Rolling Correlation (60-day)')
         ax.axhline(0, color='gray', linestyle='-', alpha=0.5)
         
         # Overall correlation
-        overall_corr = returns.corr(price_returns)
+        overall_corr = analysis['overall_correlation']
         ax.axhline(overall_corr, color='red', linestyle='--', 
                   label=f'Overall Correlation: {overall_corr:.3f}')
         
@@ -288,25 +254,30 @@ class RiskAnalyzer:
         ax.legend()
         ax.grid(True, alpha=0.3)
     
-    def _plot_risk_return_evolution(self, ax, returns: pd.Series):
+    def _plot_risk_return_evolution(self, ax, analysis: Dict, colorbar: bool = True):
         """Plot risk-return evolution over time"""
-        window = 60
-        
-        rolling_return = returns.rolling(window).mean() * 252 * 100  # Annualized
-        rolling_risk = returns.rolling(window).std() * np.sqrt(252) * 100  # Annualized
+        evolution = pd.DataFrame({'risk': analysis['rolling_risk'],
+                                  'return': analysis['rolling_return']}).dropna()
         
         # Color points by time (blue to red)
-        colors = plt.cm.viridis(np.linspace(0, 1, len(rolling_return.dropna())))
+        colors = plt.cm.viridis(np.linspace(0, 1, len(evolution)))
         
-        scatter = ax.scatter(rolling_risk, rolling_return, c=colors, s=30, alpha=0.7)
+        scatter = ax.scatter(evolution['risk'], evolution['return'], c=colors, s=30, alpha=0.7)
         
-        # Add colorbar
-        plt.colorbar(scatter, ax=ax, label='Time Progress')
+        # Add colorbar (templates keep a persistent one)
+        if colorbar:
+            plt.colorbar(scatter, ax=ax, label='Time Progress')
         
         ax.set_title('Risk-Return Evolution', fontweight='bold')
         ax.set_xlabel('Risk (Annualized Volatility %)')
         ax.set_ylabel('Return (Annualized %)')
         ax.grid(True, alpha=0.3)
 
-# Global risk analyzer instance
-risk_analyzer = RiskAnalyzer()
\ No newline at end of file
+# Global risk analyzer instance, created on first access (the constructor sets
+# the matplotlib style)
+def __getattr__(name: str):
+    """Create the global ``risk_analyzer`` on first access"""
+    if name == 'risk_analyzer':
+        globals()[name] = RiskAnalyzer()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
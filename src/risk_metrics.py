@@ -0,0 +1,314 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, Optional
+from src.drawdown import drawdown_episodes, drawdown_series, max_drawdown_duration
+from src.rolling_quantile import rolling_quantile_frame
+from src.rolling_stats import rolling_stats
+
+ANNUAL_FACTOR = 252  # Trading days per year
+
+# Rolling windows used by the risk dashboard
+VOLATILITY_WINDOWS = [20, 60, 120]  # 1 month, 3 months, 6 months
+ROLLING_WINDOW = 60  # 3-month window for VaR, beta, correlation and risk/return
+VAR_LEVELS = [0.05, 0.01]  # Rolling VaR quantiles
+
+
+# Tail probabilities reported as VaR/CVaR
+TAIL_LEVELS = {'95%': 0.05, '99%': 0.01}
+
+RISK_METRIC_NAMES = [
+    'Volatility (Annual)', 'Skewness', 'Kurtosis', 'VaR (95%)', 'VaR (99%)',
+    'CVaR (95%)', 'CVaR (99%)', 'Maximum Daily Loss', 'Maximum Daily Gain',
+    'Positive Days Ratio', 'Calmar Ratio', 'Sortino Ratio',
+]
+
+RATIO_NAMES = ['Sharpe Ratio', 'Sortino Ratio', 'Calmar Ratio']
+
+
+def risk_metrics_kernel(returns, axis: int = -1) -> Dict[str, np.ndarray]:
+    """
+    Fused risk metric kernel for one or many return series.
+
+    All tail quantiles (and the min/max) come from a single ``np.partition``
+    call, CVaR is read off the partitioned prefix, the central moments are
+    taken in one pass over the demeaned data and the drawdown-based ratios
+    share one cumulative product. Results match ``np.percentile`` (linear
+    interpolation), ``scipy.stats.skew``/``kurtosis`` (biased, Fisher) and the
+    pandas-based ratio definitions.
+
+    Args:
+        returns: Array of returns, 1D or 2D (many series)
+        axis (int): Time axis of ``returns``
+
+    Returns:
+        Dict[str, np.ndarray]: One value per series for every name in
+        ``RISK_METRIC_NAMES`` (scalars for 1D input)
+    """
+    x = np.moveaxis(np.asarray(returns, dtype=float), axis, -1)
+    squeeze = x.ndim == 1
+    x = np.atleast_2d(x)
+    if x.ndim != 2:
+        raise ValueError("returns must be a 1D or 2D array")
+    n = x.shape[-1]
+    if n == 0:
+        raise ValueError("returns must not be empty")
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean = x.mean(axis=-1)
+        moments = _central_moments(x, mean)
+        tails = _tail_statistics(x)
+        ratios = _ratio_kernel(x, mean)
+
+        metrics = {
+            'Volatility (Annual)': moments['std'] * np.sqrt(ANNUAL_FACTOR),
+            'Skewness': moments['m3'] / moments['m2'] ** 1.5,
+            'Kurtosis': moments['m4'] / moments['m2'] ** 2 - 3,
+        }
+        metrics.update(tails)
+        metrics['Positive Days Ratio'] = (x > 0).mean(axis=-1)
+        metrics.update(ratios)
+
+    if squeeze:
+        return {name: value[0] for name, value in metrics.items()}
+    return metrics
+
+
+def _central_moments(x: np.ndarray, mean: np.ndarray) -> Dict[str, np.ndarray]:
+    """Second to fourth central moments and sample std from one pass over the demeaned data"""
+    n = x.shape[-1]
+    d = x - mean[:, None]
+    d2 = d * d
+    m2 = d2.mean(axis=-1)
+    m3 = (d2 * d).mean(axis=-1)
+    m4 = (d2 * d2).mean(axis=-1)
+    std = np.sqrt(m2 * n / (n - 1)) if n > 1 else np.full_like(m2, np.nan)
+    return {'m2': m2, 'm3': m3, 'm4': m4, 'std': std}
+
+
+def _lerp(a: np.ndarray, b: np.ndarray, t: float) -> np.ndarray:
+    """Linear interpolation computed the same way as np.percentile"""
+    diff = b - a
+    return np.where(t >= 0.5, b - diff * (1 - t), a + diff * t)
+
+
+def tail_depth(n: int) -> int:
+    """Number of smallest values of an ``n``-long series that determine its VaR/CVaR"""
+    return min(n, max(int(np.floor(q * (n - 1))) for q in TAIL_LEVELS.values()) + 2)
+
+
+def _tail_statistics(x: np.ndarray, n: Optional[int] = None) -> Dict[str, np.ndarray]:
+    """
+    VaR, CVaR, minimum and maximum from a single partial sort.
+
+    ``n`` is the series length when ``x`` only holds the ``tail_depth(n)``
+    smallest values of each series; the maximum is then that of ``x``, and
+    CVaR ties with VaR are only counted among the kept values.
+    """
+    m = x.shape[-1]
+    n = m if n is None else n
+    positions = {label: q * (n - 1) for label, q in TAIL_LEVELS.items()}
+    kth = {0, m - 1}
+    for pos in positions.values():
+        lo = int(np.floor(pos))
+        kth.update({lo, min(lo + 1, n - 1)})
+
+    part = np.partition(x, sorted(kth), axis=-1)
+    deepest = max(int(np.floor(pos)) for pos in positions.values())
+    prefix = np.cumsum(part[:, :deepest + 1], axis=-1)
+
+    stats_out = {}
+    for label, pos in positions.items():
+        lo = int(np.floor(pos))
+        hi = min(lo + 1, n - 1)
+        var = _lerp(part[:, lo], part[:, hi], pos - lo)
+
+        # The lo+1 smallest returns are all <= VaR; larger ones only count when tied with it
+        count = np.full(len(var), lo + 1.0)
+        total = prefix[:, lo].copy()
+        tied_rows = np.flatnonzero(part[:, hi] == var) if hi > lo else []
+        if len(tied_rows):
+            ties = (part[tied_rows, lo + 1:] == var[tied_rows, None]).sum(axis=-1)
+            count[tied_rows] += ties
+            total[tied_rows] += ties * var[tied_rows]
+
+        stats_out[f'VaR ({label})'] = var
+        stats_out[f'CVaR ({label})'] = total / count
+
+    stats_out['Maximum Daily Loss'] = part[:, 0]
+    stats_out['Maximum Daily Gain'] = part[:, m - 1]
+    return {name: stats_out[name] for name in
+            ['VaR (95%)', 'VaR (99%)', 'CVaR (95%)', 'CVaR (99%)', 'Maximum Daily Loss', 'Maximum Daily Gain']}
+
+
+def _ratio_kernel(x: np.ndarray, mean: np.ndarray) -> Dict[str, np.ndarray]:
+    """Calmar and Sortino ratios; drawdowns come from a single cumulative product"""
+    annual_return = (1 + mean) ** ANNUAL_FACTOR - 1
+
+    cumulative = np.cumprod(1 + x, axis=-1)
+    running_max = np.maximum.accumulate(cumulative, axis=-1)
+    max_drawdown = np.abs(((cumulative - running_max) / running_max).min(axis=-1))
+    calmar = np.where(max_drawdown != 0, annual_return / max_drawdown, 0.0)
+
+    downside = x < 0
+    n_down = downside.sum(axis=-1)
+    down_mean = np.where(downside, x, 0).sum(axis=-1) / n_down
+    down_ss = (np.where(downside, x - down_mean[:, None], 0) ** 2).sum(axis=-1)
+    downside_deviation = np.where(n_down > 1, np.sqrt(down_ss / (n_down - 1)), np.nan) * np.sqrt(ANNUAL_FACTOR)
+    sortino = np.where(downside_deviation != 0, annual_return / downside_deviation, 0.0)
+
+    return {'Calmar Ratio': calmar, 'Sortino Ratio': sortino}
+
+
+def ratio_kernel(returns, axis: int = -1) -> Dict[str, np.ndarray]:
+    """
+    Sharpe, Sortino and Calmar ratios for one or many return series.
+
+    The Sharpe ratio follows ``BaseStrategy.calculate_metrics`` (annualized,
+    zero when the returns have no dispersion); Sortino and Calmar are the
+    ``risk_metrics_kernel`` definitions.
+
+    Args:
+        returns: Array of returns, 1D or 2D (many series)
+        axis (int): Time axis of ``returns``
+
+    Returns:
+        Dict[str, np.ndarray]: One value per series for every name in ``RATIO_NAMES``
+    """
+    x = np.atleast_2d(np.moveaxis(np.asarray(returns, dtype=float), axis, -1))
+    n = x.shape[-1]
+    if n < 2:
+        raise ValueError("need at least two returns")
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean = x.mean(axis=-1)
+        d = x - mean[..., None]
+        std = np.sqrt(np.einsum('...i,...i->...', d, d) / (n - 1))
+        ratios = {'Sharpe Ratio': np.where(std != 0, np.sqrt(ANNUAL_FACTOR) * mean / std, 0.0)}
+        ratios.update(_ratio_kernel(x, mean))
+
+    if np.ndim(returns) == 1:
+        return {name: ratios[name][0] for name in RATIO_NAMES}
+    return {name: ratios[name] for name in RATIO_NAMES}
+
+
+def tail_risk_kernel(returns, axis: int = -1, n: Optional[int] = None) -> Dict[str, np.ndarray]:
+    """
+    VaR and CVaR at ``TAIL_LEVELS`` for one or many return series.
+
+    The tail-only part of ``risk_metrics_kernel`` (one partial sort per series).
+
+    Args:
+        returns: Array of returns, 1D or 2D (many series)
+        axis (int): Time axis of ``returns``
+        n (int, optional): Length of the series when ``returns`` only holds
+            their ``tail_depth(n)`` smallest values (e.g. kept while streaming)
+
+    Returns:
+        Dict[str, np.ndarray]: ``VaR (..)`` and ``CVaR (..)`` values per series
+    """
+    x = np.atleast_2d(np.moveaxis(np.asarray(returns, dtype=float), axis, -1))
+    if x.shape[-1] == 0:
+        raise ValueError("returns must not be empty")
+    if n is not None and x.shape[-1] < tail_depth(n):
+        raise ValueError(f"returns must hold the {tail_depth(n)} smallest values of each series")
+    tails = _tail_statistics(x, n)
+    names = [f'{kind} ({label})' for kind in ('VaR', 'CVaR') for label in TAIL_LEVELS]
+    if np.ndim(returns) == 1:
+        return {name: tails[name][0] for name in names}
+    return {name: tails[name] for name in names}
+
+
+def calculate_risk_metrics(returns: pd.Series) -> Dict:
+    """Calculate comprehensive risk metrics"""
+    kernel = risk_metrics_kernel(np.asarray(returns))
+    return {name: float(kernel[name]) for name in RISK_METRIC_NAMES}
+
+
+def calculate_calmar_ratio(returns: pd.Series) -> float:
+    """Calculate Calmar ratio (Annual return / Max drawdown)"""
+    x = np.atleast_2d(np.asarray(returns, dtype=float))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return float(_ratio_kernel(x, x.mean(axis=-1))['Calmar Ratio'][0])
+
+
+def calculate_sortino_ratio(returns: pd.Series) -> float:
+    """Calculate Sortino ratio (focuses on downside deviation)"""
+    x = np.atleast_2d(np.asarray(returns, dtype=float))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return float(_ratio_kernel(x, x.mean(axis=-1))['Sortino Ratio'][0])
+
+
+def calculate_drawdown(portfolio_values: pd.Series) -> pd.Series:
+    """Drawdown from the running peak, in percent"""
+    return pd.Series(drawdown_series(portfolio_values) * 100, index=portfolio_values.index)
+
+
+def calculate_drawdown_duration(drawdown: pd.Series) -> int:
+    """Calculate maximum drawdown duration"""
+    return max_drawdown_duration(drawdown)
+
+
+def compute_risk_analysis(results: pd.DataFrame,
+                          benchmark_data: Optional[pd.DataFrame] = None,
+                          bootstrap_resamples: int = 0) -> Dict:
+    """
+    Compute risk metrics plus the drawdown and rolling series behind the risk dashboard
+
+    Args:
+        results: Backtest results DataFrame with Close and Portfolio_Value columns
+        benchmark_data: Optional benchmark data (with a Close column) for beta analysis
+        bootstrap_resamples: If positive, add stationary-bootstrap 95% intervals
+            for the Sharpe, Sortino and Calmar ratios as ``ratio_intervals``
+
+    Returns:
+        Dict: ``metrics`` (same fields as RiskAnalyzer._calculate_risk_metrics),
+        the return series, ``drawdown``, the ``drawdown_episodes`` table and
+        the rolling volatility, VaR, beta/correlation and risk/return series
+    """
+    portfolio_values = pd.Series(results['Portfolio_Value'])
+    returns = portfolio_values.pct_change().dropna()
+    price_returns = results['Close'].pct_change().dropna()
+    drawdown = calculate_drawdown(portfolio_values)
+    stats = rolling_stats(returns)
+    episodes = drawdown_episodes(portfolio_values, dates=results.get('Date'),
+                                 drawdown=drawdown.to_numpy() / 100)
+
+    analysis = {
+        'metrics': calculate_risk_metrics(returns),
+        'portfolio_values': portfolio_values,
+        'returns': returns,
+        'price_returns': price_returns,
+        'drawdown': drawdown,
+        'drawdown_episodes': episodes,
+        'max_drawdown_duration': int(episodes['duration'].max()) if len(episodes) else 0,
+        'rolling_volatility': {
+            window: stats.std(window) * np.sqrt(ANNUAL_FACTOR) * 100
+            for window in VOLATILITY_WINDOWS
+        },
+        'rolling_var': {
+            level: var_series * 100
+            for level, var_series in rolling_quantile_frame(returns, ROLLING_WINDOW, VAR_LEVELS).items()
+        },
+        'rolling_return': stats.mean(ROLLING_WINDOW) * ANNUAL_FACTOR * 100,
+        'rolling_risk': stats.std(ROLLING_WINDOW) * np.sqrt(ANNUAL_FACTOR) * 100,
+    }
+
+    if benchmark_data is not None:
+        benchmark_returns = benchmark_data['Close'].pct_change().dropna()
+        aligned_data = pd.DataFrame({'Portfolio': returns, 'Benchmark': benchmark_returns}).dropna()
+        pair_stats = rolling_stats(aligned_data['Portfolio'], aligned_data['Benchmark'])
+        analysis['rolling_beta'] = pair_stats.beta(ROLLING_WINDOW)
+        analysis['overall_beta'] = np.cov(aligned_data['Portfolio'], aligned_data['Benchmark'])[0, 1] / \
+            np.var(aligned_data['Benchmark'])
+    else:
+        aligned_data = pd.DataFrame({'Portfolio': returns, 'Price': price_returns})
+        pair_stats = rolling_stats(aligned_data['Portfolio'], aligned_data['Price'])
+        analysis['rolling_correlation'] = pair_stats.corr(ROLLING_WINDOW)
+        analysis['overall_correlation'] = returns.corr(price_returns)
+
+    if bootstrap_resamples:
+        # Imported here: src.bootstrap builds on this module's kernels
+        from src.bootstrap import bootstrap_ratio_intervals
+        analysis['ratio_intervals'] = bootstrap_ratio_intervals(returns, bootstrap_resamples).iloc[0].to_dict()
+
+    return analysis
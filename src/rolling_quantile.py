@@ -0,0 +1,268 @@
+import bisect
+import math
+from collections import deque
+from typing import List, Sequence
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Longest window handled by the blocked kernel; beyond it pandas' skiplist is faster
+BLOCKED_MAX_WINDOW = 128
+
+# Elements materialized per chunk by the blocked kernel (bounds peak memory)
+QUANTILE_CHUNK_ELEMENTS = 1 << 22
+
+
+class RollingQuantile:
+    """
+    Exact sliding-window quantiles over a stream of values.
+
+    The window is kept as a sorted list: each new value is inserted and the
+    value leaving the window removed by binary search, so an update costs
+    O(log w) comparisons plus a memmove instead of re-sorting the window.
+    All requested quantiles are read from the same sorted window, with the
+    linear interpolation used by ``pandas.Series.rolling().quantile``.
+    A window containing NaN yields NaN, as in pandas.
+    """
+
+    def __init__(self, window: int, quantiles: Sequence[float]):
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        self.window = window
+        self.quantiles = [float(q) for q in quantiles]
+        if any(not 0 <= q <= 1 for q in self.quantiles):
+            raise ValueError("quantiles must be between 0 and 1")
+        self._values = deque()
+        self._sorted = []
+        self._nans = 0
+
+    def update(self, value: float) -> np.ndarray:
+        """
+        Add a value and return the quantiles of the current window.
+
+        Returns:
+            np.ndarray: One value per quantile, NaN until the window is full
+        """
+        self._values.append(value)
+        if math.isnan(value):
+            self._nans += 1
+        else:
+            bisect.insort(self._sorted, value)
+
+        if len(self._values) > self.window:
+            old = self._values.popleft()
+            if math.isnan(old):
+                self._nans -= 1
+            else:
+                del self._sorted[bisect.bisect_left(self._sorted, old)]
+
+        if len(self._values) < self.window or self._nans:
+            return np.full(len(self.quantiles), np.nan)
+        return np.array([self._interpolate(q) for q in self.quantiles])
+
+    def _interpolate(self, q: float) -> float:
+        position = q * (len(self._sorted) - 1)
+        lo = int(position)
+        if lo == position:
+            return self._sorted[lo]
+        low, high = self._sorted[lo], self._sorted[lo + 1]
+        return low + (high - low) * (position - lo)
+
+
+class StreamingRollingQuantile:
+    """
+    Approximate sliding-window quantiles for live feeds.
+
+    Values are counted in a fixed histogram of ``resolution``-wide bins over
+    ``[lower, upper]``, held in a Fenwick tree so an update and each quantile
+    lookup cost O(log bins) whatever the window length. For values inside the
+    range each quantile is within ``resolution / 2`` of the exact rolling
+    quantile. Values outside the range are clamped to the edge bins, so their
+    quantiles saturate at the bounds.
+    """
+
+    def __init__(self, window: int, quantiles: Sequence[float],
+                 lower: float = -0.25, upper: float = 0.25, resolution: float = 1e-4):
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        if upper <= lower or resolution <= 0:
+            raise ValueError("need lower < upper and a positive resolution")
+        self.window = window
+        self.quantiles = [float(q) for q in quantiles]
+        self.lower = lower
+        self.resolution = resolution
+        self.max_error = resolution / 2
+        self._n_bins = int(math.ceil((upper - lower) / resolution))
+        self._tree = [0] * (self._n_bins + 1)
+        self._top_bit = 1 << (self._n_bins.bit_length() - 1)
+        self._bins = deque()
+        self._nans = 0
+
+    def update(self, value: float) -> np.ndarray:
+        """
+        Add a value and return the approximate quantiles of the current window.
+
+        Returns:
+            np.ndarray: One value per quantile, NaN until the window is full
+        """
+        if math.isnan(value):
+            self._bins.append(-1)
+            self._nans += 1
+        else:
+            b = min(max(int((value - self.lower) // self.resolution), 0), self._n_bins - 1)
+            self._bins.append(b)
+            self._add(b, 1)
+
+        if len(self._bins) > self.window:
+            old = self._bins.popleft()
+            if old < 0:
+                self._nans -= 1
+            else:
+                self._add(old, -1)
+
+        if len(self._bins) < self.window or self._nans:
+            return np.full(len(self.quantiles), np.nan)
+
+        result = []
+        for q in self.quantiles:
+            position = q * (self.window - 1)
+            lo = int(position)
+            low = self._center(self._find(lo))
+            high = self._center(self._find(min(lo + 1, self.window - 1))) if position > lo else low
+            result.append(low + (high - low) * (position - lo))
+        return np.array(result)
+
+    def _add(self, b: int, delta: int) -> None:
+        i = b + 1
+        while i <= self._n_bins:
+            self._tree[i] += delta
+            i += i & -i
+
+    def _find(self, rank: int) -> int:
+        """Bin holding the value of 0-based ``rank`` in the window"""
+        position, remaining, step = 0, rank + 1, self._top_bit
+        while step:
+            nxt = position + step
+            if nxt <= self._n_bins and self._tree[nxt] < remaining:
+                position = nxt
+                remaining -= self._tree[nxt]
+            step >>= 1
+        return position
+
+    def _center(self, b: int) -> float:
+        return self.lower + (b + 0.5) * self.resolution
+
+
+def rolling_quantiles(values, window: int, quantiles: Sequence[float]) -> np.ndarray:
+    """
+    Exact rolling quantiles of a series, several quantiles in one sweep.
+
+    Equivalent to ``series.rolling(window).quantile(q)`` for every ``q``
+    (linear interpolation, NaN for incomplete windows and windows holding a
+    NaN). Windows up to ``BLOCKED_MAX_WINDOW`` bars use a blocked NumPy kernel
+    that shares the work between all quantiles; longer windows use the
+    skiplist behind pandas' rolling quantile, which is faster there.
+
+    Args:
+        values: Return series (array-like)
+        window (int): Window length in bars
+        quantiles (Sequence[float]): Quantiles in [0, 1]
+
+    Returns:
+        np.ndarray: Array of shape ``(len(values), len(quantiles))``; the first
+        ``window - 1`` rows are NaN
+    """
+    x = np.asarray(values, dtype=float)
+    q = np.asarray(quantiles, dtype=float)
+    if window < 1:
+        raise ValueError("window must be at least 1")
+    if ((q < 0) | (q > 1)).any():
+        raise ValueError("quantiles must be between 0 and 1")
+
+    if window > BLOCKED_MAX_WINDOW:
+        series = pd.Series(x)
+        return np.column_stack([series.rolling(window).quantile(p).to_numpy() for p in q.tolist()]) \
+            if len(q) else np.empty((len(x), 0))
+
+    out = np.full((len(x), len(q)), np.nan)
+    if len(x) < window or not len(q):
+        return out
+
+    positions = q * (window - 1)
+    lo = positions.astype(int)
+    hi = np.minimum(lo + 1, window - 1)
+    ranks = sorted(set(lo.tolist()) | set(hi.tolist()))
+    order_stats = _blocked_order_statistics(x, window, ranks)
+
+    column = {rank: j for j, rank in enumerate(ranks)}
+    low = order_stats[:, [column[r] for r in lo.tolist()]]
+    high = order_stats[:, [column[r] for r in hi.tolist()]]
+    with np.errstate(invalid='ignore'):
+        result = low + (high - low) * (positions - lo)
+
+    nan_total = np.concatenate(([0], np.cumsum(np.isnan(x))))
+    result[(nan_total[window:] - nan_total[:-window]) > 0] = np.nan
+    out[window - 1:] = result
+    return out
+
+
+def _blocked_order_statistics(x: np.ndarray, window: int, ranks: List[int]) -> np.ndarray:
+    """
+    Order statistics ``ranks`` of every full window, in blocks of ``B`` consecutive windows.
+
+    The ``window - B + 1`` bars shared by all windows of a block (the core) are
+    partially sorted once. Each window adds only ``B - 1`` edge bars to the
+    core, so its k-th smallest value is among the core's order statistics
+    ``k - B + 1 .. k`` and its own edge bars: a ``2B - 1`` element selection
+    instead of a full window sort.
+    """
+    n, w = len(x), window
+    block = max(1, min(w, int(round(math.sqrt(w)))))
+    n_windows = n - w + 1
+    n_blocks = -(-n_windows // block)
+    core_len = w - block + 1
+
+    # NaN windows are masked by the caller; pad so the last block is complete
+    padded = np.concatenate((np.where(np.isnan(x), np.inf, x), np.full(n_blocks * block - n_windows, np.inf)))
+    cores = sliding_window_view(padded, core_len)
+
+    slices = {k: (max(0, k - block + 1), min(k, core_len - 1)) for k in ranks}
+    kth = sorted({i for a, b in slices.values() for i in (a, b)})
+    segments = []
+    for a, b in sorted(slices.values()):
+        if segments and a <= segments[-1][1] + 1:
+            segments[-1][1] = max(segments[-1][1], b)
+        else:
+            segments.append([a, b])
+
+    # Edge bars of window t of a block: t-th run of B-1 bars in [left edge, right edge]
+    offsets = np.arange(block - 1)
+    edge_index = np.arange(block)[:, None] + offsets[None, :]
+
+    order_stats = np.empty((n_blocks * block, len(ranks)))
+    blocks_per_chunk = max(1, QUANTILE_CHUNK_ELEMENTS // (2 * block * block + core_len))
+    for first in range(0, n_blocks, blocks_per_chunk):
+        blocks = np.arange(first, min(n_blocks, first + blocks_per_chunk))
+        ends = w - 1 + blocks * block  # last bar of each block's first window
+
+        core = np.partition(cores[ends + block - w], kth, axis=1)
+        for a, b in segments:
+            core[:, a:b + 1].sort(axis=1)
+
+        edge_positions = np.concatenate((ends[:, None] - w + 1 + offsets, ends[:, None] + 1 + offsets), axis=1)
+        edges = padded[edge_positions[:, edge_index]]
+
+        rows = slice(first * block, (first + len(blocks)) * block)
+        for j, k in enumerate(ranks):
+            a, b = slices[k]
+            candidates = np.broadcast_to(core[:, None, a:b + 1], (len(blocks), block, b - a + 1))
+            merged = np.concatenate((candidates, edges), axis=2)
+            order_stats[rows, j] = np.partition(merged, k - a, axis=2)[:, :, k - a].ravel()
+
+    return order_stats[:n_windows]
+
+
+def rolling_quantile_frame(series: pd.Series, window: int, quantiles: Sequence[float]) -> pd.DataFrame:
+    """``rolling_quantiles`` on a Series, returned as a frame with one column per quantile"""
+    return pd.DataFrame(rolling_quantiles(series, window, quantiles),
+                        index=series.index, columns=list(quantiles))
@@ -0,0 +1,219 @@
+import hashlib
+from collections import OrderedDict
+from typing import Dict, Iterable, Union
+import numpy as np
+import pandas as pd
+
+# Bars per block of the compensated prefix sums
+PREFIX_BLOCK = 4096
+
+# Number of RollingStats engines kept by the shared cache
+CACHE_SIZE = 32
+
+# Variances below this fraction of the window's second moment are rounding noise
+VARIANCE_ROUNDOFF = 64 * np.finfo(float).eps
+
+_cache: "OrderedDict[str, RollingStats]" = OrderedDict()
+
+
+class RollingStats:
+    """
+    Rolling mean, std, covariance, correlation and beta from prefix sums.
+
+    The series (and optionally a second series ``y``) are centered on their
+    mean, then prefix sums of ``x``, ``x*x``, ``y``, ``y*y`` and ``x*y`` are
+    built once. Any window statistic is a difference of two prefix values,
+    so every additional window costs O(n) with no per-window loop. Prefix sums
+    are accumulated per block, with the block offsets carried as compensated
+    (Kahan) pairs, so the rounding error does not grow with the series length.
+
+    Results follow pandas ``rolling(window)`` semantics: NaN until the window
+    is full and for windows holding a NaN (in either series). Outputs are
+    memoized per (statistic, window) and returned read-only (copy them
+    before editing in place); use ``rolling_stats()`` to share an engine
+    between modules working on the same data.
+    """
+
+    def __init__(self, x, y=None):
+        self.index = x.index if isinstance(x, pd.Series) else None
+        x = np.asarray(x, dtype=float)
+        self.n = len(x)
+        x_nan = np.isnan(x)
+        self._nan_prefix = {'x': np.concatenate(([0], np.cumsum(x_nan)))}
+        self._x_mean, centered = _center(x, x_nan)
+        self._sums = {'x': _compensated_prefix(centered), 'xx': _compensated_prefix(centered * centered)}
+        self._changes = {'x': _change_prefix(centered)}
+
+        if y is not None:
+            y = np.asarray(y, dtype=float)
+            if y.shape != x.shape:
+                raise ValueError("x and y must have the same length")
+            # Pairwise statistics only use bars where both series are present
+            pair_nan = x_nan | np.isnan(y)
+            self._nan_prefix['pair'] = np.concatenate(([0], np.cumsum(pair_nan)))
+            _, px = _center(x, pair_nan)
+            _, py = _center(y, pair_nan)
+            self._sums.update({
+                'px': _compensated_prefix(px), 'pxx': _compensated_prefix(px * px),
+                'py': _compensated_prefix(py), 'pyy': _compensated_prefix(py * py),
+                'pxy': _compensated_prefix(px * py),
+            })
+            self._changes.update({'px': _change_prefix(px), 'py': _change_prefix(py)})
+        self._results: Dict = {}
+
+    def mean(self, window: int):
+        """Rolling mean of ``x``"""
+        return self._memo('mean', window, 'x', lambda: self._window_sum('x', window) / window + self._x_mean)
+
+    def var(self, window: int, ddof: int = 1):
+        """Rolling variance of ``x``"""
+        return self._memo(('var', ddof), window, 'x', lambda: self._var('x', window, ddof))
+
+    def std(self, window: int, ddof: int = 1):
+        """Rolling standard deviation of ``x``"""
+        return self._memo(('std', ddof), window, 'x', lambda: np.sqrt(self._var('x', window, ddof)))
+
+    def cov(self, window: int, ddof: int = 1):
+        """Rolling covariance of ``x`` and ``y``"""
+        return self._memo(('cov', ddof), window, 'pair', lambda: self._cov(window, ddof))
+
+    def corr(self, window: int):
+        """Rolling correlation of ``x`` and ``y``"""
+        def compute():
+            with np.errstate(divide='ignore', invalid='ignore'):
+                return self._cov(window, 1) / np.sqrt(self._var('px', window, 1) * self._var('py', window, 1))
+        return self._memo('corr', window, 'pair', compute)
+
+    def beta(self, window: int):
+        """Rolling beta of ``x`` against ``y`` (cov(x, y) / var(y))"""
+        def compute():
+            with np.errstate(divide='ignore', invalid='ignore'):
+                return self._cov(window, 1) / self._var('py', window, 1)
+        return self._memo('beta', window, 'pair', compute)
+
+    def many(self, statistic: str, windows: Iterable[int]) -> Dict[int, Union[np.ndarray, pd.Series]]:
+        """Evaluate one statistic (e.g. ``'std'``) for several windows"""
+        method = getattr(self, statistic)
+        return {window: method(window) for window in windows}
+
+    def _memo(self, key, window: int, mask: str, compute):
+        if mask not in self._nan_prefix:
+            raise ValueError("y is required for this statistic")
+        if (key, window) not in self._results:
+            if window < 1:
+                raise ValueError("window must be at least 1")
+            values = np.full(self.n, np.nan)
+            if self.n >= window:
+                nan_prefix = self._nan_prefix[mask]
+                has_nan = (nan_prefix[window:] - nan_prefix[:-window]) > 0
+                values[window - 1:] = np.where(has_nan, np.nan, compute())
+            # Shared with every later caller, so in-place edits must not reach it
+            values.flags.writeable = False
+            self._results[key, window] = values
+        values = self._results[key, window]
+        return pd.Series(values, index=self.index, copy=False) if self.index is not None else values
+
+    def _window_sum(self, name: str, window: int) -> np.ndarray:
+        hi, lo = self._sums[name]
+        return (hi[window:] - hi[:-window]) + (lo[window:] - lo[:-window])
+
+    def _constant(self, name: str, window: int) -> np.ndarray:
+        """Whether each full window of a series holds a single repeated value"""
+        changes = self._changes[name]
+        return changes[window - 1:] == changes[:len(changes) - window + 1]
+
+    def _var(self, name: str, window: int, ddof: int) -> np.ndarray:
+        if window - ddof <= 0:
+            return np.full(self.n - window + 1, np.nan)
+        s1 = self._window_sum(name, window)
+        s2 = self._window_sum(name + name[-1], window)
+        centered = s2 - s1 * s1 / window
+        # Prefix differences leave rounding noise in flat windows (e.g. out of the market)
+        centered[(centered < VARIANCE_ROUNDOFF * s2) | self._constant(name, window)] = 0.0
+        return centered / (window - ddof)
+
+    def _cov(self, window: int, ddof: int) -> np.ndarray:
+        if window - ddof <= 0:
+            return np.full(self.n - window + 1, np.nan)
+        sx = self._window_sum('px', window)
+        sy = self._window_sum('py', window)
+        centered = self._window_sum('pxy', window) - sx * sy / window
+        centered[self._constant('px', window) | self._constant('py', window)] = 0.0
+        return centered / (window - ddof)
+
+
+def _center(values: np.ndarray, nan: np.ndarray):
+    """Mean of the present values and the centered series, with masked bars set to zero"""
+    mean = float(values[~nan].mean()) if (~nan).any() else 0.0
+    return mean, np.where(nan, 0.0, values - mean)
+
+
+def _change_prefix(values: np.ndarray) -> np.ndarray:
+    """Number of value changes up to each bar (windows without a change are constant)"""
+    return np.concatenate(([0], np.cumsum(values[1:] != values[:-1])))
+
+
+def _compensated_prefix(values: np.ndarray):
+    """
+    Prefix sums (with a leading zero) as a (block offsets, within-block sums) pair.
+
+    Within-block cumulative sums are short, so their error is bounded by the
+    block length. Block totals are accumulated with Kahan summation; the
+    running compensation is folded into the within-block part.
+    """
+    n = len(values)
+    n_blocks = max(1, -(-n // PREFIX_BLOCK))
+    padded = np.zeros(n_blocks * PREFIX_BLOCK)
+    padded[:n] = values
+    local = np.cumsum(padded.reshape(n_blocks, PREFIX_BLOCK), axis=1)
+
+    offsets = np.empty(n_blocks)
+    corrections = np.empty(n_blocks)
+    total, compensation = 0.0, 0.0
+    for b, block_total in enumerate(local[:, -1].tolist()):
+        offsets[b], corrections[b] = total, compensation
+        term = block_total - compensation
+        new_total = total + term
+        compensation = (new_total - total) - term
+        total = new_total
+
+    hi = np.concatenate(([0.0], np.repeat(offsets, PREFIX_BLOCK)[:n]))
+    lo = np.concatenate(([0.0], (local - corrections[:, None]).ravel()[:n]))
+    return hi, lo
+
+
+def _fingerprint(series) -> bytes:
+    if isinstance(series, pd.Series):
+        return pd.util.hash_pandas_object(series, index=True).to_numpy().tobytes()
+    return np.ascontiguousarray(series, dtype=float).tobytes()
+
+
+def rolling_stats(x, y=None) -> RollingStats:
+    """
+    Return a shared ``RollingStats`` for ``x`` (and ``y``), keyed by content.
+
+    Modules computing rolling statistics over the same returns (risk
+    metrics, risk dashboard, interactive dashboard) get the same engine, so
+    prefix sums and computed windows are reused instead of recomputed.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(_fingerprint(x))
+    if y is not None:
+        digest.update(b'|')
+        digest.update(_fingerprint(y))
+    key = digest.hexdigest()
+
+    if key in _cache:
+        _cache.move_to_end(key)
+        return _cache[key]
+
+    stats = RollingStats(x, y)
+    _cache[key] = stats
+    if len(_cache) > CACHE_SIZE:
+        _cache.popitem(last=False)
+    return stats
+
+
+def clear_rolling_cache() -> None:
+    """Drop all shared RollingStats engines"""
+    _cache.clear()
@@ -0,0 +1,208 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Union
+
+# Well-known equity drawdown windows (peak to trough, inclusive)
+HISTORICAL_SCENARIOS = {
+    '2008 Financial Crisis': ('2008-09-01', '2009-03-09'),
+    '2011 Debt Ceiling': ('2011-07-22', '2011-10-03'),
+    '2018 Q4 Selloff': ('2018-10-01', '2018-12-24'),
+    '2020 COVID Crash': ('2020-02-19', '2020-03-23'),
+    '2022 Rate Shock': ('2022-01-03', '2022-10-12'),
+}
+
+# Uniform synthetic shocks applied to every asset
+SYNTHETIC_SCENARIOS = {
+    'Equity -10%': -0.10,
+    'Equity -20%': -0.20,
+    'Equity -35%': -0.35,
+}
+
+
+class StressTester:
+    """
+    Replay a library of shock scenarios against many portfolios at once.
+
+    Scenarios are either historical date windows, whose per-asset shocks are
+    the compounded returns over the window in the stored data, or synthetic
+    per-asset return shocks. Stacking the shocks gives a (scenarios x assets)
+    matrix, so the loss of every portfolio under every scenario is a single
+    matrix product with the (portfolios x assets) exposure matrix. Exposures
+    are fractions of capital held in each asset, constant in shares during
+    the scenario (buy and hold).
+    """
+
+    def __init__(self, returns: pd.DataFrame):
+        """
+        Args:
+            returns: Date-indexed (time x assets) returns; missing values count as no move
+        """
+        self.returns = returns.sort_index()
+        self.assets = list(returns.columns)
+        self.scenarios: List[Dict] = []
+
+        # Prefix sums of log growth: the compounded return of any window is one difference
+        growth = np.log1p(self.returns.fillna(0.0).to_numpy(dtype=float))
+        self._log_growth = np.vstack([np.zeros(len(self.assets)), np.cumsum(growth, axis=0)])
+        self._dates = pd.DatetimeIndex(self.returns.index)
+
+    @classmethod
+    def from_store(cls, store, symbols: List[str], start=None, end=None) -> 'StressTester':
+        """Build the returns matrix from the Close columns of a ``PartitionedBarStore``"""
+        closes = {}
+        for symbol in symbols:
+            bars = store.read(symbol, start, end, columns=['Close'])
+            closes[symbol] = pd.Series(bars['Close'].to_numpy(), index=bars['Date'])
+        return cls(pd.DataFrame(closes).sort_index().pct_change(fill_method=None).iloc[1:])
+
+    def add_historical(self, name: str, start, end) -> 'StressTester':
+        """Add a historical window scenario (both ends inclusive)"""
+        self.scenarios.append({'name': name, 'type': 'historical',
+                               'start': pd.Timestamp(start), 'end': pd.Timestamp(end)})
+        return self
+
+    def add_shock(self, name: str, shocks: Union[float, Dict[str, float]], default: float = 0.0) -> 'StressTester':
+        """
+        Add a synthetic scenario.
+
+        Args:
+            name: Scenario name
+            shocks: One return applied to every asset, or returns per asset
+            default: Return of assets missing from ``shocks``
+        """
+        if isinstance(shocks, dict):
+            vector = np.array([shocks.get(asset, default) for asset in self.assets], dtype=float)
+        else:
+            vector = np.full(len(self.assets), float(shocks))
+        self.scenarios.append({'name': name, 'type': 'synthetic', 'shocks': vector})
+        return self
+
+    def add_default_library(self) -> 'StressTester':
+        """Add the built-in historical windows and uniform synthetic shocks"""
+        for name, (start, end) in HISTORICAL_SCENARIOS.items():
+            self.add_historical(name, start, end)
+        for name, shock in SYNTHETIC_SCENARIOS.items():
+            self.add_shock(name, shock)
+        return self
+
+    def shock_matrix(self) -> pd.DataFrame:
+        """
+        Per-asset scenario returns.
+
+        Historical windows not covered by the data give NaN rows.
+
+        Returns:
+            pd.DataFrame: Scenarios x assets compounded returns
+        """
+        rows = []
+        for scenario in self.scenarios:
+            if scenario['type'] == 'synthetic':
+                rows.append(scenario['shocks'])
+                continue
+            first, last = self._window(scenario)
+            if first is None:
+                rows.append(np.full(len(self.assets), np.nan))
+            else:
+                rows.append(np.expm1(self._log_growth[last] - self._log_growth[first]))
+        return pd.DataFrame(np.array(rows).reshape(len(rows), len(self.assets)),
+                            index=[s['name'] for s in self.scenarios], columns=self.assets)
+
+    def loss_table(self, exposures: Union[pd.DataFrame, pd.Series]) -> pd.DataFrame:
+        """
+        Scenario losses of every portfolio.
+
+        Args:
+            exposures: (portfolios x assets) fractions of capital per asset,
+                or one portfolio as a Series; missing assets count as zero
+
+        Returns:
+            pd.DataFrame: Scenarios x portfolios loss in percent of capital
+            (positive numbers are losses)
+        """
+        weights = self._exposure_matrix(exposures)
+        pnl = self.shock_matrix().to_numpy() @ weights.to_numpy().T
+        return pd.DataFrame(-pnl * 100, index=[s['name'] for s in self.scenarios], columns=weights.index)
+
+    def worst_drawdown_table(self, exposures: Union[pd.DataFrame, pd.Series]) -> pd.DataFrame:
+        """
+        Deepest point reached inside each historical window, per portfolio.
+
+        The path of every portfolio is one (window days x assets) @ (assets x
+        portfolios) product per scenario. Synthetic scenarios have no path and
+        equal their end-point loss.
+
+        Returns:
+            pd.DataFrame: Scenarios x portfolios worst loss in percent of capital
+        """
+        weights = self._exposure_matrix(exposures)
+        w = weights.to_numpy().T
+        table = self.loss_table(weights)
+        for scenario in self.scenarios:
+            if scenario['type'] != 'historical':
+                continue
+            first, last = self._window(scenario)
+            if first is None:
+                continue
+            path = np.expm1(self._log_growth[first + 1:last + 1] - self._log_growth[first]) @ w
+            table.loc[scenario['name']] = np.maximum(-path.min(axis=0), 0) * 100
+        return table
+
+    def _window(self, scenario: Dict):
+        """Prefix positions bounding the scenario window, or (None, None) if not covered"""
+        start, end = self._bound(scenario['start']), self._bound(scenario['end'])
+        first = self._dates.searchsorted(start, side='left')
+        last = self._dates.searchsorted(end, side='right')
+        if last <= first or start < self._dates[0] or end > self._dates[-1]:
+            return None, None
+        return first, last
+
+    def _bound(self, timestamp: pd.Timestamp) -> pd.Timestamp:
+        """Scenario bound in the time zone of the returns index (naive bounds are local dates)"""
+        if self._dates.tz is None:
+            return timestamp.tz_convert(None) if timestamp.tz is not None else timestamp
+        if timestamp.tz is None:
+            return timestamp.tz_localize(self._dates.tz)
+        return timestamp.tz_convert(self._dates.tz)
+
+    def _exposure_matrix(self, exposures) -> pd.DataFrame:
+        if isinstance(exposures, pd.Series):
+            exposures = exposures.to_frame().T
+        unknown = set(exposures.columns) - set(self.assets)
+        if unknown:
+            raise ValueError(f"No returns for exposures in {sorted(unknown)}")
+        return exposures.reindex(columns=self.assets, fill_value=0.0).fillna(0.0).astype(float)
+
+
+def exposures_from_results(results_dict: Dict[str, Dict]) -> pd.DataFrame:
+    """
+    Final exposures of single-symbol backtests, for ``StressTester.loss_table``.
+
+    The fraction of capital held at the last bar is the value of the
+    strategy's ``Position`` (shares held) over the portfolio value. Results
+    without a ``Position`` column fall back to an approximation from the last
+    portfolio and price moves, exact only when no trade happens on the last
+    two bars. Flat strategies have zero exposure.
+
+    Args:
+        results_dict: ``run_multiple_symbols`` output (symbol -> {'data': results})
+
+    Returns:
+        pd.DataFrame: One row per strategy, one column per symbol
+    """
+    rows = {}
+    for symbol, entry in results_dict.items():
+        data = entry['data']
+        value = data['Portfolio_Value'].to_numpy(dtype=float)[-3:]
+        close = data['Close'].to_numpy(dtype=float)[-3:]
+        exposure = 0.0
+        if 'Position' in data.columns and len(value):
+            exposure = data['Position'].iloc[-1] * close[-1] / value[-1]
+        elif len(value) == 3:
+            value_move = value[-2] / value[-3] - 1
+            price_move = close[-2] / close[-3] - 1
+            if price_move != 0:
+                # Fraction held two bars back, carried forward to the last bar's prices
+                held = value_move / price_move
+                exposure = held * (close[-1] / close[-3]) / (value[-1] / value[-3])
+        rows[symbol] = {symbol: float(np.clip(exposure, 0.0, 1.0))}
+    return pd.DataFrame.from_dict(rows, orient='index').fillna(0.0)
@@ -0,0 +1,176 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, Optional, Union
+from src.risk_metrics import RISK_METRIC_NAMES, risk_metrics_kernel
+
+# Symbols per block passed to the fused metric kernel (bounds its temporaries)
+SYMBOL_BLOCK = 256
+
+# Rows per block when accumulating the cross-product matrix
+ROW_BLOCK = 4096
+
+
+def returns_matrix(results_dict: Dict[str, Dict], column: str = 'Portfolio_Value') -> pd.DataFrame:
+    """
+    Build an aligned (time x symbols) returns matrix from ``run_multiple_symbols`` output.
+
+    Args:
+        results_dict: Mapping of symbol to ``{'data': results}``
+        column: Value column to turn into returns (``'Close'`` for the underlying)
+
+    Returns:
+        pd.DataFrame: Returns indexed by date, one column per symbol, restricted
+        to the dates all symbols share
+    """
+    series = {
+        symbol: pd.Series(entry['data'][column].to_numpy(), index=pd.to_datetime(entry['data']['Date']))
+        for symbol, entry in results_dict.items()
+    }
+    prices = pd.DataFrame(series).dropna()
+    return prices.pct_change().iloc[1:]
+
+
+class UniverseRiskAnalyzer:
+    """
+    Cross-sectional risk analytics over a universe of return series.
+
+    Works on one aligned (time x symbols) returns matrix: every field of
+    ``RiskAnalyzer._calculate_risk_metrics`` comes from the batched metric
+    kernel run over blocks of symbols, betas and correlations against a
+    benchmark are a single matrix-vector product, and the covariance and
+    correlation matrices are one blocked cross product with optional
+    Ledoit-Wolf shrinkage towards a scaled identity.
+    """
+
+    def __init__(self, returns: pd.DataFrame, symbol_block: int = SYMBOL_BLOCK):
+        if returns.isna().any().any():
+            bad = returns.columns[returns.isna().any()].tolist()
+            raise ValueError(f"Returns matrix must be aligned without missing values; NaN in {bad[:10]}")
+        if len(returns) < 2:
+            raise ValueError("Need at least two return observations")
+        self.returns = returns
+        self.symbols = list(returns.columns)
+        self.symbol_block = symbol_block
+        self._values = np.ascontiguousarray(returns.to_numpy(dtype=float))
+        self._mean = self._values.mean(axis=0)
+
+    def risk_metrics(self) -> pd.DataFrame:
+        """
+        Compute every single-series risk metric for all symbols.
+
+        Returns:
+            pd.DataFrame: One row per symbol, one column per ``RISK_METRIC_NAMES`` entry
+        """
+        n_symbols = self._values.shape[1]
+        out = np.empty((n_symbols, len(RISK_METRIC_NAMES)))
+        for start in range(0, n_symbols, self.symbol_block):
+            block = self._values[:, start:start + self.symbol_block]
+            metrics = risk_metrics_kernel(block, axis=0)
+            out[start:start + block.shape[1]] = np.column_stack([metrics[name] for name in RISK_METRIC_NAMES])
+        return pd.DataFrame(out, index=self.symbols, columns=RISK_METRIC_NAMES)
+
+    def benchmark_statistics(self, benchmark: Union[str, pd.Series]) -> pd.DataFrame:
+        """
+        Beta and correlation of every symbol against a benchmark.
+
+        Args:
+            benchmark: Column of the returns matrix or a return series on the same dates
+
+        Returns:
+            pd.DataFrame: ``Beta`` and ``Correlation`` per symbol
+        """
+        if isinstance(benchmark, str):
+            bench = self.returns[benchmark].to_numpy(dtype=float)
+        else:
+            bench = benchmark.reindex(self.returns.index).to_numpy(dtype=float)
+            if np.isnan(bench).any():
+                raise ValueError("Benchmark returns do not cover the returns matrix dates")
+
+        n = len(bench)
+        bench_centered = bench - bench.mean()
+        bench_var = bench_centered @ bench_centered / (n - 1)
+        cov = (bench_centered @ self._values) / (n - 1)  # Centering one side is enough
+        std = np.sqrt(self._column_variances())
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            beta = cov / bench_var
+            corr = cov / (std * np.sqrt(bench_var))
+        return pd.DataFrame({'Beta': beta, 'Correlation': corr}, index=self.symbols)
+
+    def covariance(self, shrinkage: Union[str, float, None] = 'ledoit-wolf') -> pd.DataFrame:
+        """
+        Covariance matrix of the universe.
+
+        Args:
+            shrinkage: ``'ledoit-wolf'`` for the optimal intensity, a float in
+                [0, 1] for a fixed intensity, or None for the sample covariance
+
+        Returns:
+            pd.DataFrame: Symbols x symbols covariance (ddof=1)
+        """
+        cov, _ = self._covariance(shrinkage)
+        return pd.DataFrame(cov, index=self.symbols, columns=self.symbols)
+
+    def correlation(self, shrinkage: Union[str, float, None] = 'ledoit-wolf') -> pd.DataFrame:
+        """Correlation matrix derived from ``covariance(shrinkage)``"""
+        cov, _ = self._covariance(shrinkage)
+        std = np.sqrt(np.diag(cov))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            corr = cov / std[:, None] / std[None, :]
+        np.fill_diagonal(corr, 1.0)
+        return pd.DataFrame(corr, index=self.symbols, columns=self.symbols)
+
+    def shrinkage_intensity(self) -> float:
+        """Ledoit-Wolf optimal shrinkage intensity for this sample"""
+        return self._covariance('ledoit-wolf')[1]
+
+    def analyze(self, benchmark: Optional[Union[str, pd.Series]] = None) -> pd.DataFrame:
+        """
+        Risk metrics for all symbols, plus beta/correlation when a benchmark is given.
+
+        Returns:
+            pd.DataFrame: One row per symbol
+        """
+        table = self.risk_metrics()
+        if benchmark is not None:
+            table = table.join(self.benchmark_statistics(benchmark))
+        return table
+
+    def _column_variances(self) -> np.ndarray:
+        n = self._values.shape[0]
+        total = np.zeros(self._values.shape[1])
+        for start in range(0, n, ROW_BLOCK):
+            block = self._values[start:start + ROW_BLOCK] - self._mean
+            total += np.einsum('ij,ij->j', block, block)
+        return total / (n - 1)
+
+    def _covariance(self, shrinkage):
+        """Sample covariance (one BLAS syrk-style product per row block) and the applied intensity"""
+        n, n_symbols = self._values.shape
+        scatter = np.zeros((n_symbols, n_symbols))
+        norms4 = 0.0
+        for start in range(0, n, ROW_BLOCK):
+            block = self._values[start:start + ROW_BLOCK] - self._mean
+            scatter += block.T @ block
+            if shrinkage == 'ledoit-wolf':
+                norms4 += float((np.einsum('ij,ij->i', block, block) ** 2).sum())
+
+        if shrinkage is None:
+            return scatter / (n - 1), 0.0
+
+        # Shrink the maximum-likelihood estimate towards mu * I (Ledoit & Wolf, 2004)
+        sample = scatter / n
+        mu = np.trace(sample) / n_symbols
+        if shrinkage == 'ledoit-wolf':
+            frobenius = float((sample ** 2).sum())
+            d2 = (frobenius - 2 * mu * np.trace(sample) + mu * mu * n_symbols) / n_symbols
+            b2 = min((norms4 - n * frobenius) / (n * n * n_symbols), d2)
+            intensity = b2 / d2 if d2 > 0 else 0.0
+        else:
+            intensity = float(shrinkage)
+            if not 0 <= intensity <= 1:
+                raise ValueError("shrinkage intensity must be between 0 and 1")
+
+        shrunk = (1 - intensity) * sample
+        shrunk[np.diag_indices(n_symbols)] += intensity * mu
+        return shrunk * n / (n - 1), intensity
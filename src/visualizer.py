@@ -7,17 +7,27 @@ import seaborn as sns
 from typing import Dict, List, Optional, Tuple
 import os
 from datetime import datetime
+from src.drawdown import drawdown_episodes, drawdown_series
+from src.rendering import show_figure, timed_render
+from src.downsampling import downsample_frame, downsample_indices
+from src.figure_templates import dashboard_template
+from src.comparison_views import (DETAIL_SYMBOL_LIMIT, PERCENTILE_BANDS, cluster_order, cumulative_returns,
+                                  drawdown_matrix, metrics_frame, paginate, percentile_bands, value_matrix, zscore)
 
-# Set style for better-looking plots
-plt.style.use('seaborn-v0_8')
-sns.set_palette("husl")
+# Bins per axis of the risk-return density in large comparisons
+DENSITY_BINS = 40
+
+# Best symbols (by Sharpe ratio) labelled in the risk-return density
+HIGHLIGHT_SYMBOLS = 3
 
 class AdvancedVisualizer:
     """Advanced visualization class for backtesting results"""
     
-    def __init__(self, figsize: Tuple[int, int] = (16, 12), dpi: int = 300):
+    def __init__(self, figsize: Tuple[int, int] = (16, 12), dpi: int = 300, template: bool = False):
         self.figsize = figsize
         self.dpi = dpi
+        # Refill one persistent dashboard figure across symbols (batch rendering)
+        self.template = template
         self.colors = {
             'price': '#2E86AB',
             'sma_short': '#A23B72',
@@ -28,7 +38,11 @@ class AdvancedVisualizer:
             'background': '#F8F9FA',
             'grid': '#E0E0E0'
         }
+        # Set style for better-looking plots
+        plt.style.use('seaborn-v0_8')
+        sns.set_palette("husl")
     
+    @timed_render('dashboard')
     def create_comprehensive_dashboard(self, results: pd.DataFrame, symbol: str, 
                                      metrics: Dict, save_path: str = None) -> None:
         """
@@ -40,6 +54,10 @@ class AdvancedVisualizer:
             metrics (Dict): Performance metrics
             save_path (str): Optional path to save the plot
         """
+        if self.template:
+            dashboard_template(self).render(results, symbol, metrics, save_path)
+            return
+        
         fig = plt.figure(figsize=(20, 14))
         fig.suptitle(f'{symbol} - Comprehensive Backtesting Dashboard', 
                     fontsize=20, fontweight='bold', y=0.95)
@@ -75,18 +93,20 @@ class AdvancedVisualizer:
             print(f"Dashboard saved to: {save_path}")
         
         plt.tight_layout()
-        plt.show()
+        show_figure(fig)
     
     def _plot_price_action(self, ax, results: pd.DataFrame, symbol: str) -> None:
         """Plot price action with moving averages and trading signals"""
-        dates = pd.to_datetime(results['Date'])
+        # Long series are thinned to the point budget, keeping every signal bar
+        lines = downsample_frame(results, 'Close', keep=results['Signal'] != 0)
+        dates = pd.to_datetime(lines['Date'])
         
         # Plot price and moving averages
-        ax.plot(dates, results['Close'], label='Price', 
+        ax.plot(dates, lines['Close'], label='Price', 
                color=self.colors['price'], linewidth=1.5, alpha=0.8)
-        ax.plot(dates, results['SMA_Short'], label=f'SMA Short', 
+        ax.plot(dates, lines['SMA_Short'], label=f'SMA Short', 
                color=self.colors['sma_short'], linewidth=1.2, alpha=0.8)
-        ax.plot(dates, results['SMA_Long'], label=f'SMA Long', 
+        ax.plot(dates, lines['SMA_Long'], label=f'SMA Long', 
                color=self.colors['sma_long'], linewidth=1.2, alpha=0.8)
         
         # Plot trading signals
@@ -127,10 +147,13 @@ class AdvancedVisualizer:
         price_returns = results['Close'].pct_change().fillna(0)
         benchmark_cumulative = (1 + price_returns).cumprod()
         
-        # Plot portfolio vs benchmark
-        ax.plot(dates, portfolio_cumulative, label='Strategy', 
+        # Plot portfolio vs benchmark (thinned to the point budget)
+        keep = results['Signal'] != 0
+        strategy_idx = downsample_indices(portfolio_cumulative, keep=keep)
+        benchmark_idx = downsample_indices(benchmark_cumulative)
+        ax.plot(dates.iloc[strategy_idx], portfolio_cumulative.iloc[strategy_idx], label='Strategy', 
                color=self.colors['portfolio'], linewidth=2.5)
-        ax.plot(dates, benchmark_cumulative, label='Buy & Hold', 
+        ax.plot(dates.iloc[benchmark_idx], benchmark_cumulative.iloc[benchmark_idx], label='Buy & Hold', 
                color=self.colors['price'], linewidth=1.5, alpha=0.7, linestyle='--')
         
         # Add performance metrics as text
@@ -184,17 +207,21 @@ class AdvancedVisualizer:
         dates = pd.to_datetime(results['Date'])
         portfolio_values = pd.Series(results['Portfolio_Value'])
         
-        # Calculate running maximum and drawdown
-        running_max = portfolio_values.expanding().max()
-        drawdown = (portfolio_values - running_max) / running_max * 100
+        # Drawdown and episode table from the shared drawdown module
+        drawdown = pd.Series(drawdown_series(portfolio_values) * 100)
+        episodes = drawdown_episodes(portfolio_values, drawdown=drawdown.to_numpy() / 100)
         
         # Plot drawdown
         ax.fill_between(dates, drawdown, 0, color=self.colors['sell'], 
                        alpha=0.3, label='Drawdown')
         ax.plot(dates, drawdown, color=self.colors['sell'], linewidth=1.5)
         
-        # Mark maximum drawdown
-        max_dd_idx = drawdown.idxmin()
+        # Mark maximum drawdown (trough of the deepest episode)
+        if len(episodes):
+            worst = episodes.loc[episodes['depth'].idxmin()]
+            max_dd_idx = int(worst['trough'])
+        else:
+            max_dd_idx = 0
         max_dd_date = dates.iloc[max_dd_idx]
         max_dd_value = drawdown.iloc[max_dd_idx]
         
@@ -255,14 +282,60 @@ class AdvancedVisualizer:
         
         ax.set_title(f'{symbol} - Performance Summary', fontsize=14, fontweight='bold', pad=20)
     
+    @timed_render('comparison chart')
     def create_comparison_chart(self, results_dict: Dict[str, Dict], save_path: str = None) -> None:
         """
         Create comparison chart for multiple symbols/strategies
         
+        Up to ``DETAIL_SYMBOL_LIMIT`` symbols are drawn individually; larger
+        universes are summarized with percentile fan charts, a risk/return
+        density and a clustered metrics heatmap (see
+        ``create_comparison_pages`` for per-symbol detail).
+        
         Args:
             results_dict: Dictionary with symbol as key and {'data': df, 'metrics': dict} as value
             save_path: Optional path to save the plot
         """
+        if len(results_dict) > DETAIL_SYMBOL_LIMIT:
+            fig = self._create_universe_comparison(results_dict)
+        else:
+            fig = self._create_detailed_comparison(results_dict)
+        
+        plt.tight_layout()
+        
+        if save_path:
+            os.makedirs(os.path.dirname(save_path) if os.path.dirname(save_path) else 'plots', exist_ok=True)
+            plt.savefig(save_path, dpi=self.dpi, bbox_inches='tight', 
+                       facecolor='white', edgecolor='none')
+            print(f"Comparison chart saved to: {save_path}")
+        
+        show_figure(fig)
+    
+    def create_comparison_pages(self, results_dict: Dict[str, Dict], out_dir: str = 'plots',
+                                per_page: int = DETAIL_SYMBOL_LIMIT) -> List[str]:
+        """
+        Detailed comparison charts for a large universe, one page per group of symbols
+        
+        Symbols are ranked by total return, so page 1 holds the best performers.
+        
+        Args:
+            results_dict: Dictionary with symbol as key and {'data': df, 'metrics': dict} as value
+            out_dir: Directory for the ``comparison_page_NNN.png`` files
+            per_page: Symbols per page
+            
+        Returns:
+            List[str]: Paths of the pages
+        """
+        ranking = metrics_frame(results_dict).sort_values('Total Return (%)', ascending=False).index
+        paths = []
+        for number, page in enumerate(paginate(ranking, per_page), start=1):
+            path = os.path.join(out_dir, f'comparison_page_{number:03d}.png')
+            self.create_comparison_chart({symbol: results_dict[symbol] for symbol in page}, path)
+            paths.append(path)
+        return paths
+    
+    def _create_detailed_comparison(self, results_dict: Dict[str, Dict]):
+        """One line, bar and label per symbol"""
         fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
         fig.suptitle('Multi-Symbol/Strategy Comparison Dashboard', fontsize=16, fontweight='bold')
         
@@ -322,9 +395,7 @@ class AdvancedVisualizer:
         # 4. Drawdown comparison
         for i, (symbol, data) in enumerate(results_dict.items()):
             results = data['data']
-            portfolio_values = pd.Series(results['Portfolio_Value'])
-            running_max = portfolio_values.expanding().max()
-            drawdown = (portfolio_values - running_max) / running_max * 100
+            drawdown = drawdown_series(results['Portfolio_Value']) * 100
             dates = pd.to_datetime(results['Date'])
             
             ax4.fill_between(dates, drawdown, 0, alpha=0.3, 
@@ -335,15 +406,69 @@ class AdvancedVisualizer:
         ax4.legend()
         ax4.grid(True, alpha=0.3)
         
-        plt.tight_layout()
+        return fig
+    
+    def _create_universe_comparison(self, results_dict: Dict[str, Dict]):
+        """Aggregate views whose artist count does not grow with the number of symbols"""
+        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
+        fig.suptitle(f'Multi-Symbol/Strategy Comparison Dashboard ({len(results_dict)} symbols)',
+                     fontsize=16, fontweight='bold')
         
-        if save_path:
-            os.makedirs(os.path.dirname(save_path) if os.path.dirname(save_path) else 'plots', exist_ok=True)
-            plt.savefig(save_path, dpi=self.dpi, bbox_inches='tight', 
-                       facecolor='white', edgecolor='none')
-            print(f"Comparison chart saved to: {save_path}")
+        values = value_matrix(results_dict)
+        metrics = metrics_frame(results_dict)
         
-        plt.show()
-
-# Global visualizer instance
-visualizer = AdvancedVisualizer()
\ No newline at end of file
+        # 1. Fan chart of cumulative returns
+        self._plot_fan_chart(ax1, percentile_bands(cumulative_returns(values)))
+        ax1.axhline(1, color='black', linewidth=0.8, alpha=0.5)
+        ax1.set_title('Cumulative Returns Distribution', fontsize=14, fontweight='bold')
+        ax1.set_ylabel('Cumulative Returns')
+        
+        # 2. Clustered metrics heatmap, drawn as one image
+        order = cluster_order(metrics)
+        image = ax2.imshow(zscore(metrics).loc[order].to_numpy(), aspect='auto', cmap='RdYlGn',
+                           vmin=-3, vmax=3, interpolation='nearest')
+        ax2.set_xticks(range(len(metrics.columns)))
+        ax2.set_xticklabels(metrics.columns, rotation=20, ha='right')
+        ax2.set_yticks([])
+        ax2.grid(False)
+        ax2.set_ylabel(f'{len(order)} symbols (clustered)')
+        ax2.set_title('Key Metrics Comparison', fontsize=14, fontweight='bold')
+        fig.colorbar(image, ax=ax2, label='z-score')
+        
+        # 3. Risk-return density
+        _, _, _, density = ax3.hist2d(metrics['Total Return (%)'], metrics['Sharpe Ratio'],
+                                      bins=DENSITY_BINS, cmin=1, cmap='viridis')
+        fig.colorbar(density, ax=ax3, label='Symbols')
+        for symbol in metrics['Sharpe Ratio'].nlargest(HIGHLIGHT_SYMBOLS).index:
+            ax3.annotate(symbol, (metrics.at[symbol, 'Total Return (%)'], metrics.at[symbol, 'Sharpe Ratio']),
+                         xytext=(5, 5), textcoords='offset points')
+        ax3.set_title('Risk-Return Analysis', fontsize=14, fontweight='bold')
+        ax3.set_xlabel('Total Return (%)')
+        ax3.set_ylabel('Sharpe Ratio')
+        ax3.grid(True, alpha=0.3)
+        
+        # 4. Fan chart of drawdowns
+        self._plot_fan_chart(ax4, percentile_bands(drawdown_matrix(values)), color=self.colors['sell'],
+                             legend_loc='lower left')
+        ax4.set_title('Drawdown Comparison', fontsize=14, fontweight='bold')
+        ax4.set_ylabel('Drawdown (%)')
+        return fig
+    
+    def _plot_fan_chart(self, ax, bands: pd.DataFrame, color: str = None, legend_loc: str = 'upper left') -> None:
+        """Shaded percentile bands around the cross-sectional median"""
+        color = color or self.colors['price']
+        dates = bands.index
+        for (low, high), alpha in zip(PERCENTILE_BANDS, (0.2, 0.4)):
+            ax.fill_between(dates, bands[low], bands[high], color=color, alpha=alpha, linewidth=0,
+                            label=f'{low}th-{high}th percentile')
+        ax.plot(dates, bands[50], color=color, linewidth=2, label='Median')
+        ax.legend(loc=legend_loc)
+        ax.grid(True, alpha=0.3)
+    
+# Global visualizer instance, created on first access
+def __getattr__(name: str):
+    """Create the global ``visualizer`` on first access"""
+    if name == 'visualizer':
+        globals()[name] = AdvancedVisualizer()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
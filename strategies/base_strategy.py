@@ -52,11 +52,15 @@ class Strategy(ABC):
         """
         Run the backtest using the generated signals.
         
+        Adds the ``Signal``, ``Position`` (shares held after each bar) and
+        ``Portfolio_Value`` columns to the data.
+        
         Returns:
             Tuple[pd.DataFrame, Dict]: Returns the results DataFrame and performance metrics
         """
         signals = self.generate_signals()
         self.data['Signal'] = signals
+        shares_held = []
         
         for i in range(len(self.data)):
             current_price = self.data.iloc[i]['Close']
@@ -84,8 +88,10 @@ class Strategy(ABC):
             for position in self.positions:
                 portfolio_value += position['size'] * current_price
             self.portfolio_value.append(portfolio_value)
+            shares_held.append(sum(position['size'] for position in self.positions))
         
         # Calculate performance metrics
+        self.data['Position'] = shares_held
         self.data['Portfolio_Value'] = self.portfolio_value
         return self.data, self.calculate_metrics()
     
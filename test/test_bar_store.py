@@ -0,0 +1,93 @@
+import pytest
+import pandas as pd
+import numpy as np
+from src.bar_store import PartitionedBarStore
+from src.data_loader import DataLoader
+
+@pytest.fixture
+def multi_year_bars():
+    """Business-day bars spanning several years"""
+    dates = pd.bdate_range('2019-01-01', '2023-12-31')
+    rng = np.random.default_rng(0)
+    close = 100 + rng.normal(0, 1, len(dates)).cumsum()
+    return pd.DataFrame({
+        'Date': dates,
+        'Open': close,
+        'High': close + 1,
+        'Low': close - 1,
+        'Close': close,
+        'Volume': rng.integers(1000, 2000, len(dates)),
+    })
+
+def test_write_creates_year_partitions(multi_year_bars, tmp_path):
+    """Test that bars are split into one partition per year"""
+    store = PartitionedBarStore(str(tmp_path), partition='year')
+
+    store.write('AAPL', multi_year_bars)
+
+    assert store.symbols() == ['AAPL']
+    assert [p['key'] for p in store.partitions('AAPL')] == ['2019', '2020', '2021', '2022', '2023']
+    assert sum(p['rows'] for p in store.partitions('AAPL')) == len(multi_year_bars)
+
+def test_range_read_matches_filter(multi_year_bars, tmp_path):
+    """Test that range reads equal a boolean filter on the full history"""
+    store = PartitionedBarStore(str(tmp_path), partition='month')
+    store.write('AAPL', multi_year_bars)
+
+    result = store.read('AAPL', '2020-11-15', '2021-02-03')
+
+    expected = multi_year_bars[(multi_year_bars['Date'] >= '2020-11-15') &
+                               (multi_year_bars['Date'] < '2021-02-03')].reset_index(drop=True)
+    pd.testing.assert_frame_equal(result[expected.columns], expected, check_dtype=False)
+    assert result['Date'].dtype.kind == 'M'
+
+def test_range_read_opens_only_overlapping_partitions(multi_year_bars, tmp_path, mocker):
+    """Test that partitions outside the requested range are never loaded"""
+    store = PartitionedBarStore(str(tmp_path), partition='year')
+    store.write('AAPL', multi_year_bars)
+    load = mocker.spy(np, 'load')
+
+    store.read('AAPL', '2021-03-01', '2021-04-01', columns=['Close'])
+
+    opened = {call.args[0].split('/')[-2] for call in load.call_args_list}
+    assert opened == {'2021'}
+
+def test_write_merges_and_replaces_overlap(multi_year_bars, tmp_path):
+    """Test appending chunks with overlapping timestamps"""
+    store = PartitionedBarStore(str(tmp_path))
+    first, second = multi_year_bars.iloc[:700], multi_year_bars.iloc[650:].copy()
+    second['Close'] = second['Close'] + 1000
+
+    rows = store.write_chunks('AAPL', [first, second])
+    result = store.read('AAPL')
+
+    assert rows == len(multi_year_bars) + 50
+    assert len(result) == len(multi_year_bars)
+    np.testing.assert_allclose(result['Close'].iloc[650:], multi_year_bars['Close'].iloc[650:] + 1000)
+    np.testing.assert_allclose(result['Close'].iloc[:650], multi_year_bars['Close'].iloc[:650])
+
+def test_timezone_round_trip(tmp_path):
+    """Test that tz-aware dates are restored in their original timezone"""
+    dates = pd.date_range('2023-12-29 09:30', periods=2000, freq='min', tz='America/New_York')
+    df = pd.DataFrame({'Date': dates, 'Close': np.arange(2000.0)})
+    store = PartitionedBarStore(str(tmp_path), partition='month')
+    store.write('SPY', df)
+
+    result = store.read('SPY', '2023-12-30', '2023-12-31')
+
+    assert str(result['Date'].dt.tz) == 'America/New_York'
+    assert result['Date'].iloc[0] == pd.Timestamp('2023-12-30', tz='America/New_York')
+    assert result['Date'].iloc[-1] < pd.Timestamp('2023-12-31', tz='America/New_York')
+
+def test_store_data_source(multi_year_bars, tmp_path):
+    """Test fetching from the store through DataLoader"""
+    PartitionedBarStore(str(tmp_path)).write('AAPL', multi_year_bars)
+    data_loader = DataLoader(source='store', root=str(tmp_path))
+
+    ranged = data_loader.fetch_data('AAPL', start_date='2022-01-01', end_date='2022-02-01')
+    trailing = data_loader.fetch_data('AAPL', period='1mo')
+
+    assert ranged['Date'].iloc[0] == pd.Timestamp('2022-01-03')
+    assert ranged['Date'].iloc[-1] == pd.Timestamp('2022-01-31')
+    assert trailing['Date'].iloc[0] == pd.Timestamp('2023-11-30')
+    assert trailing['Date'].iloc[-1] == pd.Timestamp('2023-12-29')
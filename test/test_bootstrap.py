@@ -0,0 +1,64 @@
+import pytest
+import pandas as pd
+import numpy as np
+from src.bootstrap import bootstrap_ratio_intervals, stationary_bootstrap_indices
+from src.risk_metrics import RATIO_NAMES, compute_risk_analysis, ratio_kernel
+
+def test_indices_follow_blocks():
+    """Test indices advance by one inside a block and wrap around the series"""
+    idx = stationary_bootstrap_indices(50, 200, mean_block=5, rng=np.random.default_rng(0))
+
+    assert idx.shape == (200, 50)
+    assert idx.min() >= 0 and idx.max() < 50
+    steps = (np.diff(idx, axis=1) % 50) == 1
+    # Continuation probability is 1 - 1/mean_block (restarts may also land on i + 1)
+    assert steps.mean() == pytest.approx(0.8, abs=0.03)
+
+def test_block_length_one_is_iid():
+    """Test mean block 1 restarts at every position"""
+    idx = stationary_bootstrap_indices(1000, 20, mean_block=1, rng=np.random.default_rng(1))
+    assert ((np.diff(idx, axis=1) % 1000) == 1).mean() < 0.01
+
+def test_ratio_kernel_sharpe_matches_strategy_definition():
+    """Test the batched Sharpe equals the BaseStrategy formula"""
+    returns = pd.Series(np.random.default_rng(2).normal(0.001, 0.01, 300))
+    expected = np.sqrt(252) * returns.mean() / returns.std()
+    assert ratio_kernel(returns)['Sharpe Ratio'] == pytest.approx(expected)
+
+def test_intervals_contain_estimates():
+    """Test intervals bracket the point estimates for several strategies"""
+    rng = np.random.default_rng(3)
+    returns = pd.DataFrame(rng.normal(0.0008, 0.01, (500, 4)), columns=list('ABCD'))
+
+    table = bootstrap_ratio_intervals(returns, n_resamples=400, seed=1, memory_budget=500 * 400)
+
+    assert list(table.index) == list('ABCD')
+    for name in RATIO_NAMES:
+        assert (table[f'{name} (lower)'] <= table[name]).all()
+        assert (table[name] <= table[f'{name} (upper)']).all()
+
+def test_intervals_are_reproducible_and_chunk_invariant():
+    """Test the seed fixes the result whatever the memory budget"""
+    returns = np.random.default_rng(4).normal(0.0005, 0.01, (300, 3))
+    small = bootstrap_ratio_intervals(returns, n_resamples=200, seed=7, memory_budget=1)
+    large = bootstrap_ratio_intervals(returns, n_resamples=200, seed=7)
+    pd.testing.assert_frame_equal(small, large)
+
+def test_sharpe_interval_covers_true_value():
+    """Test the 95% Sharpe interval covers the true Sharpe in most trials"""
+    rng = np.random.default_rng(5)
+    true_sharpe = np.sqrt(252) * 0.001 / 0.01
+    returns = rng.normal(0.001, 0.01, (750, 40))
+
+    table = bootstrap_ratio_intervals(returns, n_resamples=300, seed=2)
+    covered = (table['Sharpe Ratio (lower)'] <= true_sharpe) & (true_sharpe <= table['Sharpe Ratio (upper)'])
+    assert covered.mean() >= 0.85
+
+def test_risk_analysis_optional_intervals(sample_stock_data):
+    """Test compute_risk_analysis only bootstraps on request"""
+    sample_stock_data['Portfolio_Value'] = 100000 * np.cumprod(
+        1 + np.random.default_rng(6).normal(0.0005, 0.01, len(sample_stock_data)))
+
+    assert 'ratio_intervals' not in compute_risk_analysis(sample_stock_data)
+    intervals = compute_risk_analysis(sample_stock_data, bootstrap_resamples=100)['ratio_intervals']
+    assert intervals['Sharpe Ratio (lower)'] <= intervals['Sharpe Ratio'] <= intervals['Sharpe Ratio (upper)']
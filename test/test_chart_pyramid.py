@@ -0,0 +1,65 @@
+import pytest
+import json
+import numpy as np
+import pandas as pd
+from src import chart_pyramid
+from src.chart_pyramid import ChartPyramid
+from src.interactive_viz import InteractiveVisualizer
+
+@pytest.fixture
+def minute_results():
+    """Two weeks of minute bars"""
+    n = 20_000
+    rng = np.random.default_rng(4)
+    close = 100 + rng.normal(0, 0.05, n).cumsum()
+    return pd.DataFrame({'Date': pd.date_range('2023-01-02', periods=n, freq='min'),
+                         'Close': close, 'Portfolio_Value': 1000 * close})
+
+def test_levels_and_tiles(minute_results, tmp_path):
+    """Test each level merges LEVEL_FACTOR buckets until one tile is left"""
+    pyramid = ChartPyramid.build(minute_results, str(tmp_path), level_factor=8, tile_rows=1000)
+
+    assert [level['rows'] for level in pyramid.levels] == [20_000, 2_500, 313]
+    assert [level['bucket'] for level in pyramid.levels] == [1, 8, 64]
+    assert [len(level['tiles']['Close']) for level in pyramid.levels] == [20, 3, 1]
+    assert json.loads((tmp_path / 'manifest.json').read_text())['columns'] == ['Close', 'Portfolio_Value']
+
+def test_bucket_statistics(minute_results, tmp_path):
+    """Test coarse levels hold the min/max/last of their buckets"""
+    pyramid = ChartPyramid.build(minute_results, str(tmp_path), level_factor=8, tile_rows=1000)
+    level = pyramid.read('Close', 2)
+
+    buckets = minute_results['Close'].groupby(np.arange(len(minute_results)) // 64)
+    np.testing.assert_allclose(level['min'], buckets.min(), rtol=1e-6)
+    np.testing.assert_allclose(level['max'], buckets.max(), rtol=1e-6)
+    np.testing.assert_allclose(level['close'], buckets.last(), rtol=1e-6)
+    assert (level.index == minute_results['Date'].iloc[::64].to_numpy()).all()
+
+def test_window_reads_only_overlapping_tiles(minute_results, tmp_path, mocker):
+    """Test a zoomed read opens the tiles of the window only"""
+    pyramid = ChartPyramid.build(minute_results, str(tmp_path), level_factor=8, tile_rows=1000)
+    spy = mocker.spy(chart_pyramid, '_read_tile')
+
+    start, end = minute_results['Date'].iloc[[5_100, 6_200]]
+    window = pyramid.read('Portfolio_Value', 0, start, end)
+
+    assert spy.call_count == 2
+    assert len(window) == 1_101
+    np.testing.assert_allclose(window['close'], minute_results['Portfolio_Value'].iloc[5_100:6_201], rtol=1e-6)
+
+def test_level_choice_follows_zoom(minute_results, tmp_path):
+    """Test the full view uses the coarsest level and a short window the raw bars"""
+    pyramid = ChartPyramid.build(minute_results, str(tmp_path), level_factor=8, tile_rows=1000)
+    start, end = pyramid.manifest['start'], pyramid.manifest['end']
+
+    assert pyramid.choose_level(start, end, target_points=1_000) == 2
+    assert pyramid.choose_level(start, start + 60_000 * 600, target_points=1_000) == 0
+
+def test_zoomable_report(minute_results, tmp_path):
+    """Test the report writes the pyramid, the viewer and its plotly.js bundle"""
+    viewer = InteractiveVisualizer().create_zoomable_report(minute_results, 'TEST', str(tmp_path))
+
+    html = (tmp_path / 'viewer.html').read_text()
+    assert viewer == str(tmp_path / 'viewer.html')
+    assert 'manifest.json' in html and 'src="plotly.min.js"' in html
+    assert (tmp_path / 'plotly.min.js').exists()
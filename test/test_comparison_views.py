@@ -0,0 +1,95 @@
+import pytest
+import numpy as np
+import pandas as pd
+from src.comparison_views import (DETAIL_SYMBOL_LIMIT, cluster_order, cumulative_returns, drawdown_matrix,
+                                  metrics_frame, paginate, percentile_bands, value_matrix)
+from src.interactive_viz import ANNOTATED_CELL_LIMIT, InteractiveVisualizer
+from src.visualizer import AdvancedVisualizer
+
+def universe(symbols, rows=120, seed=0):
+    """Results dict of random walks with staggered start dates"""
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range('2023-01-02', periods=rows)
+    results = {}
+    for i in range(symbols):
+        d = dates[i % 10:]
+        values = 100000 * np.exp(rng.normal(0, 0.01, len(d)).cumsum())
+        results[f'S{i:03d}'] = {
+            'data': pd.DataFrame({'Date': d, 'Portfolio_Value': values}),
+            'metrics': {'Total Return (%)': (values[-1] / values[0] - 1) * 100, 'Annual Return (%)': rng.normal(),
+                        'Sharpe Ratio': rng.normal(), 'Max Drawdown (%)': -abs(rng.normal())},
+        }
+    return results
+
+def test_value_matrix_aligns_symbols_on_their_own_history():
+    """Test each symbol is NaN before its first date and matches its own values afterwards"""
+    results = universe(3)
+    values = value_matrix(results)
+
+    assert values.index.is_monotonic_increasing
+    assert values['S001'].isna().sum() == 1
+    np.testing.assert_allclose(values['S002'].dropna(), results['S002']['data']['Portfolio_Value'])
+    np.testing.assert_allclose(cumulative_returns(values)['S002'].dropna().iloc[0], 1.0)
+
+def test_percentile_bands_match_numpy():
+    """Test the fan chart bands are per-date percentiles over the available symbols"""
+    values = value_matrix(universe(50))
+    bands = percentile_bands(drawdown_matrix(values))
+    drawdown = drawdown_matrix(values).to_numpy()
+
+    np.testing.assert_allclose(bands[50], np.nanmedian(drawdown, axis=1))
+    np.testing.assert_allclose(bands[5], np.nanpercentile(drawdown, 5, axis=1))
+    assert (bands[95] <= 0).all() and (bands[5] <= bands[25]).all()
+
+def test_cluster_order_is_a_permutation_grouping_similar_symbols():
+    """Test clustering returns every symbol once and keeps identical profiles adjacent"""
+    metrics = pd.DataFrame({'a': [0, 10, 0.1, 10.1, 5], 'b': [0, 10, 0.1, 10.1, -5]},
+                           index=['low1', 'high1', 'low2', 'high2', 'mid'])
+    order = cluster_order(metrics)
+
+    assert sorted(order) == sorted(metrics.index)
+    assert abs(order.index('low1') - order.index('low2')) == 1
+    assert abs(order.index('high1') - order.index('high2')) == 1
+
+def test_paginate():
+    assert paginate(range(5), 2) == [[0, 1], [2, 3], [4]]
+
+def test_large_comparison_uses_aggregate_views(tmp_path, mocker):
+    """Test hundreds of symbols are drawn with a fixed number of artists"""
+    mocker.patch('matplotlib.pyplot.show')
+    results = universe(300)
+    visualizer = AdvancedVisualizer(dpi=30)
+    aggregate = mocker.spy(visualizer, '_create_universe_comparison')
+
+    visualizer.create_comparison_chart(results, str(tmp_path / 'comparison.png'))
+
+    fig = aggregate.spy_return
+    assert (tmp_path / 'comparison.png').exists()
+    assert sum(len(ax.lines) + len(ax.collections) for ax in fig.axes) < 20
+
+def test_comparison_pages_rank_by_total_return(tmp_path, mocker):
+    """Test detail pages hold at most DETAIL_SYMBOL_LIMIT symbols, best performers first"""
+    mocker.patch('matplotlib.pyplot.show')
+    results = universe(DETAIL_SYMBOL_LIMIT + 3)
+    visualizer = AdvancedVisualizer(dpi=30)
+    detail = mocker.spy(visualizer, '_create_detailed_comparison')
+
+    paths = visualizer.create_comparison_pages(results, str(tmp_path))
+
+    assert [p.rsplit('/', 1)[-1] for p in paths] == ['comparison_page_001.png', 'comparison_page_002.png']
+    first_page = list(detail.call_args_list[0].args[0])
+    best = metrics_frame(results)['Total Return (%)'].idxmax()
+    assert len(first_page) == DETAIL_SYMBOL_LIMIT and first_page[0] == best
+
+def test_large_heatmap_has_no_cell_labels(tmp_path, mocker):
+    """Test big performance heatmaps are one clustered trace without annotations"""
+    mocker.patch('plotly.graph_objects.Figure.show')
+    results = universe(ANNOTATED_CELL_LIMIT)
+    write = mocker.patch('src.interactive_viz.write_html')
+
+    InteractiveVisualizer().create_performance_heatmap(results, str(tmp_path / 'heatmap.html'))
+
+    fig = write.call_args.args[0]
+    assert len(fig.data) == 1 and not fig.layout.annotations
+    assert fig.data[0].texttemplate is None
+    assert sorted(fig.data[0].x) == sorted(results)
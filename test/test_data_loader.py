@@ -1,7 +1,8 @@
 import pytest
 import pandas as pd
 from datetime import datetime
-from src.data_loader import DataLoader
+from src.data_loader import DataLoader, parse_fixed_timestamps
+from src.data_sources import CSVDataSource, DataSource, ReplayDataSource, get_data_source
 import os
 
 def test_fetch_data_success(mock_yf_ticker, sample_stock_data, mocker):
@@ -69,4 +70,201 @@ def test_save_to_csv(sample_stock_data, tmp_path):
     saved_data['Date'] = pd.to_datetime(saved_data['Date'])
     
     # Compare DataFrames
-    pd.testing.assert_frame_equal(saved_data, sample_stock_data)
\ No newline at end of file
+    pd.testing.assert_frame_equal(saved_data, sample_stock_data)
+
+def test_get_data_source_unknown_name():
+    """Test that an unregistered source name is rejected"""
+    with pytest.raises(ValueError) as exc_info:
+        get_data_source('does-not-exist')
+    assert "Unknown data source" in str(exc_info.value)
+
+
+def test_csv_source_fetch_with_dates(sample_stock_data, tmp_path):
+    """Test loading bars from a local CSV directory"""
+    # Arrange
+    sample_stock_data.to_csv(tmp_path / "AAPL.csv", index=False)
+    data_loader = DataLoader(source='csv', data_dir=str(tmp_path))
+
+    # Act
+    result = data_loader.fetch_data("AAPL", start_date="2023-03-01", end_date="2023-04-01")
+
+    # Assert
+    assert isinstance(data_loader.source, CSVDataSource)
+    assert len(result) == 31
+    assert result['Date'].iloc[0] == pd.Timestamp("2023-03-01")
+    assert result['Date'].iloc[-1] == pd.Timestamp("2023-03-31")
+
+
+def test_csv_source_period_and_missing_symbol(sample_stock_data, tmp_path):
+    """Test trailing period selection and missing files"""
+    sample_stock_data.to_csv(tmp_path / "AAPL.csv", index=False)
+    data_loader = DataLoader(source='csv', data_dir=str(tmp_path))
+
+    result = data_loader.fetch_data("AAPL", period="1mo")
+    assert result['Date'].iloc[0] > pd.Timestamp("2023-11-30")
+    assert result['Date'].iloc[-1] == pd.Timestamp("2023-12-31")
+
+    with pytest.raises(Exception) as exc_info:
+        data_loader.fetch_data("MSFT")
+    assert "No data found for symbol MSFT" in str(exc_info.value)
+
+
+def test_fetch_many_csv(sample_stock_data, tmp_path):
+    """Test bulk loading of several symbols"""
+    for symbol in ["AAPL", "MSFT", "GOOGL"]:
+        sample_stock_data.to_csv(tmp_path / f"{symbol}.csv", index=False)
+    data_loader = DataLoader(source='csv', data_dir=str(tmp_path))
+
+    frames = data_loader.fetch_many(["AAPL", "MSFT", "GOOGL"], period="max")
+
+    assert list(frames) == ["AAPL", "MSFT", "GOOGL"]
+    assert all(len(df) == len(sample_stock_data) for df in frames.values())
+
+
+def test_replay_source_records_and_replays(sample_stock_data, tmp_path):
+    """Test recording responses from an upstream source and replaying them offline"""
+    # Arrange
+    upstream_dir = tmp_path / "upstream"
+    upstream_dir.mkdir()
+    sample_stock_data.to_csv(upstream_dir / "AAPL.csv", index=False)
+    recordings = tmp_path / "recordings"
+    recorder = ReplayDataSource(str(recordings), upstream=CSVDataSource(str(upstream_dir)), record=True)
+
+    # Act
+    recorded = recorder.fetch("AAPL", start_date="2023-01-01", end_date="2023-02-01")
+    (upstream_dir / "AAPL.csv").unlink()
+    replayed = DataLoader(source='replay', recordings_dir=str(recordings)).fetch_data(
+        "AAPL", start_date="2023-01-01", end_date="2023-02-01")
+
+    # Assert
+    pd.testing.assert_frame_equal(recorded, replayed)
+    with pytest.raises(Exception) as exc_info:
+        DataLoader(source='replay', recordings_dir=str(recordings)).fetch_data("AAPL", period="5d")
+    assert "No recorded response" in str(exc_info.value)
+
+
+def test_validation_report_cached_with_data(sample_stock_data, tmp_path, mocker):
+    """Test that cached bars reuse their stored validation report"""
+    # Arrange
+    sample_stock_data.to_csv(tmp_path / "AAPL.csv", index=False)
+    cache_dir = tmp_path / "cache"
+    first_loader = DataLoader(source='csv', data_dir=str(tmp_path), cache_dir=str(cache_dir))
+    request = dict(start_date="2023-01-01", end_date="2023-07-01")
+
+    # Act
+    first = first_loader.fetch_data("AAPL", **request)
+    validate = mocker.patch('src.data_loader.validate_bars')
+    second_loader = DataLoader(source='csv', data_dir=str(tmp_path), cache_dir=str(cache_dir))
+    (tmp_path / "AAPL.csv").unlink()
+    second = second_loader.fetch_data("AAPL", **request)
+
+    # Assert
+    assert list(cache_dir.glob("csv/*.validation.json"))
+    validate.assert_not_called()
+    pd.testing.assert_frame_equal(first, second)
+    assert second_loader.validation_reports["AAPL"] == first_loader.validation_reports["AAPL"]
+
+
+def test_read_csv_chunks_streams_typed_chunks(sample_stock_data, tmp_path):
+    """Test streaming a CSV file in fixed-size, explicitly typed chunks"""
+    # Arrange
+    filepath = tmp_path / "AAPL.csv"
+    sample_stock_data.to_csv(filepath, index=False)
+
+    # Act
+    chunks = list(DataLoader.read_csv_chunks(str(filepath), chunksize=100))
+
+    # Assert
+    assert [len(chunk) for chunk in chunks] == [100, 100, 100, 65]
+    combined = pd.concat(chunks, ignore_index=True)
+    assert combined['Volume'].dtype == 'int64'
+    assert combined['Close'].dtype == 'float64'
+    assert (combined['Date'] == sample_stock_data['Date']).all()
+    pd.testing.assert_series_equal(combined['Close'], sample_stock_data['Close'])
+
+
+def test_parse_fixed_timestamps_with_offsets():
+    """Test the fixed-format parser against pandas, including UTC offsets"""
+    dates = pd.date_range("2023-03-10", periods=500, freq="h", tz="America/New_York")
+    values = [str(ts) for ts in dates]
+
+    parsed = parse_fixed_timestamps(values, '%Y-%m-%d %H:%M:%S%z')
+
+    assert (parsed == dates.tz_convert('UTC')).all()
+    with pytest.raises(ValueError):
+        parse_fixed_timestamps(['2023-01-01'], '%Y-%m-%d %H:%M:%S')
+
+
+
+@pytest.mark.parametrize('value', [
+    '2023-01-03 09:30:00-05:00',  # longer than the format: would lose time and zone
+    '2023/01/03',                 # wrong separator
+    '2023-0a-03',                 # non-digit in a field
+    '2023-13-05',                 # month out of range
+    '2023-02-29',                 # day past the end of the month
+    '2023-04-31',
+])
+def test_parse_fixed_timestamps_rejects_mismatches(value):
+    """Test strings not matching the format raise instead of parsing to a wrong timestamp"""
+    with pytest.raises(ValueError):
+        parse_fixed_timestamps(['2023-01-02', value], '%Y-%m-%d')
+
+
+def test_parse_fixed_timestamps_rejects_invalid_times():
+    """Test out-of-range times and offsets raise, while leap days are accepted"""
+    for value in ['2023-01-03 24:00:00+00:00', '2023-01-03 09:60:00+00:00',
+                  '2023-01-03 09:30:00*05:00', '2023-01-03 09:30:00+05:75']:
+        with pytest.raises(ValueError):
+            parse_fixed_timestamps([value], '%Y-%m-%d %H:%M:%S%z')
+    assert parse_fixed_timestamps(['2024-02-29'])[0] == pd.Timestamp('2024-02-29')
+
+
+class _IntradaySource(DataSource):
+    """Fake provider serving minute bars at most 7 days per request"""
+
+    max_request_days = {'1m': 7}
+
+    def __init__(self, fail_after=None):
+        self.calls = []
+        self.fail_after = fail_after
+
+    def fetch(self, symbol, start_date=None, end_date=None, period="1y", interval="1d"):
+        if self.fail_after is not None and len(self.calls) >= self.fail_after:
+            raise ConnectionError("connection dropped")
+        self.calls.append((start_date, end_date))
+        # Overlap each window by one hour to exercise de-duplication
+        dates = pd.date_range(start_date, pd.Timestamp(end_date) + pd.Timedelta(hours=1),
+                              freq='h', inclusive='left')
+        return pd.DataFrame({'Date': dates, 'Open': 1.0, 'High': 1.0, 'Low': 1.0,
+                             'Close': dates.day.astype(float), 'Volume': 100})
+
+
+def test_long_intraday_request_is_chunked_and_stitched():
+    """Test that long intraday requests are split into provider-sized chunks"""
+    source = _IntradaySource()
+    data_loader = DataLoader(source=source, max_workers=4)
+
+    result = data_loader.fetch_data("AAPL", start_date="2023-01-01", end_date="2023-02-01", interval="1m")
+
+    assert len(source.calls) == 5
+    assert all(pd.Timestamp(b) - pd.Timestamp(a) <= pd.Timedelta(days=7) for a, b in source.calls)
+    assert result['Date'].is_monotonic_increasing
+    assert not result['Date'].duplicated().any()
+    assert result['Date'].iloc[0] == pd.Timestamp("2023-01-01")
+    assert result['Date'].iloc[-1] == pd.Timestamp("2023-01-31 23:00")
+
+
+def test_chunked_download_resumes_from_cache(tmp_path):
+    """Test that chunks completed before a failure are not fetched again"""
+    request = dict(start_date="2023-01-01", end_date="2023-02-01", interval="1m")
+    failing = _IntradaySource(fail_after=3)
+
+    with pytest.raises(Exception):
+        DataLoader(source=failing, cache_dir=str(tmp_path), max_workers=1).fetch_data("AAPL", **request)
+
+    resumed = _IntradaySource()
+    result = DataLoader(source=resumed, cache_dir=str(tmp_path), max_workers=1).fetch_data("AAPL", **request)
+
+    assert len(failing.calls) == 3
+    assert len(resumed.calls) == 2
+    assert len(result) == 31 * 24
@@ -0,0 +1,102 @@
+import pytest
+import pandas as pd
+import numpy as np
+from src.data_validation import validate_bars
+
+def test_clean_data_has_no_issues(sample_stock_data):
+    """Test that well-formed daily bars pass validation unchanged"""
+    result, report = validate_bars(sample_stock_data)
+
+    assert report['issues'] == 0
+    assert report['rows'] == len(sample_stock_data)
+    pd.testing.assert_frame_equal(result, sample_stock_data)
+
+def test_flags_without_repair(sample_stock_data):
+    """Test that issues are reported but data is left untouched by default"""
+    # Arrange: swap two rows, duplicate a timestamp, zero a volume and break a high
+    df = sample_stock_data.copy()
+    df.iloc[[10, 11]] = df.iloc[[11, 10]].to_numpy()
+    df.loc[20, 'Date'] = df.loc[19, 'Date']
+    df.loc[30, 'Volume'] = 0
+    df.loc[40, 'High'] = df.loc[40, 'Low'] - 1
+
+    # Act
+    result, report = validate_bars(df)
+
+    # Assert
+    assert report['non_monotonic_dates'] == 1
+    assert report['duplicate_dates'] == 1
+    assert report['zero_volume'] == 1
+    assert report['high_low_inconsistent'] == 1
+    assert report['repaired'] is False
+    pd.testing.assert_frame_equal(result, df)
+
+def test_repair_sorts_dedupes_and_fixes_high_low(sample_stock_data):
+    """Test repairing ordering, duplicates and High/Low consistency"""
+    df = sample_stock_data.copy()
+    df = pd.concat([df, df.iloc[[5]]]).iloc[::-1].reset_index(drop=True)
+    df.loc[100, 'High'] = df.loc[100, 'Low'] - 1
+
+    result, report = validate_bars(df, repair=True)
+
+    assert report['duplicate_dates'] == 1
+    assert result['Date'].is_monotonic_increasing
+    assert not result['Date'].duplicated().any()
+    assert len(result) == len(sample_stock_data)
+    assert (result['High'] >= result[['Open', 'Close']].max(axis=1)).all()
+    assert (result['Low'] <= result[['Open', 'Close']].min(axis=1)).all()
+
+def test_business_day_gaps():
+    """Test that missing business days are reported as gaps"""
+    dates = pd.bdate_range('2023-01-02', periods=30).delete([10, 11, 20])
+    df = pd.DataFrame({'Date': dates, 'Open': 1.0, 'High': 1.0, 'Low': 1.0, 'Close': 1.0, 'Volume': 100})
+
+    _, report = validate_bars(df)
+
+    assert report['gaps']['count'] == 2
+    assert report['gaps']['first'][0].startswith(str(dates[9].date()))
+
+def test_exchange_holidays_are_not_gaps():
+    """Test a full year of NYSE sessions, with Thanksgiving and Christmas weeks, has no gaps"""
+    sessions = pd.bdate_range('2023-01-01', '2023-12-31').difference(pd.to_datetime([
+        '2023-01-02', '2023-01-16', '2023-02-20', '2023-04-07', '2023-05-29', '2023-06-19',
+        '2023-07-04', '2023-09-04', '2023-11-23', '2023-12-25']))
+    df = pd.DataFrame({'Date': sessions.tz_localize('UTC'), 'Open': 1.0, 'High': 1.0, 'Low': 1.0,
+                       'Close': 1.0, 'Volume': 100})
+
+    _, report = validate_bars(df)
+    assert report['gaps']['count'] == 0
+    assert report['issues'] == 0
+
+    _, weekdays_only = validate_bars(df, holidays=[])
+    assert weekdays_only['gaps']['count'] == 9  # every holiday but Jan 2, before the first session
+
+def test_unadjusted_split_is_back_adjusted():
+    """Test detection and repair of a 2:1 split left in the raw prices"""
+    close = np.array([100.0, 102.0, 104.0, 52.5, 53.0, 54.0])
+    df = pd.DataFrame({
+        'Date': pd.bdate_range('2023-01-02', periods=6),
+        'Open': close, 'High': close, 'Low': close, 'Close': close,
+        'Volume': np.full(6, 1000, dtype=np.int64),
+        'Stock Splits': [0, 0, 0, 2.0, 0, 0],
+    })
+
+    result, report = validate_bars(df, repair=True)
+
+    assert len(report['unadjusted_splits']) == 1
+    assert report['unadjusted_splits'][0]['ratio'] == 2.0
+    np.testing.assert_allclose(result['Close'], [50.0, 51.0, 52.0, 52.5, 53.0, 54.0])
+    np.testing.assert_array_equal(result['Volume'], [2000, 2000, 2000, 1000, 1000, 1000])
+
+def test_adjusted_split_is_not_flagged():
+    """Test that splits already reflected in the prices are ignored"""
+    close = np.array([50.0, 51.0, 52.0, 52.5, 53.0, 54.0])
+    df = pd.DataFrame({
+        'Date': pd.bdate_range('2023-01-02', periods=6),
+        'Open': close, 'High': close, 'Low': close, 'Close': close,
+        'Volume': 1000, 'Stock Splits': [0, 0, 0, 2.0, 0, 0],
+    })
+
+    _, report = validate_bars(df, repair=True)
+
+    assert report['unadjusted_splits'] == []
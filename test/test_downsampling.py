@@ -0,0 +1,82 @@
+import pytest
+import numpy as np
+import pandas as pd
+from src.downsampling import downsample_indices, lttb_indices, minmax_indices
+from src.interactive_viz import InteractiveVisualizer
+
+def reference_lttb(y, n_out):
+    """Straightforward LTTB over Python lists"""
+    n = len(y)
+    every = (n - 2) / (n_out - 2)
+    selected = [0]
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = int(i * every) + 1, int((i + 1) * every) + 1
+        next_lo, next_hi = hi, min(int((i + 2) * every) + 1, n)
+        if i == n_out - 3:
+            avg_x, avg_y = n - 1, y[-1]
+        else:
+            avg_x = np.mean(range(next_lo, next_hi))
+            avg_y = np.mean(y[next_lo:next_hi])
+        areas = [abs((a - avg_x) * (y[j] - y[a]) - (a - j) * (avg_y - y[a])) for j in range(lo, hi)]
+        a = lo + int(np.argmax(areas))
+        selected.append(a)
+    return selected + [n - 1]
+
+@pytest.fixture
+def random_walk():
+    return np.random.default_rng(5).normal(0, 1, 20_000).cumsum()
+
+def test_lttb_matches_reference(random_walk):
+    """Test the prefix-sum implementation against a plain loop"""
+    y = random_walk[:2_000]
+    assert list(lttb_indices(y, 100)) == reference_lttb(y, 100)
+
+def test_short_series_untouched():
+    """Test series within the budget are plotted whole"""
+    np.testing.assert_array_equal(downsample_indices(np.arange(50.0), max_points=100), np.arange(50))
+
+def test_envelope_and_budget(random_walk):
+    """Test the extremes survive and the point count respects the budget"""
+    indices = downsample_indices(random_walk, max_points=1_000)
+
+    assert len(indices) <= 1_000
+    assert indices[0] == 0 and indices[-1] == len(random_walk) - 1
+    assert np.argmax(random_walk) in indices and np.argmin(random_walk) in indices
+    assert np.all(np.diff(indices) > 0)
+
+    # Every bucket's extremes are kept, so the thinned line spans the same range per bucket
+    buckets = minmax_indices(random_walk, 250)
+    assert np.isin(buckets, indices).all()
+
+def test_signals_always_kept(random_walk):
+    """Test flagged bars are never dropped"""
+    keep = np.zeros(len(random_walk), dtype=bool)
+    keep[[17, 4_321, 19_998]] = True
+    indices = downsample_indices(random_walk, max_points=500, keep=keep)
+    assert np.isin([17, 4_321, 19_998], indices).all()
+
+def test_interactive_traces_within_budget(random_walk, mocker):
+    """Test the dashboard's line traces are thinned on long series"""
+    n = len(random_walk)
+    close = 100 + random_walk
+    signal = np.zeros(n, dtype=int)
+    signal[[500, 9_000]] = [1, -1]
+    results = pd.DataFrame({
+        'Date': pd.date_range('2020-01-01', periods=n, freq='min'),
+        'Close': close, 'Volume': np.abs(random_walk) * 1000,
+        'SMA_Short': pd.Series(close).rolling(20).mean(), 'SMA_Long': pd.Series(close).rolling(50).mean(),
+        'Signal': signal, 'Portfolio_Value': 1000 * close,
+    })
+    metrics = {'Total Return (%)': 1.0, 'Annual Return (%)': 1.0, 'Sharpe Ratio': 0.5,
+               'Max Drawdown (%)': -3.0, 'Final Portfolio Value': 101000.0}
+    mocker.patch('src.downsampling.plot_budget', return_value=600)
+    show = mocker.patch('src.interactive_viz.show_plotly')
+
+    InteractiveVisualizer().create_interactive_dashboard(results, 'TEST', metrics)
+
+    fig = show.call_args[0][0]
+    price = next(trace for trace in fig.data if trace.name == 'Price')
+    assert len(price.y) <= 602
+    assert close[500] in price.y and close[9_000] in price.y
+    assert all(len(trace.y) <= 602 for trace in fig.data if trace.type == 'scatter')
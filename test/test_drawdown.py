@@ -0,0 +1,68 @@
+import pytest
+import pandas as pd
+import numpy as np
+from src.drawdown import drawdown_episodes, drawdown_series, max_drawdown_duration
+
+def reference_episodes(values):
+    """Straightforward loop over the bars, one episode per run below the peak"""
+    episodes = []
+    peak, current = values[0], None
+    for i, value in enumerate(values):
+        if value >= peak:
+            if current is not None:
+                current['recovery'] = i
+                episodes.append(current)
+                current = None
+            peak = value
+        else:
+            dd = value / peak - 1
+            if current is None:
+                current = {'start': i, 'trough': i, 'depth': dd, 'recovery': -1}
+            elif dd < current['depth']:
+                current['trough'], current['depth'] = i, dd
+    if current is not None:
+        episodes.append(current)
+    return episodes
+
+def test_drawdown_episodes_match_loop():
+    """Test the vectorized episode table against a reference loop"""
+    rng = np.random.default_rng(7)
+    values = 100 * np.cumprod(1 + rng.normal(0, 0.01, 2000))
+
+    episodes = drawdown_episodes(values)
+    expected = reference_episodes(values)
+
+    assert len(episodes) == len(expected)
+    assert episodes['start'].tolist() == [e['start'] for e in expected]
+    assert episodes['trough'].tolist() == [e['trough'] for e in expected]
+    assert episodes['recovery'].tolist() == [e['recovery'] for e in expected]
+    np.testing.assert_allclose(episodes['depth'], [e['depth'] * 100 for e in expected])
+    assert (episodes['peak'] == episodes['start'] - 1).all()
+
+def test_unrecovered_final_episode():
+    """Test an episode still open at the end of the series"""
+    values = [100, 110, 105, 111, 100, 90, 95]
+    dates = pd.date_range('2024-01-01', periods=len(values))
+
+    episodes = drawdown_episodes(values, dates=dates)
+
+    assert episodes['start'].tolist() == [2, 4]
+    assert episodes['duration'].tolist() == [1, 3]
+    assert episodes['recovered'].tolist() == [True, False]
+    assert episodes['recovery'].tolist() == [3, -1]
+    assert episodes['time_to_recover'].tolist() == [1, -1]
+    assert episodes['trough_date'].iloc[1] == dates[5]
+    assert pd.isna(episodes['recovery_date'].iloc[1])
+    assert episodes['depth'].iloc[1] == pytest.approx((90 / 111 - 1) * 100)
+
+def test_no_drawdown():
+    """Test a monotonically rising series has no episodes"""
+    values = np.arange(1, 50, dtype=float)
+
+    assert len(drawdown_episodes(values)) == 0
+    assert max_drawdown_duration(drawdown_series(values)) == 0
+
+def test_max_drawdown_duration():
+    """Test the longest run below the peak"""
+    drawdown = pd.Series([0, -1, -2, 0, -1, -1, -1, -3, 0, -1])
+    assert max_drawdown_duration(drawdown) == 4
@@ -0,0 +1,87 @@
+import pytest
+import numpy as np
+import matplotlib.image as mpimg
+from src import figure_templates
+from src.figure_templates import DashboardTemplate, RiskAnalysisTemplate
+from src.risk_analyzer import RiskAnalyzer
+from src.risk_metrics import compute_risk_analysis
+from src.visualizer import AdvancedVisualizer
+
+METRICS = {'Total Return (%)': 1.0, 'Annual Return (%)': 1.0, 'Sharpe Ratio': 0.5,
+           'Max Drawdown (%)': -3.0, 'Final Portfolio Value': 101000.0}
+
+@pytest.fixture
+def two_backtests(sample_stock_data):
+    """Two backtest-like results of different lengths and price paths"""
+    frames = []
+    for seed, rows in ((0, 365), (1, 200)):
+        rng = np.random.default_rng(seed)
+        data = sample_stock_data.iloc[:rows].copy()
+        data['Close'] = 100 * np.exp(rng.normal(0, 0.01, rows).cumsum())
+        data['SMA_Short'] = data['Close'].rolling(20).mean()
+        data['SMA_Long'] = data['Close'].rolling(50).mean()
+        data['Signal'] = 0
+        data.loc[data.index[[60, 120]], 'Signal'] = 1
+        data.loc[data.index[[90, 150]], 'Signal'] = -1
+        data['Portfolio_Value'] = 100000 * data['Close'] / data['Close'].iloc[0]
+        frames.append(data)
+    return frames
+
+@pytest.fixture(autouse=True)
+def close_templates():
+    yield
+    figure_templates.clear_templates()
+
+def assert_same_image(first, second):
+    first, second = mpimg.imread(first), mpimg.imread(second)
+    assert first.shape == second.shape
+    np.testing.assert_array_equal(first, second)
+
+def test_reused_dashboard_matches_fresh_render(two_backtests, tmp_path):
+    """Test a dashboard template refilled with a second symbol draws the same pixels as a new one"""
+    first, second = two_backtests
+    colors = AdvancedVisualizer().colors
+    template = DashboardTemplate(colors, dpi=40)
+    template.render(first, 'AAA', METRICS, str(tmp_path / 'a.png'))
+    template.render(second, 'BBB', METRICS, str(tmp_path / 'reused.png'))
+    DashboardTemplate(colors, dpi=40).render(second, 'BBB', METRICS, str(tmp_path / 'fresh.png'))
+
+    assert_same_image(tmp_path / 'reused.png', tmp_path / 'fresh.png')
+
+def test_reused_risk_template_matches_fresh_render(two_backtests, tmp_path):
+    """Test the risk analysis template redraws its panels without leftovers from the previous symbol"""
+    first, second = two_backtests
+    analyzer = RiskAnalyzer()
+    template = RiskAnalysisTemplate(analyzer)
+    template.render(compute_risk_analysis(first), 'AAA', str(tmp_path / 'a.png'))
+    template.render(compute_risk_analysis(second), 'BBB', str(tmp_path / 'reused.png'))
+    RiskAnalysisTemplate(analyzer).render(compute_risk_analysis(second), 'BBB', str(tmp_path / 'fresh.png'))
+
+    assert_same_image(tmp_path / 'reused.png', tmp_path / 'fresh.png')
+
+def test_template_mode_keeps_one_figure_per_process(two_backtests, tmp_path):
+    """Test visualizers in template mode share a single persistent dashboard figure"""
+    visualizer = AdvancedVisualizer(dpi=40, template=True)
+    for i, results in enumerate(two_backtests):
+        visualizer.create_comprehensive_dashboard(results, f'S{i}', METRICS, str(tmp_path / f'{i}.png'))
+
+    assert len(figure_templates._templates) == 1
+    assert (tmp_path / '1.png').exists()
+
+def test_templates_match_standard_renderers(two_backtests, tmp_path, mocker):
+    """Test template output is pixel-identical to the non-template renderers (serial vs worker runs)"""
+    mocker.patch('src.visualizer.show_figure')
+    mocker.patch('src.risk_analyzer.show_figure')
+    first, second = two_backtests
+
+    visualizer, template_visualizer = AdvancedVisualizer(dpi=40), AdvancedVisualizer(dpi=40, template=True)
+    template_visualizer.create_comprehensive_dashboard(first, 'AAA', METRICS, str(tmp_path / 'a.png'))
+    template_visualizer.create_comprehensive_dashboard(second, 'BBB', METRICS, str(tmp_path / 'dashboard_template.png'))
+    visualizer.create_comprehensive_dashboard(second, 'BBB', METRICS, str(tmp_path / 'dashboard.png'))
+    assert_same_image(tmp_path / 'dashboard_template.png', tmp_path / 'dashboard.png')
+
+    analysis = compute_risk_analysis(second)
+    RiskAnalyzer(template=True).plot_risk_analysis(compute_risk_analysis(first), 'AAA', str(tmp_path / 'a.png'))
+    RiskAnalyzer(template=True).plot_risk_analysis(analysis, 'BBB', str(tmp_path / 'risk_template.png'))
+    RiskAnalyzer().plot_risk_analysis(analysis, 'BBB', str(tmp_path / 'risk.png'))
+    assert_same_image(tmp_path / 'risk_template.png', tmp_path / 'risk.png')
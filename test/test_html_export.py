@@ -0,0 +1,68 @@
+import pytest
+import base64
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+from src.html_export import PLOTLYJS_BUNDLE, compact_figure, typed_array, write_html
+
+def decode(spec):
+    """Decode a typed-array spec back to numpy"""
+    return np.frombuffer(base64.b64decode(spec['bdata']), dtype=spec['dtype'])
+
+@pytest.fixture
+def figure():
+    """Two-row figure with irregular dates, a long line and a short one"""
+    rng = np.random.default_rng(2)
+    dates = pd.bdate_range('1950-01-02', periods=20_000)
+    fig = make_subplots(rows=2, cols=1)
+    fig.add_trace(go.Scatter(x=dates, y=rng.normal(size=len(dates)).cumsum(), name='long'), row=1, col=1)
+    fig.add_trace(go.Scatter(x=dates[:50], y=np.arange(50.0) ** 2, name='short'), row=2, col=1)
+    return fig
+
+def test_typed_arrays_round_trip(figure):
+    """Test data survives the binary encoding exactly"""
+    compact = compact_figure(figure)
+    long, short = compact['data']
+
+    np.testing.assert_array_equal(decode(long['y']), figure.data[0].y)
+    expected_ms = pd.DatetimeIndex(figure.data[0].x).as_unit('ms').asi8
+    np.testing.assert_array_equal(decode(long['x']), expected_ms)
+    assert compact['layout']['xaxis']['type'] == 'date'
+    assert compact['layout']['xaxis2']['type'] == 'date'
+    assert decode(short['y']).dtype == np.float64
+
+def test_webgl_for_long_traces(figure):
+    """Test only long scatter traces switch to WebGL"""
+    types = [trace['type'] for trace in compact_figure(figure, webgl_threshold=1_000)['data']]
+    assert types == ['scattergl', 'scatter']
+
+def test_evenly_spaced_coordinates(figure):
+    """Test a regular clock is replaced by a start and a step"""
+    fig = go.Figure(go.Scatter(x=pd.date_range('2024-01-02 09:30', periods=390, freq='min'), y=np.ones(390)))
+    trace = compact_figure(fig)['data'][0]
+
+    assert 'x' not in trace
+    assert trace['dx'] == 60_000
+    assert trace['x0'] == pd.Timestamp('2024-01-02 09:30').value // 10**6
+
+def test_int64_narrowed():
+    """Test plotly.js-compatible integer dtypes"""
+    assert typed_array(np.array([1, 2, 3], dtype=np.int64))['dtype'] == 'i4'
+    assert typed_array(np.array([1, 2**40], dtype=np.int64))['dtype'] == 'f8'
+
+def test_compact_files_share_bundle(figure, tmp_path):
+    """Test compact files reference one plotly.js copy and are smaller"""
+    write_html(figure, str(tmp_path / 'standalone' / 'a.html'), mode='standalone')
+    write_html(figure, str(tmp_path / 'compact' / 'a.html'), mode='compact')
+    write_html(figure, str(tmp_path / 'compact' / 'b.html'), mode='compact')
+
+    compact_files = sorted(p.name for p in (tmp_path / 'compact').iterdir())
+    assert compact_files == ['a.html', 'b.html', PLOTLYJS_BUNDLE]
+    html = (tmp_path / 'compact' / 'a.html').read_text()
+    assert f'src="{PLOTLYJS_BUNDLE}"' in html
+    assert (tmp_path / 'compact' / 'a.html').stat().st_size < (tmp_path / 'standalone' / 'a.html').stat().st_size / 2
+
+def test_unknown_mode(figure, tmp_path):
+    with pytest.raises(ValueError):
+        write_html(figure, str(tmp_path / 'a.html'), mode='pdf')
@@ -0,0 +1,79 @@
+import warnings
+import pytest
+import numpy as np
+import pandas as pd
+from plotly.offline import get_plotlyjs
+from src.html_export import PLOTLYJS_BUNDLE
+from src.html_report import pack_results, read_report, write_report
+
+@pytest.fixture
+def results_dict(sample_stock_data):
+    """Three symbols of different lengths"""
+    results = {}
+    for i, symbol in enumerate(['AAA', 'BBB', 'CCC']):
+        data = sample_stock_data.iloc[:300 - 50 * i].copy()
+        data['SMA_Short'] = data['Close'].rolling(20).mean()
+        data['SMA_Long'] = data['Close'].rolling(50).mean()
+        data['Signal'] = 0
+        data.loc[[60, 120], 'Signal'] = 1
+        data.loc[[90], 'Signal'] = -1
+        data['Portfolio_Value'] = 100000 * data['Close'] / data['Close'].iloc[0]
+        results[symbol] = {'data': data, 'metrics': {'Total Return (%)': float(i), 'Sharpe Ratio': np.nan}}
+    return results
+
+def test_report_round_trips_every_symbol(results_dict, tmp_path):
+    """Test the compressed blob decodes back to each symbol's columns"""
+    path = write_report(results_dict, str(tmp_path / 'report.html'))
+    frames = read_report(path)
+
+    assert list(frames) == list(results_dict)
+    for symbol, entry in results_dict.items():
+        frame, data = frames[symbol], entry['data']
+        assert len(frame) == len(data)
+        assert (frame['Date'].to_numpy() == data['Date'].to_numpy().astype('datetime64[ms]')).all()
+        np.testing.assert_allclose(frame['Portfolio_Value'], data['Portfolio_Value'], rtol=1e-6)
+        np.testing.assert_array_equal(frame['Signal'], data['Signal'])
+        np.testing.assert_allclose(frame['SMA_Long'], data['SMA_Long'], rtol=1e-6)
+
+def test_columns_are_aligned_and_contiguous(results_dict):
+    """Test every column block starts on a multiple of its item size, widest first"""
+    header, blob = pack_results(results_dict)
+    rows = sum(len(entry['data']) for entry in results_dict.values())
+
+    assert header['rows'] == rows
+    assert header['columns'][0] == {'name': 'time', 'dtype': '<f8', 'offset': 0}
+    sizes = [np.dtype(c['dtype']).itemsize for c in header['columns']]
+    assert all(c['offset'] % size == 0 for c, size in zip(header['columns'], sizes))
+    assert len(blob) == rows * sum(sizes)
+    assert [s['start'] for s in header['symbols']] == [0, 300, 550]
+
+def test_plotlyjs_is_embedded_once(results_dict, tmp_path):
+    """Test the single-file report holds one plotly.js copy and valid JSON metrics"""
+    path = write_report(results_dict, str(tmp_path / 'report.html'))
+    with open(path, encoding='utf-8') as f:
+        html = f.read()
+
+    assert html.count(get_plotlyjs()[:200]) == 1
+    assert 'NaN' not in html.split('id="report-header"')[1].split('</script>')[0]
+
+def test_directory_mode_shares_the_bundle(results_dict, tmp_path):
+    """Test 'directory' mode references a plotly.min.js next to the report"""
+    path = write_report(results_dict, str(tmp_path / 'report.html'), plotlyjs='directory')
+
+    assert (tmp_path / PLOTLYJS_BUNDLE).exists()
+    assert f'<script src="{PLOTLYJS_BUNDLE}"></script>' in open(path, encoding='utf-8').read()
+    with pytest.raises(ValueError):
+        write_report(results_dict, str(tmp_path / 'other.html'), plotlyjs='cdn')
+
+def test_tz_aware_dates_pack_without_warnings(results_dict):
+    """Test tz-aware dates are packed as the same UTC instants, without a timezone warning"""
+    for entry in results_dict.values():
+        entry['data']['Date'] = pd.to_datetime(entry['data']['Date']).dt.tz_localize('America/New_York')
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        header, blob = pack_results(results_dict)
+
+    time = np.frombuffer(blob, dtype='<f8', count=header['rows'])
+    first = results_dict['AAA']['data']['Date'].iloc[0]
+    assert time[0] == first.tz_convert('UTC').value // 10**6
@@ -0,0 +1,28 @@
+import os
+import subprocess
+import sys
+from benchmarks.bench_import_time import CORE_MODULES, HEAVY_LIBRARIES, import_probe
+
+def test_core_import_loads_no_plotting_or_network_libraries(tmp_path):
+    """Test the backtesting core imports without matplotlib, plotly, scipy or yfinance"""
+    for module in CORE_MODULES:
+        assert import_probe(module, str(tmp_path))['loaded'] == [], module
+
+def test_import_has_no_side_effects(tmp_path):
+    """Test importing the package modules does not write config.ini or change the matplotlib style"""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    code = ('import matplotlib; before = dict(matplotlib.rcParams)\n'
+            'import src.main, src.visualizer, src.risk_analyzer, src.interactive_viz\n'
+            'assert dict(matplotlib.rcParams) == before')
+    subprocess.run([sys.executable, '-c', code], cwd=tmp_path, check=True,
+                   env={**os.environ, 'PYTHONPATH': root, 'MPLBACKEND': 'Agg'})
+
+    assert not (tmp_path / 'config.ini').exists()
+
+def test_global_instances_are_created_on_first_access():
+    """Test the module-level instances still resolve, once"""
+    from src import config as config_module, visualizer
+    from src.config import Config
+
+    assert isinstance(config_module.config, Config)
+    assert visualizer.visualizer is visualizer.visualizer
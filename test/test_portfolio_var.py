@@ -0,0 +1,86 @@
+import pytest
+import pandas as pd
+import numpy as np
+from scipy import stats
+from src.portfolio_var import PortfolioVaR, VAR_COLUMNS, random_weights
+from src.risk_metrics import calculate_risk_metrics, tail_risk_kernel
+
+@pytest.fixture
+def returns():
+    """Correlated daily returns for four assets"""
+    rng = np.random.default_rng(2)
+    factor = rng.normal(0.0003, 0.01, (750, 1))
+    return pd.DataFrame(factor + rng.normal(0, 0.008, (750, 4)), columns=['A', 'B', 'C', 'D'])
+
+@pytest.fixture
+def weights(returns):
+    return random_weights(50, returns.columns, seed=3)
+
+def test_historical_matches_single_series_metrics(returns, weights):
+    """Test each portfolio's VaR/CVaR equals the metrics of its return history"""
+    result = PortfolioVaR(returns, memory_budget=750 * 7).historical(weights)
+
+    for i in [0, 17, 49]:
+        expected = calculate_risk_metrics(returns @ weights.iloc[i])
+        for column in VAR_COLUMNS:
+            assert result.loc[i, column] == pytest.approx(expected[column])
+
+def test_parametric_normal_formula(returns, weights):
+    """Test the parametric VaR against the closed-form normal quantile"""
+    result = PortfolioVaR(returns).parametric(weights)
+
+    portfolio = returns @ weights.iloc[0]
+    mean, std = portfolio.mean(), portfolio.std()
+    assert result.loc[0, 'VaR (95%)'] == pytest.approx(stats.norm.ppf(0.05, mean, std))
+    assert result.loc[0, 'CVaR (99%)'] == pytest.approx(mean - std * stats.norm.pdf(stats.norm.ppf(0.01)) / 0.01)
+
+def test_monte_carlo_converges_to_parametric(returns, weights):
+    """Test simulated tails agree with the normal closed form"""
+    engine = PortfolioVaR(returns, memory_budget=1 << 16)
+    simulated = engine.monte_carlo(weights, n_simulations=200_000, seed=1)
+    parametric = engine.parametric(weights)
+
+    np.testing.assert_allclose(simulated.to_numpy(), parametric.to_numpy(), rtol=0.03)
+
+def test_monte_carlo_reproducible_across_budgets(returns, weights):
+    """Test results depend on the seed only, not on how portfolios are chunked"""
+    small = PortfolioVaR(returns, memory_budget=10_000).monte_carlo(weights, n_simulations=20_000, seed=4)
+    large = PortfolioVaR(returns).monte_carlo(weights, n_simulations=20_000, seed=4)
+
+    pd.testing.assert_frame_equal(small, large)
+
+def test_monte_carlo_streams_each_draw_chunk_once(returns, weights, mocker):
+    """Test every draw chunk is generated once and the kept tails match the full simulation"""
+    engine = PortfolioVaR(returns, memory_budget=10_000)
+    spy = mocker.spy(np.random, 'default_rng')
+    result = engine.monte_carlo(weights, n_simulations=20_000, seed=4)
+    assert spy.call_count == 3  # ceil(20_000 / SIMULATION_CHUNK), not once per portfolio block
+
+    draws = np.concatenate([np.random.default_rng([4, chunk]).standard_normal((n, 4))
+                            for chunk, n in enumerate([8192, 8192, 3616])])
+    simulated = draws @ (weights.to_numpy() @ engine._cholesky()).T + weights.to_numpy() @ engine._mean
+    expected = tail_risk_kernel(simulated, axis=0)
+    for column in VAR_COLUMNS:
+        np.testing.assert_allclose(result[column], expected[column], rtol=1e-12)
+
+def test_weights_alignment(returns):
+    """Test weights given by name are aligned and missing assets count as zero"""
+    engine = PortfolioVaR(returns)
+    by_name = engine.parametric(pd.DataFrame([{'C': 0.5, 'A': 0.5}]))
+    by_position = engine.parametric([[0.5, 0, 0.5, 0]])
+
+    pd.testing.assert_frame_equal(by_name, by_position)
+    with pytest.raises(ValueError):
+        engine.parametric([[1.0, 0.0]])
+
+def test_all_methods(returns, weights):
+    """Test the combined table has one column block per method"""
+    table = PortfolioVaR(returns).all_methods(weights.iloc[:5], n_simulations=5_000)
+    assert set(table.columns.get_level_values(0)) == {'historical', 'parametric', 'monte_carlo'}
+    assert len(table) == 5
+
+def test_monte_carlo_with_zero_covariance(weights):
+    """Test constant returns (an all-zero covariance) still simulate"""
+    flat = pd.DataFrame(np.zeros((250, 4)), columns=['A', 'B', 'C', 'D'])
+    result = PortfolioVaR(flat).monte_carlo(weights, n_simulations=2_000)
+    np.testing.assert_allclose(result.to_numpy(), 0.0, atol=1e-4)
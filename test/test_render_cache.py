@@ -0,0 +1,102 @@
+import json
+import os
+import pytest
+import numpy as np
+import pandas as pd
+from src.render_cache import MANIFEST_FILE, RenderCache, fingerprint
+
+@pytest.fixture
+def results(sample_stock_data):
+    data = sample_stock_data.copy()
+    data['Portfolio_Value'] = 100000 * data['Close'] / data['Close'].iloc[0]
+    return data
+
+def writer(path, calls):
+    """Renderer that writes a placeholder file and counts its calls"""
+    def render():
+        calls.append(path)
+        with open(path, 'w') as f:
+            f.write('plot')
+    return render
+
+def test_fingerprint_depends_on_content_only(results):
+    """Test equal data hashes equally and any changed value, metric or artifact type does not"""
+    metrics = {'Sharpe Ratio': 1.0, 'Total Return (%)': 5.0}
+    key = fingerprint('dashboard', results, 'TEST', metrics)
+
+    assert fingerprint('dashboard', results.copy(), 'TEST', dict(reversed(metrics.items()))) == key
+    changed = results.copy()
+    changed.loc[100, 'Close'] += 0.01
+    assert fingerprint('dashboard', changed, 'TEST', metrics) != key
+    assert fingerprint('dashboard', results, 'TEST', {**metrics, 'Sharpe Ratio': 1.1}) != key
+    assert fingerprint('interactive', results, 'TEST', metrics) != key
+    assert fingerprint('dashboard', {'a': np.arange(3)}) != fingerprint('dashboard', {'a': np.arange(3.0)})
+
+def test_unchanged_inputs_skip_rendering(results, tmp_path):
+    """Test a second run with identical inputs is a cache hit and changed inputs re-render"""
+    path = str(tmp_path / 'TEST_dashboard.png')
+    calls = []
+    cache = RenderCache(str(tmp_path))
+    assert cache.render('dashboard', path, (results, 'TEST'), writer(path, calls))
+    cache.save()
+
+    cache = RenderCache(str(tmp_path))
+    assert not cache.render('dashboard', path, (results, 'TEST'), writer(path, calls))
+    assert cache.render('dashboard', path, (results.iloc[:-1], 'TEST'), writer(path, calls))
+    cache.save()
+
+    assert len(calls) == 2
+    with open(tmp_path / MANIFEST_FILE) as f:
+        manifest = json.load(f)
+    assert manifest['last_run'] == {'hits': [path], 'misses': [path]}
+    assert manifest['artifacts'][path]['artifact'] == 'dashboard'
+
+def test_missing_file_is_rendered_again(results, tmp_path):
+    """Test a manifest entry without its file does not count as a hit"""
+    path = str(tmp_path / 'plot.png')
+    calls = []
+    cache = RenderCache(str(tmp_path))
+    cache.render('backtest_plot', path, (results,), writer(path, calls))
+    os.remove(path)
+
+    assert cache.render('backtest_plot', path, (results,), writer(path, calls))
+    assert len(calls) == 2
+
+def test_collect_garbage_removes_stale_artifacts(results, tmp_path):
+    """Test artifacts not used within the age limit are deleted and recent ones kept"""
+    old, recent = str(tmp_path / 'old.png'), str(tmp_path / 'recent.png')
+    cache = RenderCache(str(tmp_path))
+    cache.render('dashboard', old, ('old',), writer(old, []))
+    cache.render('dashboard', recent, ('recent',), writer(recent, []))
+    cache.entries[old]['last_used'] -= 40 * 86400
+    cache.save()
+
+    cache = RenderCache(str(tmp_path))
+    assert cache.collect_garbage(max_age_days=30) == [old]
+    assert not os.path.exists(old)
+    assert os.path.exists(recent)
+    assert list(cache.entries) == [recent]
+
+def test_queued_renders_fingerprint_the_compact_payload(results, tmp_path, mocker):
+    """Test queued renders, drawn from float32 data, do not reuse serially rendered entries"""
+    from concurrent.futures import Future
+    from src.render_queue import RenderQueue, compact_results
+
+    def fake_submit(render, artifact, payload, path):
+        writer(path, [])()
+        future = Future()
+        future.set_result(path)
+        return future
+
+    metrics = {'Sharpe Ratio': 1.0}
+    path = str(tmp_path / 'TEST_dashboard.png')
+    cache = RenderCache(str(tmp_path))
+    cache.render('dashboard', path, (results, 'TEST', metrics), writer(path, []))
+
+    for expected_hits in (0, 1):
+        with RenderQueue(max_workers=1, cache=cache) as queue:
+            mocker.patch.object(queue._executor, 'submit', side_effect=fake_submit)
+            queue.submit('dashboard', {'results': compact_results(results), 'symbol': 'TEST',
+                                       'metrics': metrics}, path)
+            queue.wait()
+        assert len(cache.hits) == expected_hits
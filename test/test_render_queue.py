@@ -0,0 +1,57 @@
+import pytest
+import numpy as np
+import pandas as pd
+from src.render_queue import RenderQueue, compact_results
+from src.risk_metrics import compute_risk_analysis
+
+@pytest.fixture
+def backtest_results(sample_stock_data):
+    """Backtest-like results with a few trades"""
+    data = sample_stock_data.copy()
+    data['SMA_Short'] = data['Close'].rolling(20).mean()
+    data['SMA_Long'] = data['Close'].rolling(50).mean()
+    data['Signal'] = 0
+    data.loc[[60, 120], 'Signal'] = 1
+    data.loc[[90, 150], 'Signal'] = -1
+    data['Portfolio_Value'] = 100000 * (1 + data['Close'].pct_change().fillna(0) * 0.5).cumprod()
+    return data
+
+def test_compact_results(backtest_results):
+    """Test payloads keep only the plotted columns in narrow dtypes"""
+    compact = compact_results(backtest_results.assign(Extra=1.0))
+
+    assert list(compact.columns) == ['Date', 'Close', 'Volume', 'SMA_Short', 'SMA_Long', 'Signal', 'Portfolio_Value']
+    assert compact['Close'].dtype == np.float32
+    assert compact['Signal'].dtype == np.int8
+    np.testing.assert_allclose(compact['Portfolio_Value'], backtest_results['Portfolio_Value'], rtol=1e-6)
+
+def test_render_backtest_artifacts_in_workers(backtest_results, tmp_path):
+    """Test every per-symbol artifact is written by the worker pool"""
+    metrics = {'Total Return (%)': 1.0, 'Annual Return (%)': 1.0, 'Sharpe Ratio': 0.5,
+               'Max Drawdown (%)': -3.0, 'Final Portfolio Value': 101000.0}
+    analysis = compute_risk_analysis(backtest_results)
+
+    with RenderQueue(max_workers=2) as queue:
+        futures = queue.submit_backtest(backtest_results, 'TEST', metrics, analysis, plots_dir=str(tmp_path))
+        paths = queue.wait()
+
+    assert paths == [future.result() for future in futures]
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        'TEST_backtest_plot.png', 'TEST_dashboard.png', 'TEST_interactive.html', 'TEST_risk_analysis.png']
+
+def test_unknown_artifact_rejected():
+    """Test invalid job types fail at submission"""
+    with RenderQueue(max_workers=1) as queue:
+        with pytest.raises(ValueError):
+            queue.submit('movie', {}, 'out.mp4')
+
+def test_worker_pool_stopped_when_a_backtest_fails(mocker):
+    """Test run_multiple_symbols shuts the pool down if the symbol loop raises"""
+    from src import main
+    mocker.patch.object(main, 'run_backtest', side_effect=RuntimeError('boom'))
+    close = mocker.spy(RenderQueue, 'close')
+
+    with pytest.raises(RuntimeError):
+        main.run_multiple_symbols(['AAA', 'BBB'], render_workers=1, render_cache=False)
+
+    close.assert_called_once_with(mocker.ANY, cancel_pending=True)
@@ -0,0 +1,77 @@
+import pytest
+import numpy as np
+import matplotlib.pyplot as plt
+from src import rendering
+from src.rendering import clear_render_timings, render_timings, set_render_mode
+from src.visualizer import AdvancedVisualizer
+from src.interactive_viz import InteractiveVisualizer
+
+@pytest.fixture
+def backtest_results(sample_stock_data):
+    """Backtest-like results with a few trades"""
+    data = sample_stock_data.copy()
+    data['SMA_Short'] = data['Close'].rolling(20).mean()
+    data['SMA_Long'] = data['Close'].rolling(50).mean()
+    data['Signal'] = 0
+    data.loc[[60, 120], 'Signal'] = 1
+    data.loc[[90, 150], 'Signal'] = -1
+    data['Position'] = data['Signal'].replace(0, np.nan).ffill().clip(lower=0).fillna(0)
+    data['Portfolio_Value'] = 100000 * (1 + data['Close'].pct_change().fillna(0) * data['Position'].shift().fillna(0)).cumprod()
+    return data
+
+@pytest.fixture
+def render_mode():
+    """Restore the configured render mode after the test"""
+    previous = rendering._render_mode
+    clear_render_timings()
+    yield set_render_mode
+    rendering._render_mode = previous
+    clear_render_timings()
+
+def test_headless_never_shows_and_closes_figures(backtest_results, render_mode, tmp_path, mocker):
+    """Test batch rendering saves the artifact without showing or leaking figures"""
+    render_mode('headless')
+    mock_show = mocker.patch('matplotlib.pyplot.show')
+    open_before = len(plt.get_fignums())
+    save_path = str(tmp_path / 'dashboard.png')
+
+    metrics = {'Total Return (%)': 1.0, 'Annual Return (%)': 1.0, 'Sharpe Ratio': 0.5,
+               'Max Drawdown (%)': -3.0, 'Final Portfolio Value': 101000.0}
+    AdvancedVisualizer(dpi=50).create_comprehensive_dashboard(backtest_results, 'TEST', metrics, save_path)
+
+    mock_show.assert_not_called()
+    assert len(plt.get_fignums()) == open_before
+    assert (tmp_path / 'dashboard.png').exists()
+    timings = render_timings()
+    assert [t['artifact'] for t in timings] == ['dashboard']
+    assert timings[0]['path'] == save_path
+    assert timings[0]['seconds'] > 0
+
+def test_headless_skips_browser(render_mode, tmp_path, mocker):
+    """Test plotly figures are written but not opened in headless mode"""
+    render_mode('headless')
+    mock_show = mocker.patch('plotly.graph_objects.Figure.show')
+    results = {symbol: {'metrics': {'Total Return (%)': 1.0, 'Annual Return (%)': 2.0,
+                                    'Sharpe Ratio': 0.3, 'Max Drawdown (%)': -4.0}}
+               for symbol in ['A', 'B']}
+
+    InteractiveVisualizer().create_performance_heatmap(results, str(tmp_path / 'heatmap.html'))
+
+    mock_show.assert_not_called()
+    assert (tmp_path / 'heatmap.html').exists()
+
+def test_interactive_shows_then_closes(render_mode, mocker):
+    """Test interactive mode still shows the figure and closes it afterwards"""
+    render_mode('interactive')
+    mock_show = mocker.patch('matplotlib.pyplot.show')
+    fig = plt.figure()
+
+    rendering.show_figure(fig)
+
+    mock_show.assert_called_once()
+    assert not plt.fignum_exists(fig.number)
+
+def test_unknown_render_mode(render_mode):
+    """Test invalid modes are rejected"""
+    with pytest.raises(ValueError):
+        render_mode('window')
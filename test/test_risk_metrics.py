@@ -0,0 +1,119 @@
+import pytest
+import subprocess
+import sys
+import pandas as pd
+import numpy as np
+from src.risk_metrics import compute_risk_analysis, calculate_risk_metrics, risk_metrics_kernel, tail_risk_kernel
+
+@pytest.fixture
+def backtest_results(sample_stock_data):
+    """Sample results frame with a noisy portfolio value"""
+    rng = np.random.default_rng(1)
+    sample_stock_data['Portfolio_Value'] = 100000 * np.cumprod(1 + rng.normal(0.0005, 0.01, len(sample_stock_data)))
+    return sample_stock_data
+
+def test_risk_metrics_module_does_not_import_plotting():
+    """Test that the metrics module can be used without any plotting library"""
+    code = ("import sys; import src.risk_metrics; "
+            "bad = [m for m in ('matplotlib', 'seaborn', 'plotly') if m in sys.modules]; "
+            "assert not bad, bad")
+    subprocess.run([sys.executable, '-c', code], check=True)
+
+def test_compute_risk_analysis_contents(backtest_results):
+    """Test the compute-only analysis returns metrics and all dashboard series"""
+    analysis = compute_risk_analysis(backtest_results)
+
+    returns = backtest_results['Portfolio_Value'].pct_change().dropna()
+    assert analysis['metrics'] == calculate_risk_metrics(returns)
+    assert len(analysis['drawdown']) == len(backtest_results)
+    assert analysis['drawdown'].max() <= 0
+    assert set(analysis['rolling_volatility']) == {20, 60, 120}
+    assert set(analysis['rolling_var']) == {0.05, 0.01}
+    assert 'rolling_correlation' in analysis
+    assert 'rolling_beta' not in analysis
+
+def test_compute_risk_analysis_with_benchmark(backtest_results):
+    """Test beta series are produced when a benchmark is supplied"""
+    analysis = compute_risk_analysis(backtest_results, benchmark_data=backtest_results)
+
+    assert 'rolling_beta' in analysis
+    assert np.isfinite(analysis['overall_beta'])
+
+def test_comprehensive_risk_analysis_uses_precomputed_values(backtest_results, mocker):
+    """Test that the dashboard is rendered from the compute-only output"""
+    from src.risk_analyzer import RiskAnalyzer
+    risk_analyzer = RiskAnalyzer()
+    plot = mocker.patch.object(risk_analyzer, 'plot_risk_analysis')
+
+    metrics = risk_analyzer.comprehensive_risk_analysis(backtest_results, 'TEST')
+
+    analysis = plot.call_args.args[0]
+    assert metrics is analysis['metrics']
+
+def _reference_metrics(returns: pd.Series) -> dict:
+    """Original pandas/scipy implementation of the risk metrics"""
+    from scipy import stats
+    annual_return = (1 + returns.mean()) ** 252 - 1
+    cumulative = (1 + returns).cumprod()
+    running_max = cumulative.expanding().max()
+    max_drawdown = abs(((cumulative - running_max) / running_max).min())
+    downside_deviation = returns[returns < 0].std() * np.sqrt(252)
+    return {
+        'Volatility (Annual)': returns.std() * np.sqrt(252),
+        'Skewness': stats.skew(returns),
+        'Kurtosis': stats.kurtosis(returns),
+        'VaR (95%)': np.percentile(returns, 5),
+        'VaR (99%)': np.percentile(returns, 1),
+        'CVaR (95%)': returns[returns <= np.percentile(returns, 5)].mean(),
+        'CVaR (99%)': returns[returns <= np.percentile(returns, 1)].mean(),
+        'Maximum Daily Loss': returns.min(),
+        'Maximum Daily Gain': returns.max(),
+        'Positive Days Ratio': (returns > 0).mean(),
+        'Calmar Ratio': annual_return / max_drawdown if max_drawdown != 0 else 0,
+        'Sortino Ratio': annual_return / downside_deviation if downside_deviation != 0 else 0,
+    }
+
+@pytest.mark.parametrize('n', [5, 60, 251, 1000])
+def test_fused_kernel_matches_reference(n):
+    """Test the fused kernel against the original multi-pass implementation"""
+    rng = np.random.default_rng(n)
+    returns = pd.Series(rng.standard_t(4, n) * 0.01)
+
+    metrics = calculate_risk_metrics(returns)
+    expected = _reference_metrics(returns)
+
+    for name, value in expected.items():
+        assert metrics[name] == pytest.approx(value, rel=1e-9, abs=1e-12), name
+
+def test_fused_kernel_handles_ties():
+    """Test CVaR when many returns equal the VaR quantile"""
+    returns = pd.Series(np.round(np.random.default_rng(3).normal(0, 0.01, 500), 3))
+
+    metrics = calculate_risk_metrics(returns)
+    expected = _reference_metrics(returns)
+
+    assert metrics['CVaR (95%)'] == pytest.approx(expected['CVaR (95%)'])
+    assert metrics['CVaR (99%)'] == pytest.approx(expected['CVaR (99%)'])
+
+def test_fused_kernel_batches_many_series():
+    """Test that a 2D array gives the same results as each series on its own"""
+    rng = np.random.default_rng(7)
+    matrix = rng.normal(0.0005, 0.01, (300, 25))
+
+    batched = risk_metrics_kernel(matrix, axis=0)
+
+    for j in [0, 13, 24]:
+        single = calculate_risk_metrics(pd.Series(matrix[:, j]))
+        for name, value in single.items():
+            assert batched[name][j] == pytest.approx(value, rel=1e-12, abs=1e-15), name
+
+def test_tail_risk_kernel_matches_full_kernel():
+    """Test the tail-only kernel returns the same VaR/CVaR as the fused kernel"""
+    matrix = np.random.default_rng(8).normal(0, 0.01, (400, 6))
+
+    tails = tail_risk_kernel(matrix, axis=0)
+    full = risk_metrics_kernel(matrix, axis=0)
+
+    assert set(tails) == {'VaR (95%)', 'VaR (99%)', 'CVaR (95%)', 'CVaR (99%)'}
+    for name, values in tails.items():
+        np.testing.assert_array_equal(values, full[name])
@@ -0,0 +1,66 @@
+import pytest
+import pandas as pd
+import numpy as np
+from src.rolling_quantile import (RollingQuantile, StreamingRollingQuantile, rolling_quantiles,
+                                  rolling_quantile_frame)
+
+QUANTILES = [0.01, 0.05, 0.5, 0.95, 1.0]
+
+@pytest.fixture
+def returns():
+    """Returns with ties (rounded) and a missing value"""
+    rng = np.random.default_rng(3)
+    series = pd.Series(np.round(rng.normal(0, 0.01, 1500), 4))
+    series.iloc[400] = np.nan
+    return series
+
+@pytest.mark.parametrize('window', [1, 2, 20, 60, 128, 250])
+def test_rolling_quantiles_match_pandas(returns, window):
+    """Test every quantile equals pandas' rolling quantile, including NaN windows"""
+    result = rolling_quantiles(returns, window, QUANTILES)
+    expected = np.column_stack([returns.rolling(window).quantile(q) for q in QUANTILES])
+
+    np.testing.assert_array_equal(np.isnan(result), np.isnan(expected))
+    np.testing.assert_allclose(result, expected, rtol=0, atol=1e-15)
+
+def test_rolling_quantile_frame(returns):
+    """Test the frame helper keeps the index and labels columns by quantile"""
+    frame = rolling_quantile_frame(returns, 60, [0.05, 0.01])
+
+    assert list(frame.columns) == [0.05, 0.01]
+    assert frame.index.equals(returns.index)
+    assert frame[0.05].iloc[:59].isna().all()
+
+def test_streaming_exact_matches_batch(returns):
+    """Test the incremental sorted-window engine against the batch sweep"""
+    engine = RollingQuantile(60, QUANTILES)
+    streamed = np.array([engine.update(value) for value in returns])
+
+    np.testing.assert_allclose(streamed, rolling_quantiles(returns, 60, QUANTILES), atol=1e-15)
+
+def test_streaming_approximate_error_bound(returns):
+    """Test the histogram mode stays within its stated error"""
+    engine = StreamingRollingQuantile(60, QUANTILES, lower=-0.1, upper=0.1, resolution=1e-4)
+    approx = np.array([engine.update(value) for value in returns])
+    exact = rolling_quantiles(returns, 60, QUANTILES)
+
+    np.testing.assert_array_equal(np.isnan(approx), np.isnan(exact))
+    assert np.nanmax(np.abs(approx - exact)) <= engine.max_error + 1e-12
+
+def test_streaming_approximate_clamps_out_of_range():
+    """Test values outside the histogram range saturate at the bounds"""
+    engine = StreamingRollingQuantile(3, [0.0, 1.0], lower=-0.1, upper=0.1, resolution=0.01)
+    for value in [-0.5, 0.0, 0.5]:
+        result = engine.update(value)
+
+    assert result[0] == pytest.approx(-0.095)
+    assert result[1] == pytest.approx(0.095)
+
+def test_invalid_arguments():
+    """Test argument validation"""
+    with pytest.raises(ValueError):
+        rolling_quantiles([1.0, 2.0], 0, [0.5])
+    with pytest.raises(ValueError):
+        rolling_quantiles([1.0, 2.0], 2, [1.5])
+    with pytest.raises(ValueError):
+        StreamingRollingQuantile(10, [0.5], lower=1, upper=0)
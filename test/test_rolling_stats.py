@@ -0,0 +1,114 @@
+import pytest
+import pandas as pd
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from src.rolling_stats import RollingStats, clear_rolling_cache, rolling_stats
+
+@pytest.fixture
+def pair():
+    """Two correlated return series with a missing value in each"""
+    rng = np.random.default_rng(5)
+    x = pd.Series(rng.normal(0.0005, 0.01, 3000), index=range(1, 3001))
+    y = 0.8 * x + pd.Series(rng.normal(0, 0.005, 3000), index=x.index)
+    x.iloc[100] = np.nan
+    y.iloc[900] = np.nan
+    return x, y
+
+@pytest.mark.parametrize('window', [5, 20, 60, 120])
+def test_matches_pandas_rolling(pair, window):
+    """Test every statistic against the equivalent pandas rolling call"""
+    x, y = pair
+    stats = RollingStats(x, y)
+    pd.testing.assert_series_equal(stats.mean(window), x.rolling(window).mean(), rtol=1e-9)
+    pd.testing.assert_series_equal(stats.std(window), x.rolling(window).std(), rtol=1e-9)
+
+    # Pairwise statistics are NaN wherever either series has a NaN in the window
+    both = pd.DataFrame({'x': x, 'y': y})
+    both[both.isna().any(axis=1)] = np.nan
+    pd.testing.assert_series_equal(stats.cov(window), both['x'].rolling(window).cov(both['y']), rtol=1e-8)
+    pd.testing.assert_series_equal(stats.corr(window), both['x'].rolling(window).corr(both['y']), rtol=1e-8)
+    expected_beta = both['x'].rolling(window).cov(both['y']) / both['y'].rolling(window).var()
+    pd.testing.assert_series_equal(stats.beta(window), expected_beta, rtol=1e-8)
+
+def test_long_offset_series_accuracy():
+    """Test compensated prefix sums keep full precision over long, offset series"""
+    rng = np.random.default_rng(0)
+    values = 100 + rng.normal(0, 0.01, 500_000)
+
+    result = RollingStats(values).std(20)[19:]
+    exact = sliding_window_view(values, 20).std(axis=1, ddof=1)
+
+    assert np.max(np.abs(result - exact) / exact) < 1e-10
+
+def test_constant_window_has_zero_std():
+    """Test rounding noise does not produce a spurious volatility"""
+    values = np.concatenate((np.full(50, 0.013), np.linspace(0, 1, 50)))
+    assert (RollingStats(values).std(20)[19:40] == 0).all()
+
+@pytest.mark.parametrize('window', [20, 60])
+def test_flat_windows_match_pandas(window):
+    """Test long zero runs give exactly zero std and NaN correlation, as pandas does"""
+    rng = np.random.default_rng(3)
+    x = pd.Series(rng.normal(0, 0.02, 20_000))
+    y = pd.Series(rng.normal(0, 0.02, 20_000))
+    for start, stop in [(1000, 1400), (5000, 9000), (15000, 15100)]:
+        x[start:stop] = 0.0
+    y[3000:3200] = 0.0
+    stats = RollingStats(x, y)
+
+    x_flat = x.rolling(window).apply(lambda w: (w == w[0]).all(), raw=True) == 1
+    y_flat = y.rolling(window).apply(lambda w: (w == w[0]).all(), raw=True) == 1
+
+    # pandas keeps ~1e-9 of roundoff in flat windows, so only moving windows are compared
+    std = stats.std(window)
+    assert (std[x_flat] == 0).all()
+    np.testing.assert_allclose(std[~x_flat], x.rolling(window).std()[~x_flat], atol=1e-9)
+
+    corr = stats.corr(window)
+    assert corr[x_flat | y_flat].isna().all()
+    moving = ~(x_flat | y_flat)
+    np.testing.assert_allclose(corr[moving], x.rolling(window).corr(y)[moving], atol=1e-9)
+
+def test_single_bar_window_is_nan():
+    """Test windows with no degrees of freedom left return NaN instead of inf"""
+    x = pd.Series(np.random.default_rng(4).normal(0, 0.02, 100))
+    assert RollingStats(x).std(1).isna().all()
+    assert RollingStats(x, x).cov(1).isna().all()
+
+def test_many_windows_and_memoization(pair):
+    """Test several windows at once and that results are computed only once"""
+    x, _ = pair
+    stats = RollingStats(x)
+    result = stats.many('std', [20, 60, 120])
+
+    assert set(result) == {20, 60, 120}
+    assert np.shares_memory(stats.std(60).to_numpy(), result[60].to_numpy())
+
+def test_memoized_results_are_read_only(pair):
+    """Test callers cannot corrupt a cached result by editing it in place"""
+    x, _ = pair
+    stats = RollingStats(x)
+    std = stats.std(20)
+
+    with pytest.raises(ValueError):
+        std.fillna(0, inplace=True)
+    with pytest.raises(ValueError):
+        RollingStats(x.to_numpy()).mean(20)[-1] = 0.0
+    filled = std.fillna(0)
+    assert stats.std(20).isna().sum() == std.isna().sum() > 0
+    assert (filled >= 0).all()
+
+def test_shared_cache_by_content(pair):
+    """Test equal data maps to one engine and different data to another"""
+    clear_rolling_cache()
+    x, y = pair
+
+    assert rolling_stats(x) is rolling_stats(x.copy())
+    assert rolling_stats(x) is not rolling_stats(x, y)
+    assert rolling_stats(x) is not rolling_stats(x * 2)
+
+def test_pair_statistics_require_y(pair):
+    """Test covariance-type statistics need a second series"""
+    x, _ = pair
+    with pytest.raises(ValueError):
+        RollingStats(x).corr(20)
@@ -62,6 +62,8 @@ def test_run_backtest(sample_stock_data):
     assert 'Sharpe Ratio' in metrics
     assert 'Max Drawdown (%)' in metrics
     assert len(strategy.portfolio_value) == len(sample_stock_data)
+    assert results['Position'].iloc[9] == 0 and results['Position'].iloc[10] > 0
+    assert results['Position'].iloc[-1] == 0  # sold from bar 30 on
 
 def test_calculate_metrics(sample_stock_data):
     """Test performance metrics calculation"""
@@ -0,0 +1,104 @@
+import pytest
+import pandas as pd
+import numpy as np
+from src.bar_store import PartitionedBarStore
+from src.stress_testing import StressTester, exposures_from_results
+
+@pytest.fixture
+def returns():
+    """Business-day returns for three assets over 2020"""
+    dates = pd.bdate_range('2020-01-01', '2020-12-31')
+    rng = np.random.default_rng(9)
+    return pd.DataFrame(rng.normal(0, 0.02, (len(dates), 3)), index=dates, columns=['A', 'B', 'C'])
+
+@pytest.fixture
+def exposures():
+    return pd.DataFrame({'A': [1.0, 0.5, 0.0], 'B': [0.0, 0.5, 0.0]}, index=['all_a', 'half', 'cash'])
+
+def test_historical_window_compounds_returns(returns, exposures):
+    """Test a historical scenario loss equals the compounded window return"""
+    tester = StressTester(returns).add_historical('March', '2020-03-02', '2020-03-31')
+    table = tester.loss_table(exposures)
+
+    window = returns.loc['2020-03-02':'2020-03-31']
+    compounded = (1 + window).prod() - 1
+    assert table.loc['March', 'all_a'] == pytest.approx(-compounded['A'] * 100)
+    assert table.loc['March', 'half'] == pytest.approx(-(compounded['A'] + compounded['B']) * 50)
+    assert table.loc['March', 'cash'] == 0
+
+def test_synthetic_shocks(returns, exposures):
+    """Test uniform and per-asset synthetic shocks"""
+    tester = StressTester(returns).add_shock('crash', -0.2).add_shock('a_only', {'A': -0.5})
+    table = tester.loss_table(exposures)
+
+    assert table.loc['crash'].tolist() == pytest.approx([20.0, 20.0, 0.0])
+    assert table.loc['a_only'].tolist() == pytest.approx([50.0, 25.0, 0.0])
+
+def test_uncovered_window_is_nan(returns, exposures):
+    """Test windows outside the data are reported as missing"""
+    tester = StressTester(returns).add_default_library()
+    table = tester.loss_table(exposures)
+
+    assert table.loc['2008 Financial Crisis'].isna().all()
+    assert table.loc['2020 COVID Crash'].notna().all()
+    assert table.loc['Equity -20%', 'all_a'] == pytest.approx(20.0)
+
+def test_tz_aware_returns_index(returns, exposures):
+    """Test naive scenario dates are matched against a tz-aware index"""
+    aware = returns.tz_localize('America/New_York')
+    tester = StressTester(aware).add_default_library().add_historical('March', '2020-03-02', '2020-03-31')
+    table = tester.loss_table(exposures)
+    naive = StressTester(returns).add_default_library().add_historical('March', '2020-03-02', '2020-03-31')
+
+    pd.testing.assert_frame_equal(table, naive.loss_table(exposures))
+    assert table.loc['2020 COVID Crash'].notna().all()
+    assert tester.worst_drawdown_table(exposures).loc['March'].notna().all()
+
+def test_worst_drawdown_inside_window(returns, exposures):
+    """Test the in-window worst point is at least the end-point loss"""
+    tester = StressTester(returns).add_historical('H2', '2020-07-01', '2020-12-31').add_shock('s', -0.1)
+    worst = tester.worst_drawdown_table(exposures)
+    end = tester.loss_table(exposures)
+
+    path = (1 + returns.loc['2020-07-01':, 'A']).cumprod() - 1
+    assert worst.loc['H2', 'all_a'] == pytest.approx(max(-path.min(), 0) * 100)
+    assert (worst.loc['H2'] >= end.loc['H2'] - 1e-9).all()
+    assert worst.loc['s', 'all_a'] == pytest.approx(10.0)
+
+def test_unknown_exposure_rejected(returns):
+    """Test exposures to assets without returns raise"""
+    with pytest.raises(ValueError):
+        StressTester(returns).add_shock('s', -0.1).loss_table(pd.Series({'ZZZ': 1.0}))
+
+def test_from_store(tmp_path, sample_stock_data):
+    """Test building the returns matrix from stored bars"""
+    store = PartitionedBarStore(str(tmp_path))
+    store.write('AAA', sample_stock_data)
+
+    tester = StressTester.from_store(store, ['AAA'])
+    expected = sample_stock_data['Close'].pct_change().iloc[1:].to_numpy()
+    np.testing.assert_allclose(tester.returns['AAA'].to_numpy(), expected)
+
+def test_exposures_from_results(sample_stock_data):
+    """Test the held fraction is recovered from value and price moves"""
+    data = sample_stock_data.copy()
+    shares, cash = 400, 50_000.0
+    data['Portfolio_Value'] = cash + shares * data['Close']
+
+    exposures = exposures_from_results({'AAA': {'data': data}})
+
+    last = data.iloc[-1]
+    assert exposures.loc['AAA', 'AAA'] == pytest.approx(shares * last['Close'] / last['Portfolio_Value'])
+
+def test_exposures_from_position_column(sample_stock_data):
+    """Test the strategy's share count gives the exposure even with a trade on the last bar"""
+    data = sample_stock_data.copy()
+    data['Position'] = 0
+    data.loc[data.index[-1], 'Position'] = 300
+    cash = 100_000 - 300 * data['Close'].iloc[-1]
+    data['Portfolio_Value'] = 100_000.0
+    data.loc[data.index[-1], 'Portfolio_Value'] = cash + 300 * data['Close'].iloc[-1]
+
+    exposures = exposures_from_results({'AAA': {'data': data}})
+
+    assert exposures.loc['AAA', 'AAA'] == pytest.approx(300 * data['Close'].iloc[-1] / 100_000)
@@ -0,0 +1,86 @@
+import pytest
+import pandas as pd
+import numpy as np
+from src.risk_metrics import calculate_risk_metrics
+from src.universe_risk import UniverseRiskAnalyzer, returns_matrix
+
+@pytest.fixture
+def universe():
+    """One-factor returns for a small universe plus the factor as benchmark"""
+    rng = np.random.default_rng(11)
+    factor = rng.normal(0.0004, 0.01, 500)
+    returns = pd.DataFrame(rng.normal(0, 0.015, (500, 6)) + np.outer(factor, np.linspace(0.2, 1.5, 6)),
+                           columns=[f'S{i}' for i in range(6)])
+    returns['BENCH'] = factor
+    return returns
+
+def reference_ledoit_wolf(x):
+    """Textbook Ledoit-Wolf shrinkage (maximum-likelihood scale)"""
+    n, p = x.shape
+    x = x - x.mean(axis=0)
+    sample = x.T @ x / n
+    mu = np.trace(sample) / p
+    d2 = np.sum((sample - mu * np.eye(p)) ** 2) / p
+    b2 = sum(np.sum((np.outer(row, row) - sample) ** 2) for row in x) / n ** 2 / p
+    intensity = min(b2, d2) / d2
+    return intensity, intensity * mu * np.eye(p) + (1 - intensity) * sample
+
+def test_risk_metrics_match_single_series(universe):
+    """Test each row equals the per-symbol risk metrics"""
+    table = UniverseRiskAnalyzer(universe, symbol_block=4).risk_metrics()
+
+    for symbol in universe.columns:
+        expected = calculate_risk_metrics(universe[symbol])
+        np.testing.assert_allclose(table.loc[symbol].to_numpy(), list(expected.values()), rtol=1e-10)
+
+def test_benchmark_statistics(universe):
+    """Test beta and correlation against the benchmark column"""
+    stats = UniverseRiskAnalyzer(universe).benchmark_statistics('BENCH')
+    bench = universe['BENCH']
+
+    for symbol in universe.columns:
+        beta = np.cov(universe[symbol], bench)[0, 1] / bench.var()
+        assert stats.loc[symbol, 'Beta'] == pytest.approx(beta)
+        assert stats.loc[symbol, 'Correlation'] == pytest.approx(universe[symbol].corr(bench))
+    assert stats.loc['BENCH', 'Beta'] == pytest.approx(1.0)
+
+def test_sample_covariance(universe):
+    """Test the unshrunk covariance equals the sample covariance"""
+    cov = UniverseRiskAnalyzer(universe).covariance(shrinkage=None)
+    np.testing.assert_allclose(cov.to_numpy(), universe.cov().to_numpy(), rtol=1e-10)
+
+def test_ledoit_wolf_shrinkage(universe):
+    """Test the blocked estimator against the textbook formula"""
+    analyzer = UniverseRiskAnalyzer(universe)
+    intensity, expected = reference_ledoit_wolf(universe.to_numpy())
+    n = len(universe)
+
+    assert analyzer.shrinkage_intensity() == pytest.approx(intensity)
+    np.testing.assert_allclose(analyzer.covariance().to_numpy(), expected * n / (n - 1), rtol=1e-10)
+
+    corr = analyzer.correlation()
+    np.testing.assert_allclose(np.diag(corr), 1.0)
+    assert (np.abs(corr.to_numpy()) <= 1 + 1e-12).all()
+
+def test_full_shrinkage_is_scaled_identity(universe):
+    """Test intensity 1 leaves only the average variance on the diagonal"""
+    cov = UniverseRiskAnalyzer(universe).covariance(shrinkage=1.0).to_numpy()
+    assert np.count_nonzero(cov - np.diag(np.diag(cov))) == 0
+    assert np.diag(cov) == pytest.approx(universe.var().mean())
+
+def test_missing_values_rejected(universe):
+    """Test unaligned matrices are refused"""
+    universe.iloc[3, 2] = np.nan
+    with pytest.raises(ValueError):
+        UniverseRiskAnalyzer(universe)
+
+def test_returns_matrix_from_backtests(sample_stock_data):
+    """Test building the matrix from run_multiple_symbols style results"""
+    first = sample_stock_data.assign(Portfolio_Value=np.linspace(100, 120, len(sample_stock_data)))
+    second = first.iloc[10:].assign(Portfolio_Value=lambda df: df['Portfolio_Value'] * 2)
+
+    matrix = returns_matrix({'A': {'data': first}, 'B': {'data': second}})
+
+    assert list(matrix.columns) == ['A', 'B']
+    assert len(matrix) == len(second) - 1
+    assert not matrix.isna().any().any()
@@ -95,6 +95,39 @@ def test_interactive_dashboard_creation(sample_stock_data, mocker):
             # If mocking doesn't work perfectly, just ensure no critical errors
             pass
 
+def test_interactive_trade_and_volume_panels(sample_stock_data):
+    """Test the trade and volume panels use one trace per category regardless of the trade count"""
+    data = sample_stock_data.copy()
+    data['SMA_Short'] = data['Close'].rolling(20).mean()
+    data['SMA_Long'] = data['Close'].rolling(50).mean()
+    data['Portfolio_Value'] = 100000 * data['Close'] / data['Close'].iloc[0]
+    metrics = {'Total Return (%)': 10.5, 'Annual Return (%)': 11.0, 'Sharpe Ratio': 1.2,
+               'Max Drawdown (%)': -5.2, 'Final Portfolio Value': 110500}
+    viz = InteractiveVisualizer()
+
+    trace_counts = []
+    for every in (100, 2):
+        data['Signal'] = 0
+        data.loc[::every, 'Signal'] = 1
+        data.loc[every // 2::every, 'Signal'] = -1
+        fig = viz.build_interactive_dashboard(data, 'TEST', metrics)
+        trace_counts.append(len(fig.data))
+
+        buys = next(trace for trace in fig.data if trace.name == 'Buy Trades')
+        sells = next(trace for trace in fig.data if trace.name == 'Sell Trades')
+        assert len(buys.x) == (data['Signal'] == 1).sum()
+        assert len(sells.x) == (data['Signal'] == -1).sum()
+        np.testing.assert_allclose(buys.y, data.loc[data['Signal'] == 1, 'Portfolio_Value'])
+        assert len(fig.layout.annotations) == 8  # subplot titles and the metrics box
+
+    assert trace_counts[0] == trace_counts[1]
+    up = next(trace for trace in fig.data if trace.name == 'Volume (Up)')
+    down = next(trace for trace in fig.data if trace.name == 'Volume (Down)')
+    assert len(up.x) + len(down.x) == len(data)
+    assert len(up.x) == (data['Close'].pct_change() > 0).sum()
+    # Up and down bars share each date's slot instead of being grouped side by side
+    assert fig.layout.barmode == 'overlay'
+
 def test_risk_analyzer_initialization():
     """Test RiskAnalyzer initialization"""
     risk_analyzer = RiskAnalyzer()